@@ -5,14 +5,20 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import json
 import logging
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 from app.base.base_account import Account
 from app.base.base_connector import Connector
 from app.base.base_strategy import Strategy
+from app.base.base_symbol import Symbol
+from app.base.base_trade import Trade
 from app.common.config.constants import TRADE_STATUS_OPEN
 from app.common.config.paths import LOG_PATH, HEARTBEAT_PATH
 from app.common.models.model_connector import ConnectorConfig
+from app.common.models.model_strategy import AssetConfig
 from app.common.services.platform_time import PlatformTime
 from app.common.services.logger import setup_logger
 from app.common.services.dashboard_manager import DashboardManager
@@ -40,10 +46,13 @@ class BaseEngine(ABC):
         dashboard_manager: DashboardManager,
         news_manager: NewsManager,
         vix_manager: VixManager,
-        notify_manager: PushoverManager,
+        notify_manager: Optional[PushoverManager],
         risk_manager: Optional[RiskManager] = None,
         sync_manager: Optional[SyncManager] = None,
         deal_archive_manager: Optional[DealArchiveManager] = None,
+        heartbeat_path: Path = HEARTBEAT_PATH,
+        hosted: bool = False,
+        evaluation_workers: int = 0,
     ) -> None:
         """Initialize the engine with a list of strategies and a state manager."""
         self.connector: Connector = connector
@@ -56,24 +65,66 @@ class BaseEngine(ABC):
         self.news_manager: NewsManager = news_manager
         self.vix_manager: VixManager = vix_manager
         self.risk_manager: Optional[RiskManager] = risk_manager
-        self.notify_manager: PushoverManager = notify_manager
+        self.notify_manager: Optional[PushoverManager] = notify_manager
         self.sync_manager: Optional[SyncManager] = sync_manager
         self.deal_archive_manager: Optional[DealArchiveManager] = deal_archive_manager
         self.last_logged_event_ts: int = 0
+        self.heartbeat_path: Path = heartbeat_path
+        # A hosted engine is one account stack of an EngineHost: the host
+        # refreshes the shared news/VIX data and rolls the log file, not it.
+        self.hosted: bool = hosted
+        self.stop_event = threading.Event()
+        # Above one worker, each cycle evaluates its (strategy, asset) pairs
+        # concurrently on that many threads instead of one after another.
+        self.evaluation_pool: Optional[ThreadPoolExecutor] = (
+            ThreadPoolExecutor(max_workers=evaluation_workers, thread_name_prefix="evaluation")
+            if evaluation_workers > 1
+            else None
+        )
+        # Orders, closes and SL/TP changes on one symbol never overlap, even
+        # when two strategies trade it; different symbols go in parallel.
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._symbol_locks_guard = threading.Lock()
 
     def initialize(self) -> None:
         """Call the initialize method on all strategies."""
         logger.info("Initializing strategies...")
+        self._prepare_symbols()
         for strategy in self.strategies:
             strategy.initialize()
         logger.info("All strategies initialized.")
 
     def shutdown(self) -> None:
         """Finalize all strategies and perform shutdown procedures."""
+        if self.evaluation_pool is not None:
+            self.evaluation_pool.shutdown(wait=True)
         for strategy in self.strategies:
             strategy.finalize()
+        for trader in self._get_traders():
+            trader.close()
+        self.state_manager.close()
         logger.info("Trading system shutdown complete.")
 
+    def stop(self) -> None:
+        """Ask the run loop to finish its current cycle and shut down; used by EngineHost."""
+        self.stop_event.set()
+
+    def _prepare_symbols(self) -> None:
+        """Hand each symbol service every asset symbol of the strategies using it, in one call."""
+        symbols_by_service: Dict[int, Tuple[Symbol, List[str]]] = {}
+        for strategy in self.strategies:
+            if strategy.symbol is None:
+                continue
+            _, names = symbols_by_service.setdefault(id(strategy.symbol), (strategy.symbol, []))
+            names.extend(asset.symbol for asset in strategy.assets)
+        for service, names in symbols_by_service.values():
+            service.prepare_symbols(list(dict.fromkeys(names)))
+
+    def _get_traders(self) -> List[Trade]:
+        """Return each distinct trade connector used by the strategies, in strategy order."""
+        # Strategies usually share one trade connector; it is returned only once.
+        return list({id(s.trade): s.trade for s in self.strategies if s.trade is not None}.values())
+
     def _run_strategies(self) -> None:
         """Execute all strategies and manage trades."""
         if self.today != PlatformTime.now().day:
@@ -84,7 +135,7 @@ class BaseEngine(ABC):
             begin_balance = self.state_manager.get_begin_balance()
             weekly_profit_reached = self.state_manager.get_weekly_profit_reached()
             if weekly_profit_reached:
-                self.notify_manager.send_notification(
+                self._notify(
                     f"Weekly profit reached: {weekly_profit_reached}. No more trades for the week.",
                     "Weekly Target Hit",
                     1,
@@ -93,10 +144,11 @@ class BaseEngine(ABC):
             if PlatformTime.now().weekday() == 0 or begin_balance_week == begin_balance:
                 self.state_manager.save_begin_balances_week()
                 begin_balance_week = self.state_manager.get_begin_balance_week()
-                self.notify_manager.send_notification(
+                self._notify(
                     f"New trading week begins with begin balance of {begin_balance_week}", "New Week"
                 )
-            setup_logger(LOG_PATH, self.connector_config.environment)
+            if not self.hosted:
+                setup_logger(LOG_PATH, self.connector_config.environment)
 
         event = self.news_manager.get_releasing_event()
         if event and event.timestamp != self.last_logged_event_ts:
@@ -104,62 +156,91 @@ class BaseEngine(ABC):
             logger.info(f"Current news event: {event}")
             self.last_logged_event_ts = event.timestamp
 
+        pairs: List[Tuple[Strategy, AssetConfig]] = []
         for strategy in self.strategies:
             if strategy.is_holiday() or not strategy.is_market_open():
                 continue
 
             strategy.set_range()
-
-            for asset in strategy.assets:
+            pairs.extend((strategy, asset) for asset in strategy.assets)
+
+        if self.evaluation_pool is None:
+            for strategy, asset in pairs:
+                self._evaluate_asset(strategy, asset)
+        else:
+            # The cycle ends when its slowest asset does, not after all of them in turn.
+            futures = [self.evaluation_pool.submit(self._evaluate_asset, strategy, asset) for strategy, asset in pairs]
+            for future in futures:
                 try:
-                    direction = strategy.is_entry_signal(asset)
-                except Exception as e:
-                    logger.warning(f"Skipping asset {asset.symbol} due to signal error: {e}")
-                    continue
-
-                if direction:
-                    try:
-                        order = strategy.prepare_order(asset, direction)
-                    except Exception as e:
-                        continue
-
-                    try:
-                        if strategy.is_entry_allowed(asset, order):
-                            strategy.execute_entry(order)
-                    except Exception as error:
-                        logger.warning(f"Failed to open trade for {asset.symbol}: {error}")
+                    future.result()
+                except Exception as error:
+                    logger.warning(f"Asset evaluation failed: {error}")
 
-                try:
-                    for trade in self.state_manager.get_open_trades(
-                        symbol=asset.symbol,
-                        strategy=strategy.strategy_name
-                    ):
-                        if strategy.is_exit_signal(trade, asset) and strategy.is_exit_allowed(trade):
+        self.today = PlatformTime.now().day
+
+    def _evaluate_asset(self, strategy: Strategy, asset: AssetConfig) -> None:
+        """Check one asset's entry signal, then its open trades' exits and SL/TP management."""
+        try:
+            direction = strategy.is_entry_signal(asset)
+        except Exception as e:
+            logger.warning(f"Skipping asset {asset.symbol} due to signal error: {e}")
+            return
+
+        if direction:
+            try:
+                order = strategy.prepare_order(asset, direction)
+            except Exception as e:
+                return
+
+            try:
+                with self._get_symbol_lock(asset.symbol):
+                    if strategy.is_entry_allowed(asset, order):
+                        strategy.execute_entry(order)
+            except Exception as error:
+                logger.warning(f"Failed to open trade for {asset.symbol}: {error}")
+
+        try:
+            with self._get_symbol_lock(asset.symbol):
+                for trade in self.state_manager.get_open_trades(
+                    symbol=asset.symbol,
+                    strategy=strategy.strategy_name
+                ):
+                    if strategy.is_exit_signal(trade, asset) and strategy.is_exit_allowed(trade):
+                        try:
+                            strategy.execute_exit(trade, stopped=False)
+                        except Exception as error:
+                            logger.warning(f"Failed to close trade {trade.id}: {error}")
+
+                    has_sl = trade.stop_loss is not None and trade.stop_loss > 0
+                    has_tp = trade.take_profit is not None and trade.take_profit > 0
+                    if has_sl or has_tp:
+                        if strategy.is_sl_tp_hit(trade) and strategy.is_exit_allowed(trade):
                             try:
-                                strategy.execute_exit(trade, stopped=False)
+                                strategy.execute_exit(trade, stopped=True)
                             except Exception as error:
                                 logger.warning(f"Failed to close trade {trade.id}: {error}")
 
-                        has_sl = trade.stop_loss is not None and trade.stop_loss > 0
-                        has_tp = trade.take_profit is not None and trade.take_profit > 0
-                        if has_sl or has_tp:
-                            if strategy.is_sl_tp_hit(trade) and strategy.is_exit_allowed(trade):
-                                try:
-                                    strategy.execute_exit(trade, stopped=True)
-                                except Exception as error:
-                                    logger.warning(f"Failed to close trade {trade.id}: {error}")
+                    if trade.status == TRADE_STATUS_OPEN:
+                        try:
+                            strategy.manage_entry(trade)
+                        except Exception as error:
+                            logger.warning(f"Failed to manage trade {trade.id}: {error}")
 
-                        if trade.status == TRADE_STATUS_OPEN:
-                            try:
-                                strategy.manage_entry(trade)
-                            except Exception as error:
-                                logger.warning(f"Failed to manage trade {trade.id}: {error}")
+                self.state_manager.clean_old_closed_trades()
+        except Exception as e:
+            logger.warning(f"Error checking exits for {asset.symbol}: {e}")
 
-                    self.state_manager.clean_old_closed_trades()
-                except Exception as e:
-                    logger.warning(f"Error checking exits for {asset.symbol}: {e}")
+    def _notify(self, message: str, title: str, priority: Optional[int] = None) -> None:
+        # Backtests run without a notify manager.
+        if self.notify_manager is not None:
+            self.notify_manager.send_notification(message, title, priority)
 
-        self.today = PlatformTime.now().day
+    def _get_symbol_lock(self, symbol: str) -> threading.Lock:
+        with self._symbol_locks_guard:
+            lock = self._symbol_locks.get(symbol)
+            if lock is None:
+                lock = self._symbol_locks[symbol] = threading.Lock()
+            return lock
 
     def _update_and_check_profit_targets(self, timestamp: int, last_update_timestamp: int) -> int:
         """Update daily profit if the interval has elapsed since last update."""
@@ -195,7 +276,7 @@ class BaseEngine(ABC):
                 break_even_reached = equity - begin_balance >= account_break_even if account_risk_enabled else False
                 if break_even_reached:
                     self.risk_manager.stop_loss = account_profit_level
-                    self.notify_manager.send_notification(
+                    self._notify(
                         "Break-even level reached. Adjusting account stop loss.", "Break-Even Hit"
                     )
                     logger.info("Break-even level reached. Adjusting account stop loss.")
@@ -205,7 +286,7 @@ class BaseEngine(ABC):
                     equity - begin_balance_week >= account_take_profit_week if account_risk_enabled else False
                 )
                 if weekly_profit_reached:
-                    self.notify_manager.send_notification(
+                    self._notify(
                         f"Weekly profit reached: {weekly_profit_reached}. No more trades for the week.",
                         "Weekly Target Hit",
                         1,
@@ -216,7 +297,7 @@ class BaseEngine(ABC):
                 target_reached = take_profit_reached or stop_loss_reached or weekly_profit_reached
                 if target_reached:
                     logger.info(f"Daily profit reached: {target_reached}. Trading will resume next trading day.")
-                    self.notify_manager.send_notification(
+                    self._notify(
                         f"Daily profit reached: {target_reached}. Trading will resume next trading day.",
                         "Daily Target Hit",
                         1,
@@ -262,8 +343,8 @@ class BaseEngine(ABC):
                 "account_id": self.connector_config.account_id or self.connector_config.login,
                 "environment": self.connector_config.environment,
             }
-            HEARTBEAT_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(HEARTBEAT_PATH, "w", encoding="utf-8") as f:
+            self.heartbeat_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.heartbeat_path, "w", encoding="utf-8") as f:
                 json.dump(heartbeat, f, indent=4)
         except Exception as error:
             logger.warning(f"Failed to write heartbeat: {error}")
@@ -5,11 +5,12 @@ from __future__ import annotations
 import logging
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from app.base.base_symbol import Symbol
 from app.base.base_account import Account
 from app.base.base_trade import Trade
+from app.base.base_tester_trade import TesterTrade
 from app.common.services.calculator import Calculator
 from app.base.base_connector import Connector
 
@@ -22,6 +23,7 @@ from app.common.services.news_manager import NewsManager
 from app.common.services.risk_manager import RiskManager
 from app.common.services.vix_manager import VixManager
 from app.common.services.pushover_manager import PushoverManager
+from app.common.services.signal_feed_reader import SignalFeedReader
 from app.common.config.constants import (
     TRADE_DIRECTION_BUY,
     TRADE_DIRECTION_SELL,
@@ -30,6 +32,11 @@ from app.common.config.constants import (
 from app.factories.factory_traderecord import get_trade_record
 from app.factories.factory_orderrequest import get_order_request
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from app.connectors.mt5tester.mt5tester_bars import SymbolBars
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,6 +58,7 @@ class Strategy(ABC):
         self.risk_manager: Optional[RiskManager] = None
         self.vix_manager: Optional[VixManager] = None
         self.notify_manager: Optional[PushoverManager] = None
+        self.signal_feed_reader: Optional[SignalFeedReader] = None
 
     def attach_services(
         self,
@@ -65,6 +73,7 @@ class Strategy(ABC):
         risk_manager: RiskManager,
         vix_manager: VixManager,
         notify_manager: PushoverManager,
+        signal_feed_reader: Optional[SignalFeedReader] = None,
     ) -> None:
         """Attach external services required for strategy execution."""
         self.connector = connector
@@ -77,6 +86,7 @@ class Strategy(ABC):
         self.risk_manager = risk_manager
         self.vix_manager = vix_manager
         self.notify_manager = notify_manager
+        self.signal_feed_reader = signal_feed_reader or SignalFeedReader()
 
     def set_holidays(self, holidays: list[str]) -> None:
         """Set the list of holiday dates (ISO format) to avoid trading."""
@@ -119,6 +129,20 @@ class Strategy(ABC):
         """
         return None
 
+    def get_entry_candidates(
+        self,
+        bar_epochs: np.ndarray,
+        get_bars: Callable[[str], Optional[SymbolBars]],
+    ) -> Optional[np.ndarray]:
+        """Optional backtest hook: return a bool mask over `bar_epochs` of where is_entry_signal could fire."""
+        # `bar_epochs` are the backtest's timestamps on the platform wall clock
+        # the bars are stored on. The mask may over-approximate (state such as
+        # max trades or profit targets is not known up front) but must never
+        # miss a bar where the signal fires, or the pre-evaluated run would
+        # diverge from the bar-by-bar one. None means "no vectorized signal",
+        # which keeps the engine evaluating every bar.
+        return None
+
     def prepare_order(self, asset: AssetConfig, direction: str) -> OrderRequest:
         """Build an order request with calculated lot size based on strategy rules."""
         return get_order_request(
@@ -137,33 +161,30 @@ class Strategy(ABC):
             return False
 
         direction = order.direction
-        today = PlatformTime.now().date()
-
-        trades_today = [
-            t for t in self.state_manager.get_all_trades()
-            if t.symbol == asset.symbol
-            and t.strategy == self.strategy_name
-            and PlatformTime.parse_platform_timestamp(t.timestamp).date() == today
-        ]
 
         if asset.max_total_trades is not None:
-            if len(trades_today) >= asset.max_total_trades:
+            trades_today = self.state_manager.count_trades_today(strategy=self.strategy_name, symbol=asset.symbol)
+            if trades_today >= asset.max_total_trades:
                 return False
 
         if direction == TRADE_DIRECTION_BUY:
             if asset.max_buy_trades == 0:
                 return False
             if asset.max_buy_trades is not None:
-                buy_trades = [t for t in trades_today if t.type == TRADE_DIRECTION_BUY]
-                if len(buy_trades) >= asset.max_buy_trades:
+                buy_trades = self.state_manager.count_trades_today(
+                    strategy=self.strategy_name, symbol=asset.symbol, trade_type=TRADE_DIRECTION_BUY
+                )
+                if buy_trades >= asset.max_buy_trades:
                     return False
 
         elif direction == TRADE_DIRECTION_SELL:
             if asset.max_sell_trades == 0:
                 return False
             if asset.max_sell_trades is not None:
-                sell_trades = [t for t in trades_today if t.type == TRADE_DIRECTION_SELL]
-                if len(sell_trades) >= asset.max_sell_trades:
+                sell_trades = self.state_manager.count_trades_today(
+                    strategy=self.strategy_name, symbol=asset.symbol, trade_type=TRADE_DIRECTION_SELL
+                )
+                if sell_trades >= asset.max_sell_trades:
                     return False
 
         else:
@@ -203,7 +224,7 @@ class Strategy(ABC):
                 f"New Trade Opened: {trade.type.capitalize()} {trade.symbol} at {trade.entry_price}. "
                 f"Strategy: {self.strategy_display_name}"
             )
-            self.notify_manager.send_notification(message, "Open Trade")
+            self._notify(message, "Open Trade")
             logger.info(message)
 
     def set_range(self) -> None:
@@ -218,8 +239,12 @@ class Strategy(ABC):
 
         if stopped:
             trade.comment = "SL/TP hit"
-            trade.exit_price = trade.stop_loss
-            trade.comment = "Stopped out"
+            if isinstance(self.trade, TesterTrade) and self.trade.simulates_sl_tp_fills:
+                # The connector already closed at the simulated fill and labelled it.
+                trade.comment = result.comment
+            else:
+                trade.exit_price = trade.stop_loss
+                trade.comment = "Stopped out"
         else:
             trade.comment = "Closed by signal"
 
@@ -228,15 +253,28 @@ class Strategy(ABC):
             f"Trade Closed: {trade.type.capitalize()} {trade.symbol} closed at "
             f"{trade.exit_price} Comment: {trade.comment}"
         )
-        self.notify_manager.send_notification(message, "Close Trade")
+        self._notify(message, "Close Trade")
         logger.info(message)
 
+    def _notify(self, message: str, title: str) -> None:
+        # Backtests run without a notify manager.
+        if self.notify_manager is not None:
+            self.notify_manager.send_notification(message, title)
+
     def manage_entry(self, trade: TradeRecord) -> None:
         """Strategy-level trade management hook."""
         changed = self.trade.modify_position(trade)
         if changed:
             self.state_manager.add_trade(trade)
 
+    def get_checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        """Return the strategy's internal state for a backtest checkpoint, or None if it keeps none."""
+        return None
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        """Restore internal state returned by get_checkpoint_state when a backtest resumes."""
+        pass
+
     def finalize(self) -> None:
         """Hook for cleanup or final adjustments before shutdown."""
         pass
@@ -271,6 +309,9 @@ class Strategy(ABC):
         if trade.status != TRADE_STATUS_OPEN:
             return False
 
+        if isinstance(self.trade, TesterTrade) and self.trade.simulates_sl_tp_fills:
+            return self.trade.get_sl_tp_fill(trade) is not None
+
         ask = self.symbol.get_ask_price(trade.symbol)
         bid = self.symbol.get_bid_price(trade.symbol)
 
@@ -2,7 +2,7 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List
 from app.common.models.model_symbol import Range
 from app.common.config.constants import TIMEFRAME_M1
 
@@ -29,6 +29,10 @@ class Symbol(ABC):
         """Prepare the symbol for trading (e.g., subscribe or enable it)."""
         pass
 
+    def prepare_symbols(self, symbols: List[str]) -> None:
+        """Load everything the given symbols need in bulk before strategies initialize; a no-op by default."""
+        pass
+
     @abstractmethod
     def get_symbol_info(self, symbol: str) -> Any:
         """Retrieve detailed symbol metadata from the broker or platform."""
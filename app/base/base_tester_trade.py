@@ -0,0 +1,28 @@
+"""Backtest-only hooks a simulated trade connector adds on top of the Trade interface."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from app.common.models.model_trade import SlTpFill, TradeRecord
+
+
+class TesterTrade(ABC):
+    """Mixin for backtest trade connectors: simulated SL/TP fills and checkpoint state."""
+    # True when SL/TP fills are simulated from bar data; live brokers fill
+    # stops server-side and never carry this mixin.
+    simulates_sl_tp_fills: bool = False
+
+    @abstractmethod
+    def get_sl_tp_fill(self, trade: TradeRecord) -> Optional[SlTpFill]:
+        """Return the simulated SL/TP fill of an open trade, or None if neither level was reached."""
+        pass
+
+    @abstractmethod
+    def get_checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        """Return connector state a backtest checkpoint must carry, or None if there is none."""
+        pass
+
+    @abstractmethod
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        """Restore state returned by get_checkpoint_state when a backtest resumes."""
+        pass
@@ -23,3 +23,7 @@ class Trade(ABC):
     def modify_position(self, trade: TradeRecord) -> bool:
         """Modifies an open trade using data from TradeRecord (symbol, lot_size, direction, ticket)."""
         pass
+
+    def close(self) -> None:
+        """Flush and release anything the connector holds open; called once at engine shutdown."""
+        pass
@@ -23,6 +23,9 @@ TRADE_CLOSURE_SIGNAL = "signal"
 ENVIRONMENT_DEVELOPMENT = "development"
 ENVIRONMENT_PRODUCTION = "production"
 
+# environment label the backtest engine reports in place of the platform's
+MODE_BACKTEST = "backtest"
+
 # Timeframes
 TIMEFRAME_M1 = "M1"
 TIMEFRAME_M5 = "M5"
@@ -36,6 +39,32 @@ TIMEFRAME_D1 = "D1"
 POSITIONING_RISK = "risk"
 POSITIONING_CAPITAL = "capital"
 
+# state persistence backends
+STATE_BACKEND_JSON = "json"
+STATE_BACKEND_JOURNAL = "journal"
+STATE_BACKEND_SQLITE = "sqlite"
+
+# seconds SQLite waits for a lock to clear before raising "database is locked" —
+# relevant now that multiple instances (MT5, cTrader) can write to the same shared file
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
+# parameter sweep sampling modes
+SWEEP_MODE_GRID = "grid"
+SWEEP_MODE_RANDOM = "random"
+
+# which level the backtest fill simulator takes when one bar's range spans both SL and TP
+SAME_BAR_FILL_STOP_FIRST = "stop_first"
+SAME_BAR_FILL_TARGET_FIRST = "target_first"
+SAME_BAR_FILL_NEAREST_OPEN = "nearest_open"
+
+# backtest result file formats; parquet and arrow need pyarrow
+RESULT_FORMAT_CSV = "csv"
+RESULT_FORMAT_PARQUET = "parquet"
+RESULT_FORMAT_ARROW = "arrow"
+
+# wall-clock seconds between progress saves of the backtest summary file
+SUMMARY_SAVE_INTERVAL_SECONDS = 30
+
 # account info retry
 RETRY_COUNT = 3
 RETRY_DELAY_SECONDS = 1.0
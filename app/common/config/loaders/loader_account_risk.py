@@ -2,13 +2,14 @@
 
 import yaml
 from pathlib import Path
+from typing import Optional
 from app.common.models.model_account import AccountRisk
 from app.common.config.paths import ACCOUNT_RISK_PATH
 
 
-def load_account_risk() -> AccountRisk:
-    """Load global account risk settings."""
-    path = Path(ACCOUNT_RISK_PATH)
+def load_account_risk(risk_path: Optional[Path] = None) -> AccountRisk:
+    """Load account risk settings from the global file, or from `risk_path` for one account of an engine host."""
+    path = Path(risk_path or ACCOUNT_RISK_PATH)
     if not path.exists():
         raise FileNotFoundError("Account risk file not found.")
 
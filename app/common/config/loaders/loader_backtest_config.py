@@ -1,9 +1,44 @@
+import logging
 import os
+
+from app.common.config.constants import (
+    SAME_BAR_FILL_STOP_FIRST,
+    SAME_BAR_FILL_TARGET_FIRST,
+    SAME_BAR_FILL_NEAREST_OPEN,
+    RESULT_FORMAT_CSV,
+    RESULT_FORMAT_PARQUET,
+    RESULT_FORMAT_ARROW,
+)
 from app.common.models.model_backtest import BacktestConfig
 
+logger = logging.getLogger(__name__)
+
+SUPPORTED_SAME_BAR_FILLS = (SAME_BAR_FILL_STOP_FIRST, SAME_BAR_FILL_TARGET_FIRST, SAME_BAR_FILL_NEAREST_OPEN)
+SUPPORTED_RESULT_FORMATS = (RESULT_FORMAT_CSV, RESULT_FORMAT_PARQUET, RESULT_FORMAT_ARROW)
+
+
 def str_to_bool(value: str) -> bool:
     return value.lower() in ("1", "true", "yes", "on")
 
+
+def load_same_bar_fill() -> str:
+    """Reads BACKTEST_SAME_BAR_FILL from .env, falling back to stop-first if unset or unknown."""
+    policy = (os.getenv("BACKTEST_SAME_BAR_FILL", SAME_BAR_FILL_STOP_FIRST) or SAME_BAR_FILL_STOP_FIRST).lower()
+    if policy not in SUPPORTED_SAME_BAR_FILLS:
+        logger.warning(f"Unknown BACKTEST_SAME_BAR_FILL '{policy}'. Using default '{SAME_BAR_FILL_STOP_FIRST}'.")
+        policy = SAME_BAR_FILL_STOP_FIRST
+    return policy
+
+
+def load_result_format() -> str:
+    """Reads BACKTEST_RESULT_FORMAT from .env, falling back to CSV if unset or unknown."""
+    result_format = (os.getenv("BACKTEST_RESULT_FORMAT", RESULT_FORMAT_CSV) or RESULT_FORMAT_CSV).lower()
+    if result_format not in SUPPORTED_RESULT_FORMATS:
+        logger.warning(f"Unknown BACKTEST_RESULT_FORMAT '{result_format}'. Using default '{RESULT_FORMAT_CSV}'.")
+        result_format = RESULT_FORMAT_CSV
+    return result_format
+
+
 def load_backtest_config() -> BacktestConfig:
     return BacktestConfig(
         backtest_deposit=float(os.getenv("BACKTEST_DEPOSIT", "100000")),
@@ -16,4 +51,12 @@ def load_backtest_config() -> BacktestConfig:
         backtest_slippage_per_lot=int(os.getenv("BACKTEST_SLIPPAGE_PER_LOT", "10")),
         backtest_terminal_output=str_to_bool(os.getenv("BACKTEST_TERMINAL_OUTPUT", "false")),
         backtest_persist=str_to_bool(os.getenv("BACKTEST_PERSIST", "false")),
+        backtest_warmup_days=int(os.getenv("BACKTEST_WARMUP_DAYS", "5")),
+        backtest_skip_inactive=str_to_bool(os.getenv("BACKTEST_SKIP_INACTIVE", "true")),
+        backtest_signal_prefilter=str_to_bool(os.getenv("BACKTEST_SIGNAL_PREFILTER", "true")),
+        backtest_intrabar_fills=str_to_bool(os.getenv("BACKTEST_INTRABAR_FILLS", "true")),
+        backtest_same_bar_fill=load_same_bar_fill(),
+        backtest_result_format=load_result_format(),
+        backtest_result_flush_rows=int(os.getenv("BACKTEST_RESULT_FLUSH_ROWS", "500")),
+        backtest_checkpoint_seconds=int(os.getenv("BACKTEST_CHECKPOINT_SECONDS", "600")),
     )
@@ -1,6 +1,8 @@
 """Loads platform connector configuration (credentials, server, environment) from environment variables."""
 
 import os
+from typing import Mapping, Optional
+
 from app.common.models.model_connector import ConnectorConfig
 from app.common.config.constants import ENVIRONMENT_DEVELOPMENT
 
@@ -9,22 +11,24 @@ def str_to_bool(value: str) -> bool:
     return value.lower() in ("1", "true", "yes", "on")
 
 
-def load_connector_config() -> ConnectorConfig:
-    platform_type = (os.getenv("PLATFORM_TYPE", "") or "").lower()
-    environment = (os.getenv("PLATFORM_ENVIRONMENT", ENVIRONMENT_DEVELOPMENT) or ENVIRONMENT_DEVELOPMENT).lower()
+def load_connector_config(env: Optional[Mapping[str, str]] = None) -> ConnectorConfig:
+    """Reads the connector settings from .env, or from `env` (one account of an engine host)."""
+    env = os.environ if env is None else env
+    platform_type = (env.get("PLATFORM_TYPE", "") or "").lower()
+    environment = (env.get("PLATFORM_ENVIRONMENT", ENVIRONMENT_DEVELOPMENT) or ENVIRONMENT_DEVELOPMENT).lower()
 
     return ConnectorConfig(
         type=platform_type,
         environment=environment,
-        server=os.getenv("PLATFORM_SERVER", ""),
-        timezone=os.getenv("PLATFORM_TIMEZONE", ""),
-        offset=int(os.getenv("PLATFORM_TIME_OFFSET", "0")),
-        login=int(os.getenv("MT5_LOGIN", "0")),
-        password=os.getenv("MT5_PASSWORD"),
-        terminal_path=os.getenv("MT5_TERMINAL_PATH"),
-        api_key=os.getenv("CTRADER_API_KEY"),
-        account_id=os.getenv("CTRADER_ACCOUNT_ID"),
-        client_id=os.getenv("CTRADER_CLIENT_ID"),
-        client_secret=os.getenv("CTRADER_CLIENT_SECRET"),
-        refresh_token=os.getenv("CTRADER_REFRESH_TOKEN"),
+        server=env.get("PLATFORM_SERVER", ""),
+        timezone=env.get("PLATFORM_TIMEZONE", ""),
+        offset=int(env.get("PLATFORM_TIME_OFFSET", "0")),
+        login=int(env.get("MT5_LOGIN", "0")),
+        password=env.get("MT5_PASSWORD"),
+        terminal_path=env.get("MT5_TERMINAL_PATH"),
+        api_key=env.get("CTRADER_API_KEY"),
+        account_id=env.get("CTRADER_ACCOUNT_ID"),
+        client_id=env.get("CTRADER_CLIENT_ID"),
+        client_secret=env.get("CTRADER_CLIENT_SECRET"),
+        refresh_token=env.get("CTRADER_REFRESH_TOKEN"),
     )
@@ -0,0 +1,19 @@
+"""Loads engine cycle configuration from environment variables."""
+
+import logging
+import os
+
+from app.common.models.model_engine import EngineConfig
+
+logger = logging.getLogger(__name__)
+
+
+def load_engine_config() -> EngineConfig:
+    """Reads ENGINE_EVALUATION_WORKERS from .env, falling back to a serial cycle if unset or invalid."""
+    raw_workers = os.getenv("ENGINE_EVALUATION_WORKERS", "0") or "0"
+    try:
+        workers = int(raw_workers)
+    except ValueError:
+        logger.warning(f"Invalid ENGINE_EVALUATION_WORKERS '{raw_workers}'. Evaluating assets serially.")
+        workers = 0
+    return EngineConfig(evaluation_workers=max(0, workers))
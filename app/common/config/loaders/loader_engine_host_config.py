@@ -0,0 +1,72 @@
+"""Loads the engine host's account stacks from YAML, each with its own .env file of connector settings."""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+import yaml
+from dotenv import dotenv_values
+
+from app.common.models.model_engine import EngineHostConfig, HostAccountConfig
+from app.common.config.loaders.loader_connector_config import load_connector_config
+from app.common.config.paths import ROOT_DIR, ENGINE_HOST_CONFIG_PATH
+
+logger = logging.getLogger(__name__)
+
+
+def load_engine_host_config(config_path: Optional[Path] = None) -> EngineHostConfig:
+    """Reads accounts -> [{name, env_file, strategy_profile, account_risk}] from ENGINE_HOST_CONFIG or the default."""
+    config_path = Path(config_path or os.getenv("ENGINE_HOST_CONFIG") or ENGINE_HOST_CONFIG_PATH)
+    with open(config_path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f) or {}
+
+    accounts = []
+    for entry in raw.get("accounts") or []:
+        name = str(entry["name"])
+        env_file = _resolve(entry["env_file"])
+        if not env_file.exists():
+            raise FileNotFoundError(f"Engine host account '{name}': env file not found: {env_file}")
+        # The account's file overrides the shared .env, so settings every
+        # account has in common (timezone, notify keys) live in one place.
+        env = {**os.environ, **{k: v for k, v in dotenv_values(env_file).items() if v is not None}}
+        account_risk = entry.get("account_risk")
+        accounts.append(HostAccountConfig(
+            name=name,
+            connector_config=load_connector_config(env),
+            strategy_profile=str(entry.get("strategy_profile", "") or "").lower(),
+            account_risk_path=_resolve(account_risk) if account_risk else None,
+        ))
+
+    config = EngineHostConfig(accounts=accounts)
+    _validate(config)
+    return config
+
+
+def _resolve(path_value: str) -> Path:
+    path = Path(path_value)
+    return path if path.is_absolute() else ROOT_DIR / path
+
+
+def _validate(config: EngineHostConfig) -> None:
+    if not config.accounts:
+        raise ValueError("Engine host config lists no accounts")
+
+    names = [account.name for account in config.accounts]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Engine host account names must be unique: {names}")
+
+    # The MetaTrader5 package and CTraderSession each hold one connection
+    # per process, so a process can host one account per platform.
+    platforms = [account.connector_config.type for account in config.accounts]
+    for platform in set(platforms):
+        if platforms.count(platform) > 1:
+            raise ValueError(f"Engine host can run only one '{platform}' account per process")
+
+    # PlatformTime is process-wide, so every account must be configured with
+    # the host's clock; main_host pins it and hosted engines leave it alone.
+    clocks = {(account.connector_config.timezone, account.connector_config.offset) for account in config.accounts}
+    if len(clocks) > 1:
+        raise ValueError(
+            f"Engine host accounts must share PLATFORM_TIMEZONE and PLATFORM_TIME_OFFSET: {sorted(clocks)}"
+        )
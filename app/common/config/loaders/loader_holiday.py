@@ -2,10 +2,14 @@
 
 import yaml
 
+from functools import lru_cache
 from pathlib import Path
 from app.common.config.paths import HOLIDAY_PATH
 
 
+# Every strategy of every account stack in the process shares one parsed
+# calendar per region; callers only read it.
+@lru_cache(maxsize=None)
 def load_holiday_calendar(region: str) -> list[str]:
     path = Path(str(HOLIDAY_PATH).format(region.lower()))
     if not path.exists():
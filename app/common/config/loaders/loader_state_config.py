@@ -0,0 +1,20 @@
+"""Loads state persistence configuration from environment variables."""
+
+import logging
+import os
+
+from app.common.models.model_state import StateConfig
+from app.common.config.constants import STATE_BACKEND_JSON, STATE_BACKEND_JOURNAL, STATE_BACKEND_SQLITE
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_STATE_BACKENDS = (STATE_BACKEND_JSON, STATE_BACKEND_JOURNAL, STATE_BACKEND_SQLITE)
+
+
+def load_state_config() -> StateConfig:
+    """Reads STATE_BACKEND from .env, falling back to the plain JSON state file if unset or unknown."""
+    backend = (os.getenv("STATE_BACKEND", STATE_BACKEND_JSON) or STATE_BACKEND_JSON).lower()
+    if backend not in SUPPORTED_STATE_BACKENDS:
+        logger.warning(f"Unknown STATE_BACKEND '{backend}'. Using default '{STATE_BACKEND_JSON}'.")
+        backend = STATE_BACKEND_JSON
+    return StateConfig(backend=backend)
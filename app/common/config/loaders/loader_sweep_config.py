@@ -0,0 +1,64 @@
+"""Loads backtest parameter sweep and walk-forward specs from YAML, with the worker count overridable from .env."""
+
+import logging
+import os
+from pathlib import Path
+
+import yaml
+
+from app.common.models.model_sweep import SweepConfig, WalkForwardConfig
+from app.common.config.constants import SWEEP_MODE_GRID, SWEEP_MODE_RANDOM
+
+logger = logging.getLogger(__name__)
+
+
+def load_sweep_config(spec_path: Path) -> SweepConfig:
+    """Reads a sweep spec shaped as parameters -> strategy -> symbol (or "*") -> field -> [values]."""
+    return _parse_sweep_config(_read_spec(spec_path))
+
+
+def load_walk_forward_config(spec_path: Path) -> WalkForwardConfig:
+    """Reads a sweep spec plus a walk_forward section with in_sample_days, out_of_sample_days and step_days."""
+    raw = _read_spec(spec_path)
+    walk_forward = raw.get("walk_forward") or {}
+    config = WalkForwardConfig(
+        sweep=_parse_sweep_config(raw),
+        in_sample_days=int(walk_forward.get("in_sample_days", 365)),
+        out_of_sample_days=int(walk_forward.get("out_of_sample_days", 90)),
+        step_days=int(walk_forward.get("step_days", 0)),
+    )
+    if config.in_sample_days <= 0 or config.out_of_sample_days <= 0 or config.step_days < 0:
+        raise ValueError("Walk-forward in_sample_days and out_of_sample_days must be positive, step_days non-negative")
+    return config
+
+
+def _read_spec(spec_path: Path) -> dict:
+    with open(spec_path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f) or {}
+
+
+def _parse_sweep_config(raw: dict) -> SweepConfig:
+    parameters = {}
+    for strategy_name, assets in (raw.get("parameters") or {}).items():
+        for symbol, fields in (assets or {}).items():
+            for field_name, values in (fields or {}).items():
+                if not isinstance(values, list) or not values:
+                    raise ValueError(
+                        f"Sweep parameter {strategy_name}/{symbol}/{field_name} needs a non-empty list of values"
+                    )
+                parameters[(strategy_name, str(symbol), field_name)] = values
+
+    mode = str(raw.get("mode", SWEEP_MODE_GRID)).lower()
+    if mode not in (SWEEP_MODE_GRID, SWEEP_MODE_RANDOM):
+        logger.warning(f"Unknown sweep mode '{mode}'. Using '{SWEEP_MODE_GRID}'.")
+        mode = SWEEP_MODE_GRID
+
+    return SweepConfig(
+        parameters=parameters,
+        mode=mode,
+        samples=int(raw.get("samples", 20)),
+        seed=raw.get("seed"),
+        # An empty or 0 SWEEP_WORKERS leaves the spec's own 'workers' in charge.
+        workers=int(os.getenv("SWEEP_WORKERS") or 0) or int(raw.get("workers") or 0),
+        rank_by=raw.get("rank_by", "total_profit"),
+    )
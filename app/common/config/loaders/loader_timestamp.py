@@ -1,6 +1,7 @@
 import os
 
 from datetime import datetime, timedelta
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 from app.common.models.model_engine import TestPeriod, Timestamps
@@ -20,9 +21,12 @@ TIMEFRAME_STEP_MAP = {
 }
 
 
-def load_tester_setup() -> tuple[TestPeriod, Timestamps]:
-    date_from_str = os.environ["BACKTEST_DATE_FROM"]
-    date_to_str = os.environ["BACKTEST_DATE_TO"]
+def load_tester_setup(
+    date_from_str: Optional[str] = None, date_to_str: Optional[str] = None
+) -> tuple[TestPeriod, Timestamps]:
+    """Build the simulation timestamps for BACKTEST_DATE_FROM→BACKTEST_DATE_TO, or for the given dd-mm-YYYY window."""
+    date_from_str = date_from_str or os.environ["BACKTEST_DATE_FROM"]
+    date_to_str = date_to_str or os.environ["BACKTEST_DATE_TO"]
     timeframe = os.environ["BACKTEST_TIMEFRAME"]
     timezone_str = os.environ["PLATFORM_TIMEZONE"]
 
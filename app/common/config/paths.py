@@ -11,14 +11,26 @@ ROOT_WWW = Path(r"C:\inetpub\wwwroot")
 # decoupled from any single app's deploy folder and survives any app-only redeploy
 DATA_DIR = ROOT_DIR.parent.parent / "Data"
 
+# backtest price history: one folder per symbol holding its MT5 bar exports (<name>_<TIMEFRAME>.csv)
+DATA_PATH = DATA_DIR / "history"
+
 # app directories and files
 APP_DIR = ROOT_DIR / "app"
 STRATEGY_PATH = APP_DIR / "strategies"
 STATE_PATH = APP_DIR / "runtime" / "state" / "state.json"
+STATE_JOURNAL_PATH = APP_DIR / "runtime" / "state" / "state.journal"
+STATE_DATABASE_PATH = APP_DIR / "runtime" / "state" / "state.db"
 HEARTBEAT_PATH = APP_DIR / "runtime" / "state" / "heartbeat.json"
+ACCOUNT_STATE_PATH = APP_DIR / "runtime" / "state" / "accounts"
 LOG_PATH = APP_DIR / "runtime" / "logs"
+BAR_CACHE_PATH = APP_DIR / "runtime" / "cache" / "bars"
+RESULT_PATH = APP_DIR / "runtime" / "results"
+SUMMARY_PATH = RESULT_PATH / "summary.json"
+SWEEP_PATH = APP_DIR / "runtime" / "sweeps"
+WALK_FORWARD_PATH = APP_DIR / "runtime" / "walk_forward"
 HOLIDAY_PATH = APP_DIR / "common" / "config" / "holidays" / "holidays_{}.yaml"
 ACCOUNT_RISK_PATH = APP_DIR / "common" / "config" / "account_risk.yaml"
+ENGINE_HOST_CONFIG_PATH = APP_DIR / "common" / "config" / "engine_host.yaml"
 
 # lock file
 LOCK_FILE_PATH = APP_DIR / "runtime" / "trader.lck"
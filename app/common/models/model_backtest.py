@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
+from app.common.config.constants import SAME_BAR_FILL_STOP_FIRST, RESULT_FORMAT_CSV
+
 
 @dataclass
 class BacktestConfig:
@@ -14,9 +18,27 @@ class BacktestConfig:
     backtest_slippage_per_lot: Optional[int]
     backtest_terminal_output: Optional[bool]
     backtest_persist: Optional[bool]
+    backtest_warmup_days: int = 5
+    backtest_skip_inactive: bool = True
+    backtest_signal_prefilter: bool = True
+    backtest_intrabar_fills: bool = True
+    backtest_same_bar_fill: str = SAME_BAR_FILL_STOP_FIRST
+    backtest_result_format: str = RESULT_FORMAT_CSV
+    backtest_result_flush_rows: int = 500
+    backtest_checkpoint_seconds: int = 600
 
 @dataclass
 class StrategyMetrics:
     profit: float = 0.0
     trades: int = 0
     unrealized_profit: float = 0.0
+
+
+@dataclass
+class TradeExcursion:
+    """How far a closed backtest trade ran against (MAE) and for (MFE) it, plus its bar-by-bar floating profit."""
+    mae: float = 0.0
+    mfe: float = 0.0
+    # bar times (wall-clock epoch seconds, the bar clock) and the trade's floating profit at each bar's close
+    times: Optional[np.ndarray] = None
+    floating: Optional[np.ndarray] = None
@@ -1,5 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from app.common.models.model_connector import ConnectorConfig
 
 
 @dataclass
@@ -10,4 +14,25 @@ class TestPeriod:
 
 @dataclass
 class Timestamps:
-    values: list[int]
\ No newline at end of file
+    values: list[int]
+
+
+@dataclass
+class HostAccountConfig:
+    """One account stack of an engine host: its connector settings, strategy profile and risk file."""
+    name: str
+    connector_config: ConnectorConfig
+    strategy_profile: str = ""
+    account_risk_path: Optional[Path] = None
+
+
+@dataclass
+class EngineHostConfig:
+    """The account stacks an engine host runs side by side in one process."""
+    accounts: List[HostAccountConfig] = field(default_factory=list)
+
+
+@dataclass
+class EngineConfig:
+    """Engine cycle settings; 0 or 1 evaluation workers keeps the cycle serial."""
+    evaluation_workers: int = 0
@@ -0,0 +1,11 @@
+"""Configuration model for trade/account state persistence."""
+
+from dataclasses import dataclass
+
+from app.common.config.constants import STATE_BACKEND_JSON
+
+
+@dataclass
+class StateConfig:
+    """Which storage backend StateManager persists to."""
+    backend: str = STATE_BACKEND_JSON
@@ -0,0 +1,57 @@
+"""Data models for backtest parameter sweeps."""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.common.config.constants import SWEEP_MODE_GRID
+
+# (strategy name, asset symbol or "*" for every asset, AssetConfig field name)
+SweepParameter = Tuple[str, str, str]
+
+
+@dataclass
+class SweepConfig:
+    """Which AssetConfig values a sweep varies, how it samples them, and how runs are ranked."""
+    parameters: Dict[SweepParameter, List[Any]] = field(default_factory=dict)
+    mode: str = SWEEP_MODE_GRID
+    samples: int = 20
+    seed: Optional[int] = None
+    workers: int = 0  # 0 = one worker per CPU core
+    rank_by: str = "total_profit"
+
+
+@dataclass
+class SweepRunResult:
+    """One sweep run: the overrides it applied and the BacktestSummary it produced."""
+    run_id: int
+    overrides: Dict[SweepParameter, Any]
+    summary: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class BacktestWindow:
+    """A date range one backtest run covers, as BACKTEST_DATE_FROM/TO strings (dd-mm-YYYY)."""
+    date_from: str
+    date_to: str
+
+
+@dataclass
+class WalkForwardConfig:
+    """A sweep re-optimized on rolling in-sample windows, each followed by an out-of-sample test."""
+    sweep: SweepConfig = field(default_factory=SweepConfig)
+    in_sample_days: int = 365
+    out_of_sample_days: int = 90
+    step_days: int = 0  # 0 = out_of_sample_days, so the out-of-sample windows tile the history
+
+
+@dataclass
+class WalkForwardWindow:
+    """One walk-forward step: its windows, the in-sample winner, and how that winner did out of sample."""
+    number: int
+    in_sample: BacktestWindow
+    out_of_sample: BacktestWindow
+    best_overrides: Optional[Dict[SweepParameter, Any]] = None
+    in_sample_score: Optional[float] = None
+    out_of_sample_summary: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
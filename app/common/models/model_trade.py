@@ -1,7 +1,15 @@
 """Data models representing trade inputs, results, records, and orders."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.common.config.constants import DATETIME_FORMAT
+
+# (source string, naive datetime, date ordinal); datetime/ordinal are None if the string didn't parse
+ParsedTimestamp = Tuple[Optional[str], Optional[datetime], Optional[int]]
+
+_UNPARSED: ParsedTimestamp = (None, None, None)
 
 
 @dataclass
@@ -29,7 +37,7 @@ class TradeResult:
     price: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """Persisted record of an opened or closed trade."""
     id: str
@@ -52,9 +60,107 @@ class TradeRecord:
     profit: Optional[float] = None
     slippage_entry: Optional[float] = None
     slippage_exit: Optional[float] = None
+    # Parse caches, keyed by the source string because callers assign
+    # timestamp/exit_time in place (e.g. when closing a trade). Never persisted:
+    # to_dict() leaves them out and they aren't constructor arguments.
+    _open_parsed: ParsedTimestamp = field(default=_UNPARSED, init=False, repr=False, compare=False)
+    _exit_parsed: ParsedTimestamp = field(default=_UNPARSED, init=False, repr=False, compare=False)
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the persisted fields as a plain dict; a flat, non-recursive asdict()."""
+        return {
+            "id": self.id,
+            "symbol": self.symbol,
+            "lot_size": self.lot_size,
+            "type": self.type,
+            "ticket": self.ticket,
+            "status": self.status,
+            "timestamp": self.timestamp,
+            "strategy": self.strategy,
+            "entry_price": self.entry_price,
+            "exit_price": self.exit_price,
+            "exit_time": self.exit_time,
+            "stop_loss": self.stop_loss,
+            "stop_loss_points": self.stop_loss_points,
+            "take_profit": self.take_profit,
+            "commission": self.commission,
+            "comment": self.comment,
+            "strategy_id": self.strategy_id,
+            "profit": self.profit,
+            "slippage_entry": self.slippage_entry,
+            "slippage_exit": self.slippage_exit,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TradeRecord":
+        """Build a TradeRecord from to_dict() output; raises KeyError if a required field is missing."""
+        return cls(
+            id=data["id"],
+            symbol=data["symbol"],
+            lot_size=data["lot_size"],
+            type=data["type"],
+            ticket=data["ticket"],
+            status=data["status"],
+            timestamp=data["timestamp"],
+            strategy=data["strategy"],
+            entry_price=data.get("entry_price"),
+            exit_price=data.get("exit_price"),
+            exit_time=data.get("exit_time"),
+            stop_loss=data.get("stop_loss"),
+            stop_loss_points=data.get("stop_loss_points"),
+            take_profit=data.get("take_profit"),
+            commission=data.get("commission"),
+            comment=data.get("comment"),
+            strategy_id=data.get("strategy_id", 0),
+            profit=data.get("profit"),
+            slippage_entry=data.get("slippage_entry"),
+            slippage_exit=data.get("slippage_exit"),
+        )
+
+    def get_open_epoch(self, tz: tzinfo) -> Optional[int]:
+        """Return `timestamp` in `tz` as epoch seconds, parsed once and cached until the string changes."""
+        return _to_epoch(self._parse_open()[1], tz)
+
+    def get_open_date_ordinal(self) -> Optional[int]:
+        """Return the date ordinal of `timestamp`, parsed once and cached until the string changes."""
+        return self._parse_open()[2]
+
+    def get_exit_epoch(self, tz: tzinfo) -> Optional[int]:
+        """Return `exit_time` in `tz` as epoch seconds, parsed once and cached until the string changes."""
+        return _to_epoch(self._parse_exit()[1], tz)
+
+    def get_exit_date_ordinal(self) -> Optional[int]:
+        """Return the date ordinal of `exit_time`, parsed once and cached until the string changes."""
+        return self._parse_exit()[2]
+
+    def _parse_open(self) -> ParsedTimestamp:
+        parsed = self._open_parsed
+        if parsed is _UNPARSED or parsed[0] != self.timestamp:
+            parsed = self._open_parsed = _parse_timestamp(self.timestamp)
+        return parsed
+
+    def _parse_exit(self) -> ParsedTimestamp:
+        parsed = self._exit_parsed
+        if parsed is _UNPARSED or parsed[0] != self.exit_time:
+            parsed = self._exit_parsed = _parse_timestamp(self.exit_time)
+        return parsed
+
+
+def _parse_timestamp(value: Optional[str]) -> ParsedTimestamp:
+    if not value:
+        return value, None, None
+    try:
+        dt = datetime.strptime(value, DATETIME_FORMAT)
+    except (TypeError, ValueError):
+        return value, None, None
+    return value, dt, dt.toordinal()
+
+
+def _to_epoch(dt: Optional[datetime], tz: tzinfo) -> Optional[int]:
+    return int(dt.replace(tzinfo=tz).timestamp()) if dt is not None else None
+
+
+@dataclass(slots=True)
 class OrderResult:
     """Result of submitting an order to the broker."""
     symbol: str
@@ -69,8 +175,41 @@ class OrderResult:
     slippage_entry: Optional[float] = None
     slippage_exit: Optional[float] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a plain dict; `request` is shared, not copied."""
+        return {
+            "symbol": self.symbol,
+            "lot_size": self.lot_size,
+            "accepted": self.accepted,
+            "order_id": self.order_id,
+            "retcode": self.retcode,
+            "comment": self.comment,
+            "deal": self.deal,
+            "request": self.request,
+            "price": self.price,
+            "slippage_entry": self.slippage_entry,
+            "slippage_exit": self.slippage_exit,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OrderResult":
+        """Build an OrderResult from to_dict() output."""
+        return cls(
+            symbol=data["symbol"],
+            lot_size=data["lot_size"],
+            accepted=data["accepted"],
+            order_id=data["order_id"],
+            retcode=data["retcode"],
+            comment=data["comment"],
+            deal=data.get("deal"),
+            request=data.get("request"),
+            price=data.get("price"),
+            slippage_entry=data.get("slippage_entry"),
+            slippage_exit=data.get("slippage_exit"),
+        )
+
+
+@dataclass(slots=True)
 class OrderRequest:
     """A fully sized order ready to be submitted to the broker."""
     symbol: str
@@ -87,11 +226,130 @@ class OrderRequest:
     strategy_name: Optional[str] = ""
     strategy_id: Optional[int] = 0
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a plain dict."""
+        return {
+            "symbol": self.symbol,
+            "direction": self.direction,
+            "lot_size": self.lot_size,
+            "capital": self.capital,
+            "stop_loss": self.stop_loss,
+            "stop_loss_points": self.stop_loss_points,
+            "take_profit": self.take_profit,
+            "risk_percent": self.risk_percent,
+            "reward_risk_ratio": self.reward_risk_ratio,
+            "comment": self.comment,
+            "price": self.price,
+            "strategy_name": self.strategy_name,
+            "strategy_id": self.strategy_id,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OrderRequest":
+        """Build an OrderRequest from to_dict() output."""
+        return cls(
+            symbol=data["symbol"],
+            direction=data["direction"],
+            lot_size=data["lot_size"],
+            capital=data["capital"],
+            stop_loss=data.get("stop_loss"),
+            stop_loss_points=data.get("stop_loss_points"),
+            take_profit=data.get("take_profit"),
+            risk_percent=data.get("risk_percent"),
+            reward_risk_ratio=data.get("reward_risk_ratio"),
+            comment=data.get("comment", ""),
+            price=data.get("price"),
+            strategy_name=data.get("strategy_name", ""),
+            strategy_id=data.get("strategy_id", 0),
+        )
+
+
+@dataclass(slots=True)
 class ProfitResult:
     """Computed profit/loss for a closed trade."""
     profit: float = 0.0
     commission: float = 0.0
     slippage_entry: float = 0.0
     slippage_exit: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a plain dict."""
+        return {
+            "profit": self.profit,
+            "commission": self.commission,
+            "slippage_entry": self.slippage_entry,
+            "slippage_exit": self.slippage_exit,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ProfitResult":
+        """Build a ProfitResult from to_dict() output."""
+        return cls(
+            profit=data.get("profit", 0.0),
+            commission=data.get("commission", 0.0),
+            slippage_entry=data.get("slippage_entry", 0.0),
+            slippage_exit=data.get("slippage_exit", 0.0),
+        )
+
+
+@dataclass(slots=True)
+class SlTpFill:
+    """A stop-loss or take-profit level the backtest fill simulator found reached within a bar."""
+    price: float
+    time: str
+    stop_loss_hit: bool
+
+
+@dataclass
+class TradeColumns:
+    """Many TradeRecords stored column-per-field, for bulk aggregation and bulk inserts."""
+    id: List[str] = field(default_factory=list)
+    symbol: List[str] = field(default_factory=list)
+    lot_size: List[float] = field(default_factory=list)
+    type: List[str] = field(default_factory=list)
+    ticket: List[str] = field(default_factory=list)
+    status: List[str] = field(default_factory=list)
+    timestamp: List[str] = field(default_factory=list)
+    strategy: List[str] = field(default_factory=list)
+    entry_price: List[Optional[float]] = field(default_factory=list)
+    exit_price: List[Optional[float]] = field(default_factory=list)
+    exit_time: List[Optional[str]] = field(default_factory=list)
+    stop_loss: List[Optional[float]] = field(default_factory=list)
+    stop_loss_points: List[Optional[int]] = field(default_factory=list)
+    take_profit: List[Optional[float]] = field(default_factory=list)
+    commission: List[Optional[float]] = field(default_factory=list)
+    comment: List[Optional[str]] = field(default_factory=list)
+    strategy_id: List[Optional[int]] = field(default_factory=list)
+    profit: List[Optional[float]] = field(default_factory=list)
+    slippage_entry: List[Optional[float]] = field(default_factory=list)
+    slippage_exit: List[Optional[float]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[TradeRecord], status: Optional[str] = None) -> "TradeColumns":
+        """Build columns from trades in one pass, optionally keeping only those with the given status."""
+        trades = [t for t in trades if status is None or t.status == status]
+        return cls(
+            id=[t.id for t in trades],
+            symbol=[t.symbol for t in trades],
+            lot_size=[t.lot_size for t in trades],
+            type=[t.type for t in trades],
+            ticket=[t.ticket for t in trades],
+            status=[t.status for t in trades],
+            timestamp=[t.timestamp for t in trades],
+            strategy=[t.strategy for t in trades],
+            entry_price=[t.entry_price for t in trades],
+            exit_price=[t.exit_price for t in trades],
+            exit_time=[t.exit_time for t in trades],
+            stop_loss=[t.stop_loss for t in trades],
+            stop_loss_points=[t.stop_loss_points for t in trades],
+            take_profit=[t.take_profit for t in trades],
+            commission=[t.commission for t in trades],
+            comment=[t.comment for t in trades],
+            strategy_id=[t.strategy_id for t in trades],
+            profit=[t.profit for t in trades],
+            slippage_entry=[t.slippage_entry for t in trades],
+            slippage_exit=[t.slippage_exit for t in trades],
+        )
@@ -0,0 +1,198 @@
+"""Backtest performance analytics computed with NumPy over the run's closed trades."""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.common.models.model_backtest import TradeExcursion
+from app.common.models.model_trade import TradeRecord
+from app.common.services.backtest_signals import get_bar_epochs
+from app.common.services.platform_time import PlatformTime
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+DAYS_PER_YEAR = 365.25
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+class BacktestAnalytics:
+    """Collects closed trades as columns and derives the equity curve and performance statistics from them."""
+
+    def __init__(self, initial_deposit: float) -> None:
+        self.initial_deposit = initial_deposit
+        self.symbols: List[str] = []
+        self.strategies: List[str] = []
+        self.open_epochs: List[int] = []
+        self.exit_epochs: List[int] = []
+        self.open_wall_epochs: List[int] = []
+        self.net_profits: List[float] = []
+        self.maes: List[float] = []
+        self.mfes: List[float] = []
+        # (trade number, bar times, floating profit) for trades that reported their path
+        self._paths: List[Tuple[int, np.ndarray, np.ndarray]] = []
+
+    def __len__(self) -> int:
+        return len(self.net_profits)
+
+    def record_trade(self, trade: TradeRecord, excursion: Optional[TradeExcursion] = None) -> None:
+        """Append one closed trade; its net profit matches the results file's Net Profit column."""
+        open_epoch = trade.get_open_epoch(PlatformTime.get_timezone())
+        exit_epoch = trade.get_exit_epoch(PlatformTime.get_timezone())
+        if open_epoch is None or exit_epoch is None:
+            logger.warning(f"Skipping trade {trade.id} in analytics: unparseable open or exit time")
+            return
+
+        excursion = excursion or TradeExcursion()
+        if excursion.times is not None and excursion.floating is not None and len(excursion.times):
+            self._paths.append((len(self.net_profits), excursion.times, excursion.floating))
+
+        self.symbols.append(trade.symbol)
+        self.strategies.append(trade.strategy)
+        self.open_epochs.append(open_epoch)
+        self.exit_epochs.append(exit_epoch)
+        utc_offset = PlatformTime.from_timestamp(open_epoch).utcoffset()
+        self.open_wall_epochs.append(open_epoch + int(utc_offset.total_seconds()))
+        self.net_profits.append(
+            (trade.profit or 0.0)
+            - (trade.commission or 0.0)
+            - (trade.slippage_entry or 0.0)
+            - (trade.slippage_exit or 0.0)
+        )
+        self.maes.append(excursion.mae)
+        self.mfes.append(excursion.mfe)
+
+    def get_equity_curve(self, timestamps: List[int]) -> np.ndarray:
+        """Return account equity (deposit + realized + floating) at each of the run's simulation `timestamps`."""
+        grid = np.asarray(timestamps, dtype=np.int64)
+        equity = np.full(len(grid), float(self.initial_deposit))
+        if not len(grid) or not len(self):
+            return equity
+
+        open_positions, exit_positions = self._get_grid_positions(grid)
+
+        # Realized profit steps in at the first timestamp at or after each exit.
+        realized = np.zeros(len(grid) + 1)
+        np.add.at(realized, exit_positions, np.asarray(self.net_profits))
+        equity += np.cumsum(realized[:-1])
+
+        # Each trade's floating profit covers only its own span of the grid,
+        # so this loop touches every grid point once per trade open there.
+        grid_wall = get_bar_epochs(timestamps)
+        for number, times, floating in self._paths:
+            start, stop = int(open_positions[number]), int(exit_positions[number])
+            if start >= stop:
+                continue
+            index = np.searchsorted(times, grid_wall[start:stop], side="right") - 1
+            equity[start:stop] += np.where(index >= 0, floating[np.maximum(index, 0)], 0.0)
+        return equity
+
+    def compute(self, timestamps: List[int], equity: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Return every statistic as plain JSON-serializable values, for the summary file and sweep comparisons."""
+        if equity is None:
+            equity = self.get_equity_curve(timestamps)
+        net = np.asarray(self.net_profits, dtype=np.float64)
+        wins = net[net > 0]
+        losses = net[net < 0]
+        gross_loss = float(-losses.sum())
+
+        stats: Dict[str, Any] = {
+            "trades": int(len(net)),
+            "win_rate": _ratio(len(wins), len(net)),
+            "profit_factor": _ratio(float(wins.sum()), gross_loss) if gross_loss > 0 else None,
+            "average_win": round(float(wins.mean()), 2) if len(wins) else 0.0,
+            "average_loss": round(float(losses.mean()), 2) if len(losses) else 0.0,
+            "expectancy": round(float(net.mean()), 2) if len(net) else 0.0,
+            "average_mae": round(float(np.mean(self.maes)), 6) if len(net) else 0.0,
+            "average_mfe": round(float(np.mean(self.mfes)), 6) if len(net) else 0.0,
+        }
+        stats.update(get_drawdown(equity))
+        stats.update(get_risk_ratios(timestamps, equity))
+        stats.update(self._get_exposure(timestamps))
+        stats["by_symbol"] = self._get_breakdown(np.asarray(self.symbols, dtype=object), net)
+        stats["by_strategy"] = self._get_breakdown(np.asarray(self.strategies, dtype=object), net)
+        weekdays = (np.asarray(self.open_wall_epochs, dtype=np.int64) // SECONDS_PER_DAY + 3) % 7
+        stats["by_weekday"] = self._get_breakdown(np.asarray(WEEKDAYS, dtype=object)[weekdays], net)
+        return stats
+
+    def _get_grid_positions(self, grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        opens = np.searchsorted(grid, np.asarray(self.open_epochs, dtype=np.int64), side="left")
+        exits = np.searchsorted(grid, np.asarray(self.exit_epochs, dtype=np.int64), side="left")
+        return opens, exits
+
+    def _get_exposure(self, timestamps: List[int]) -> Dict[str, Any]:
+        if not len(self) or not len(timestamps):
+            return {"exposure_pct": 0.0, "average_trade_minutes": 0.0}
+        grid = np.asarray(timestamps, dtype=np.int64)
+        opens, exits = self._get_grid_positions(grid)
+        # +1 where a trade opens, -1 where it closes: a running sum > 0 means something is open.
+        changes = np.zeros(len(grid) + 1, dtype=np.int64)
+        np.add.at(changes, opens, 1)
+        np.add.at(changes, exits, -1)
+        exposed = np.cumsum(changes[:-1]) > 0
+        durations = np.asarray(self.exit_epochs, dtype=np.int64) - np.asarray(self.open_epochs, dtype=np.int64)
+        return {
+            "exposure_pct": round(float(exposed.mean()) * 100, 2),
+            "average_trade_minutes": round(float(durations.mean()) / 60, 1),
+        }
+
+    @staticmethod
+    def _get_breakdown(keys: np.ndarray, net: np.ndarray) -> Dict[str, Dict[str, Any]]:
+        if not len(keys):
+            return {}
+        labels, inverse = np.unique(keys, return_inverse=True)
+        counts = np.bincount(inverse, minlength=len(labels))
+        profits = np.bincount(inverse, weights=net, minlength=len(labels))
+        win_counts = np.bincount(inverse, weights=(net > 0).astype(np.float64), minlength=len(labels))
+        breakdown: Dict[str, Dict[str, Any]] = {}
+        rows = zip(labels.tolist(), counts.tolist(), profits.tolist(), win_counts.tolist())
+        for label, count, profit, win_count in rows:
+            breakdown[label] = {
+                "trades": int(count),
+                "net_profit": round(profit, 2),
+                "win_rate": _ratio(win_count, count),
+            }
+        return breakdown
+
+
+def get_drawdown(equity: np.ndarray) -> Dict[str, Any]:
+    """Return the largest peak-to-trough drop of an equity curve, absolute and in percent."""
+    if not len(equity):
+        return {"max_drawdown": 0.0, "max_drawdown_pct": 0.0}
+    peaks = np.maximum.accumulate(equity)
+    drawdowns = equity - peaks
+    return {
+        "max_drawdown": round(float(-drawdowns.min()), 2),
+        "max_drawdown_pct": round(float(-(drawdowns / peaks).min()) * 100, 2),
+    }
+
+
+def get_risk_ratios(timestamps: List[int], equity: np.ndarray) -> Dict[str, Any]:
+    """Return the annualized Sharpe and Sortino ratios of an equity curve sampled at `timestamps`."""
+    # Ratios are on daily returns: the equity at each platform day's last timestamp.
+    if len(equity) < 2:
+        return {"sharpe_ratio": None, "sortino_ratio": None}
+    days = get_bar_epochs(timestamps) // SECONDS_PER_DAY
+    day_closes = equity[np.concatenate((np.flatnonzero(days[1:] != days[:-1]), [len(days) - 1]))]
+    if len(day_closes) < 2:
+        return {"sharpe_ratio": None, "sortino_ratio": None}
+
+    returns = np.diff(day_closes) / day_closes[:-1]
+    mean = float(returns.mean())
+    deviation = float(returns.std())
+    downside = float(np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2)))
+    # Which calendar days have timestamps depends on the run (weekends and
+    # skipped sessions may be missing), so annualize by the days per year
+    # actually observed rather than a fixed trading-day count.
+    span_days = max(1, int(days[-1] - days[0]))
+    annualize = math.sqrt(len(returns) * DAYS_PER_YEAR / span_days)
+    return {
+        "sharpe_ratio": round(mean / deviation * annualize, 4) if deviation > 0 else None,
+        "sortino_ratio": round(mean / downside * annualize, 4) if downside > 0 else None,
+    }
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    return round(numerator / denominator, 4) if denominator else 0.0
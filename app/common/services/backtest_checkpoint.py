@@ -0,0 +1,66 @@
+"""Compact binary checkpoints of a running backtest, so an interrupted EngineTester run can resume where it stopped."""
+
+import logging
+import os
+import pickle
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# bump when the payload layout changes so an old checkpoint is ignored, not misread
+CHECKPOINT_VERSION = 1
+
+
+class BacktestCheckpoint:
+    """Writes and reads one zlib-compressed pickle of the full simulation state for a given backtest setup."""
+
+    def __init__(self, path: Path, run_key: Dict[str, Any]) -> None:
+        self.path = path
+        # identifies the backtest setup; a checkpoint from a different window,
+        # timeframe or strategy set is never resumed
+        self.run_key = run_key
+
+    def save(self, payload: Dict[str, Any]) -> None:
+        """Atomically replace the checkpoint file with `payload`."""
+        data = zlib.compress(
+            pickle.dumps(
+                {"version": CHECKPOINT_VERSION, "run_key": self.run_key, "payload": payload},
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ),
+            level=1,
+        )
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        logger.info(f"Backtest checkpoint written to {self.path} ({len(data)} bytes)")
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return the saved payload, or None if there is no usable checkpoint for this setup."""
+        if not self.path.exists():
+            logger.warning(f"No backtest checkpoint at {self.path}; starting from the beginning")
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                checkpoint = pickle.loads(zlib.decompress(f.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as error:
+            logger.warning(f"Ignoring unreadable backtest checkpoint {self.path}: {error}")
+            return None
+
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            logger.warning(f"Ignoring backtest checkpoint {self.path}: written by an older version")
+            return None
+        if checkpoint.get("run_key") != self.run_key:
+            logger.warning(f"Ignoring backtest checkpoint {self.path}: it belongs to a different backtest setup")
+            return None
+        return checkpoint["payload"]
+
+    def clear(self) -> None:
+        """Delete the checkpoint once the run it belongs to has finished."""
+        if self.path.exists():
+            self.path.unlink()
@@ -0,0 +1,63 @@
+"""Narrows a backtest's simulation timestamps to the ones where at least one strategy can act."""
+
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from typing import List, Tuple
+
+from app.base.base_strategy import Strategy
+from app.common.services.platform_time import PlatformTime
+
+logger = logging.getLogger(__name__)
+
+
+def get_active_timestamps(timestamps: List[int], strategies: List[Strategy]) -> List[int]:
+    """Return the sorted epoch `timestamps` that fall inside any strategy's session on a non-holiday."""
+    # Mirrors the gate in BaseEngine._run_strategies (is_holiday / is_market_open),
+    # so every timestamp dropped here is one where no strategy would have run,
+    # including exits and SL/TP checks, which sit behind the same gate.
+    if not timestamps or not strategies:
+        return list(timestamps)
+
+    active: List[int] = []
+    day = PlatformTime.from_timestamp(timestamps[0]).date()
+    last_day = PlatformTime.from_timestamp(timestamps[-1]).date()
+    while day <= last_day:
+        for start_epoch, end_epoch in _get_day_windows(day, strategies):
+            lo = bisect_left(timestamps, start_epoch)
+            hi = bisect_right(timestamps, end_epoch)
+            active.extend(timestamps[lo:hi])
+        day += timedelta(days=1)
+
+    logger.info(
+        f"Backtest clock: {len(active)} of {len(timestamps)} timestamps fall inside a strategy session "
+        f"({len(timestamps) - len(active)} skipped)"
+    )
+    return active
+
+
+def _get_day_windows(day: date, strategies: List[Strategy]) -> List[Tuple[int, int]]:
+    weekday = day.strftime("%A")
+    windows = []
+    for strategy in strategies:
+        if day in strategy.holidays or not strategy.config.market_hours:
+            continue
+        session = strategy.config.market_hours.sessions.get(weekday)
+        if session is None:
+            continue
+        open_time = PlatformTime.strptime(session.open_time, "%H:%M").time()
+        close_time = PlatformTime.strptime(session.close_time, "%H:%M").time()
+        # Inclusive at both ends, like is_within_market_hours.
+        start = int(PlatformTime.combine(day, open_time).timestamp())
+        end = int(PlatformTime.combine(day, close_time).timestamp())
+        if start <= end:
+            windows.append((start, end))
+
+    # Merge overlapping sessions so no timestamp is emitted twice.
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
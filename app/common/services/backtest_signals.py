@@ -0,0 +1,125 @@
+"""Vectorized pre-evaluation of strategy entry signals over a whole backtest's bar arrays."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+
+from app.base.base_strategy import Strategy
+from app.common.models.model_strategy import AssetConfig
+from app.common.services.platform_time import PlatformTime
+
+if TYPE_CHECKING:
+    from app.connectors.mt5tester.mt5tester_bars import SymbolBars
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+MINUTES_PER_DAY = 1440
+
+
+def get_bar_epochs(timestamps: List[int]) -> np.ndarray:
+    """Return UTC epoch `timestamps` as platform wall-clock epochs, the clock the bar times are stored on."""
+    epochs = np.asarray(timestamps, dtype=np.int64)
+    bar_epochs = np.empty_like(epochs)
+    if not len(epochs):
+        return bar_epochs
+
+    # The UTC offset only changes at a DST transition, so resolve it once per
+    # day and only look up each timestamp on the day that has one.
+    days = epochs // SECONDS_PER_DAY
+    boundaries = np.flatnonzero(np.diff(days)) + 1
+    starts = np.concatenate(([0], boundaries))
+    stops = np.concatenate((boundaries, [len(epochs)]))
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        first_offset = _get_utc_offset(int(epochs[start]))
+        if first_offset == _get_utc_offset(int(epochs[stop - 1])):
+            bar_epochs[start:stop] = epochs[start:stop] + first_offset
+        else:
+            bar_epochs[start:stop] = [epoch + _get_utc_offset(epoch) for epoch in epochs[start:stop].tolist()]
+    return bar_epochs
+
+
+def get_candidate_mask(timestamps: List[int], strategies: List[Strategy]) -> Optional[np.ndarray]:
+    """Return a mask over `timestamps` of bars where any strategy could open a trade, or None if one can't say."""
+    # Each platform day's first and last timestamp are marked too, so the
+    # engine's daily rollover and closed-trade cleanup run at the same points
+    # as in a bar-by-bar run.
+    if not timestamps or not strategies:
+        return None
+
+    bar_epochs = get_bar_epochs(timestamps)
+    mask = np.zeros(len(bar_epochs), dtype=bool)
+    for strategy in strategies:
+        # Backtest strategies share the tester symbol, which serves the bar arrays.
+        candidates = strategy.get_entry_candidates(bar_epochs, strategy.symbol.get_bars)
+        if candidates is None:
+            logger.info(f"Signal pre-evaluation off: {strategy.strategy_name} has no vectorized entry signal")
+            return None
+        mask |= candidates
+
+    days = bar_epochs // SECONDS_PER_DAY
+    day_changes = days[1:] != days[:-1]
+    mask[np.concatenate(([True], day_changes))] = True
+    mask[np.concatenate((day_changes, [True]))] = True
+
+    logger.info(f"Signal pre-evaluation: {int(mask.sum())} of {len(mask)} timestamps are entry candidates")
+    return mask
+
+
+def get_after_open_candidates(bar_epochs: np.ndarray, asset: AssetConfig) -> np.ndarray:
+    """Return a mask of the timestamps at or after the asset's open minute, as GoLong's time gate sees it."""
+    # compute_time_from_minutes wraps past midnight, so the gate does too.
+    open_min = (asset.open_min or 0) % MINUTES_PER_DAY
+    return _get_minutes(bar_epochs) >= open_min
+
+
+def get_breakout_candidates(bar_epochs: np.ndarray, bars: Optional[SymbolBars], asset: AssetConfig) -> np.ndarray:
+    """Return a mask of the timestamps where the ask breaks the day's opening range, as BreakOut's signal sees it."""
+    mask = np.zeros(len(bar_epochs), dtype=bool)
+    if bars is None or not len(bars):
+        return mask
+
+    range_open_min = asset.range_open_min or 0
+    range_close_min = asset.range_close_min or 0
+    minutes = _get_minutes(bar_epochs)
+    # set_range only fills the range once range_close_min has passed, and
+    # the entry gate waits for open_min on top of that.
+    eligible = (minutes >= (asset.open_min or 0)) & (minutes >= range_close_min)
+    price_index = np.searchsorted(bars.times, bar_epochs, side="right") - 1
+    eligible &= price_index >= 0
+    positions = np.flatnonzero(eligible)
+    if not len(positions):
+        return mask
+
+    days = bar_epochs[positions] // SECONDS_PER_DAY
+    unique_days, day_index = np.unique(days, return_inverse=True)
+    highs = np.empty(len(unique_days))
+    lows = np.empty(len(unique_days))
+    for i, day in enumerate(unique_days.tolist()):
+        day_start = day * SECONDS_PER_DAY
+        high_low = bars.high_low_between(day_start + range_open_min * 60, day_start + range_close_min * 60)
+        # get_high_low_range reports an empty window as 0/0 and set_range
+        # still marks it set, so the bar-by-bar path trades against that too.
+        highs[i], lows[i] = high_low if high_low is not None else (0.0, 0.0)
+
+    price = bars.close[price_index[positions]]
+    high = highs[day_index]
+    low = lows[day_index]
+    signal = (price > 0) & ((price > high) | (price < low))
+    if asset.range_size_restricted:
+        range_size = high - low
+        signal &= (0.001 * price <= range_size) & (range_size <= 0.008 * price)
+
+    mask[positions[signal]] = True
+    return mask
+
+
+def _get_minutes(bar_epochs: np.ndarray) -> np.ndarray:
+    return (bar_epochs % SECONDS_PER_DAY) // 60
+
+
+def _get_utc_offset(epoch: int) -> int:
+    return int(PlatformTime.from_timestamp(epoch).utcoffset().total_seconds())
@@ -1,20 +1,31 @@
 import json
+import logging
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
 from app.common.config.paths import SUMMARY_PATH
 from app.common.config.constants import DATETIME_FORMAT, DATE_FORMAT, TRADE_STATUS_CLOSED
-from app.common.models.model_backtest import BacktestConfig, StrategyMetrics
+from app.common.models.model_backtest import BacktestConfig, StrategyMetrics, TradeExcursion
+from app.common.models.model_trade import TradeColumns, TradeRecord
+from app.common.services.backtest_analytics import BacktestAnalytics
 from collections import defaultdict
 
+logger = logging.getLogger(__name__)
+
 
 class BacktestSummary:
-    def __init__(self, backtest_config: BacktestConfig):
-        self.file_path = SUMMARY_PATH
+    def __init__(self, backtest_config: BacktestConfig, file_path: Optional[Path] = None):
+        self.file_path = file_path or SUMMARY_PATH
         self.summary = {}
         self._wall_start: Optional[datetime] = None
         self.backtest_config = backtest_config
         self.total_profit: float = 0.0
+        self.analytics = BacktestAnalytics(float(backtest_config.backtest_deposit or 0.0))
+        self.equity_curve_path = self.file_path.with_name(f"{self.file_path.stem}_equity.npz")
+        self.checkpoint_path = self.file_path.with_name(f"{self.file_path.stem}_checkpoint.bin")
 
     def set_time_range(self, start: datetime, end: datetime):
         self.summary["start_time"] = start.strftime(DATETIME_FORMAT)
@@ -26,14 +37,16 @@ class BacktestSummary:
         self.summary["total_profit"] = round(profit, 2)
         self.summary["final_balance"] = round(final_balance, 2)
 
-    def set_strategy_metrics(self, trades: list):
+    def set_strategy_metrics(self, trades: Union[TradeColumns, Iterable[TradeRecord]]):
+        if not isinstance(trades, TradeColumns):
+            trades = TradeColumns.from_trades(trades, status=TRADE_STATUS_CLOSED)
         result = defaultdict(StrategyMetrics)
 
-        for trade in trades:
-            strategy = trade.strategy
-            if trade.status == TRADE_STATUS_CLOSED:
-                result[strategy].profit += float(trade.profit or 0.0)
-                result[strategy].trades += 1
+        for strategy, status, profit in zip(trades.strategy, trades.status, trades.profit):
+            if status == TRADE_STATUS_CLOSED:
+                metrics = result[strategy]
+                metrics.profit += float(profit or 0.0)
+                metrics.trades += 1
 
         self.summary["strategies"] = {
             k: {
@@ -42,6 +55,19 @@ class BacktestSummary:
             } for k, v in result.items()
         }
 
+    def record_closed_trade(self, trade: TradeRecord, excursion: Optional[TradeExcursion] = None) -> None:
+        """Feed one closed trade to the analytics."""
+        self.analytics.record_trade(trade, excursion)
+
+    def set_analytics(self, timestamps: List[int]) -> None:
+        """Compute the run's analytics into the summary and save its equity curve next to the summary file."""
+        equity = self.analytics.get_equity_curve(timestamps)
+        self.summary["analytics"] = self.analytics.compute(timestamps, equity)
+
+        self.equity_curve_path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(self.equity_curve_path, timestamps=np.asarray(timestamps, dtype=np.int64), equity=equity)
+        logger.info(f"Equity curve ({len(equity)} points) written to {self.equity_curve_path}")
+
     def update_total_profit(self, profit: float = 0.0, trade_date: Optional[str] = None) -> None:
         self.total_profit += round(profit, 2)
         self.summary["total_profit"] = round(self.total_profit, 2)
@@ -60,6 +86,20 @@ class BacktestSummary:
     def get_total_profit(self) -> float:
         return round(self.total_profit, 2)
 
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Return the running totals and collected analytics for a backtest checkpoint."""
+        return {
+            "summary": self.summary,
+            "total_profit": self.total_profit,
+            "analytics": self.analytics,
+        }
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        """Restore state returned by get_checkpoint_state when a backtest resumes."""
+        self.summary = state["summary"]
+        self.total_profit = state["total_profit"]
+        self.analytics = state["analytics"]
+
     def mark_wall_start(self):
         self._wall_start = datetime.now()
         self.summary["backtest_started_at"] = self._wall_start.strftime(DATETIME_FORMAT)
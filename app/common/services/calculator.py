@@ -276,3 +276,12 @@ class Calculator():
             slippage_entry=round(slippage_entry, 2),
             slippage_exit=round(slippage_exit, 2),
         )
+
+    def calculate_price_value(self, symbol: str, lot_size: float) -> float:
+        """Return the account-currency value of a one-unit price move for `lot_size` lots, as calculate_profit does."""
+        tick_size = float(self.symbol.get_tick_size(symbol)) or 0.0
+        tick_value = float(self.symbol.get_tick_value(symbol)) or 0.0
+        if tick_size > 0 and tick_value > 0:
+            return tick_value / tick_size * lot_size
+        contract_size = float(self.symbol.get_contract_size(symbol)) or 1.0
+        return lot_size * contract_size
@@ -2,11 +2,12 @@
 
 import logging
 import sqlite3
+from itertools import repeat
 from pathlib import Path
 from typing import List
 
-from app.common.config.constants import TRADE_STATUS_CLOSED
-from app.common.models.model_trade import TradeRecord
+from app.common.config.constants import TRADE_STATUS_CLOSED, SQLITE_BUSY_TIMEOUT_SECONDS
+from app.common.models.model_trade import TradeColumns, TradeRecord
 
 logger = logging.getLogger(__name__)
 
@@ -47,10 +48,6 @@ INSERT OR IGNORE INTO deals (
 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 """
 
-# seconds SQLite waits for a lock to clear before raising "database is locked" —
-# relevant now that multiple instances (MT5, cTrader) can write to the same shared file
-SQLITE_BUSY_TIMEOUT_SECONDS = 30
-
 
 class DealArchiveManager:
     """Archives closed trades into a local SQLite database for downstream reporting (e.g. Metabase)."""
@@ -68,41 +65,36 @@ class DealArchiveManager:
 
     def archive_closed_trades(self, trades: List[TradeRecord]) -> int:
         """Insert any closed trades not already archived. Returns the number of newly archived rows."""
-        closed_trades = [trade for trade in trades if trade.status == TRADE_STATUS_CLOSED]
-        if not closed_trades:
+        closed = TradeColumns.from_trades(trades, status=TRADE_STATUS_CLOSED)
+        if not len(closed):
             return 0
 
-        inserted = 0
+        rows = zip(
+            closed.id,
+            repeat(self.platform),
+            repeat(self.account_id),
+            closed.symbol,
+            closed.lot_size,
+            closed.type,
+            closed.ticket,
+            closed.status,
+            closed.timestamp,
+            closed.strategy,
+            closed.strategy_id,
+            closed.entry_price,
+            closed.exit_price,
+            closed.exit_time,
+            closed.stop_loss,
+            closed.stop_loss_points,
+            closed.take_profit,
+            closed.commission,
+            closed.comment,
+            closed.profit,
+            closed.slippage_entry,
+            closed.slippage_exit,
+        )
         with sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS) as conn:
-            for trade in closed_trades:
-                cursor = conn.execute(
-                    INSERT_DEAL_SQL,
-                    (
-                        trade.id,
-                        self.platform,
-                        self.account_id,
-                        trade.symbol,
-                        trade.lot_size,
-                        trade.type,
-                        trade.ticket,
-                        trade.status,
-                        trade.timestamp,
-                        trade.strategy,
-                        trade.strategy_id,
-                        trade.entry_price,
-                        trade.exit_price,
-                        trade.exit_time,
-                        trade.stop_loss,
-                        trade.stop_loss_points,
-                        trade.take_profit,
-                        trade.commission,
-                        trade.comment,
-                        trade.profit,
-                        trade.slippage_entry,
-                        trade.slippage_exit,
-                    ),
-                )
-                inserted += cursor.rowcount
+            inserted = conn.executemany(INSERT_DEAL_SQL, rows).rowcount
 
         if inserted:
             logger.info(f"Archived {inserted} new closed trade(s) to {self.db_path}")
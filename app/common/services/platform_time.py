@@ -23,11 +23,17 @@ class PlatformTime:
     """Centralized, timezone-aware time utility used throughout the application."""
     _platform_tz: ZoneInfo = ZoneInfo("UTC")
     _offset: int = 0
+    # simulation clock of a running backtest; None means the wall clock
+    _backtest_now: Optional[datetime] = None
 
     @staticmethod
     def set_timezone(tz_name: str) -> None:
         PlatformTime._platform_tz = ZoneInfo(tz_name or "UTC")
 
+    @staticmethod
+    def get_timezone() -> ZoneInfo:
+        return PlatformTime._platform_tz
+
     @staticmethod
     def set_offset(tz_offset: int) -> None:
         PlatformTime._offset = tz_offset
@@ -36,6 +42,15 @@ class PlatformTime:
     def get_offset() -> float:
         return PlatformTime._offset
 
+    @staticmethod
+    def set_backtest_timestamp(ts: float) -> None:
+        """Pin now() to the simulation timestamp `ts` (epoch seconds) until cleared."""
+        PlatformTime._backtest_now = PlatformTime.from_timestamp(ts)
+
+    @staticmethod
+    def clear_backtest_timestamp() -> None:
+        PlatformTime._backtest_now = None
+
     @staticmethod
     def now() -> datetime:
         return PlatformTime._get_now()
@@ -187,6 +202,8 @@ class PlatformTime:
 
     @staticmethod
     def _get_now() -> datetime:
+        if PlatformTime._backtest_now is not None:
+            return PlatformTime._backtest_now
         base_dt = datetime.now(tz=PlatformTime._platform_tz)
         return base_dt + timedelta(hours=PlatformTime._offset)
 
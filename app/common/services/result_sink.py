@@ -0,0 +1,189 @@
+"""Buffered writers for backtest result rows: CSV by default, Parquet or Arrow IPC when pyarrow is installed."""
+
+import csv
+import logging
+import os
+import shutil
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (column name, Python type) pairs; the type picks the Parquet/Arrow column type
+ResultColumns = Sequence[Tuple[str, type]]
+
+
+class ResultSink(ABC):
+    """Collects result rows in memory and writes them out in batches."""
+
+    def __init__(self, path: Path, columns: ResultColumns, flush_rows: int) -> None:
+        self.path = path
+        self.columns = columns
+        self.flush_rows = max(1, flush_rows)
+        self._rows: List[Sequence[Any]] = []
+
+    def write(self, row: Sequence[Any]) -> None:
+        """Queue one row, in column order; writes the batch out once it reaches flush_rows."""
+        self._rows.append(row)
+        if len(self._rows) >= self.flush_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write every queued row to the file."""
+        if not self._rows:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_rows(self._rows)
+        self._rows = []
+
+    def close(self) -> None:
+        """Flush the remaining rows and close the file."""
+        self.flush()
+        self._close_file()
+
+    @abstractmethod
+    def get_checkpoint_marker(self) -> int:
+        """Flush and return a marker for how much of the file a backtest checkpoint covers."""
+
+    @abstractmethod
+    def resume_from(self, marker: int) -> None:
+        """Drop whatever was written after the checkpoint that returned `marker`."""
+
+    @abstractmethod
+    def _write_rows(self, rows: List[Sequence[Any]]) -> None:
+        pass
+
+    @abstractmethod
+    def _close_file(self) -> None:
+        pass
+
+
+class CsvResultSink(ResultSink):
+    """Appends rows to a CSV file that stays open between batches."""
+
+    def __init__(self, path: Path, columns: ResultColumns, flush_rows: int) -> None:
+        super().__init__(path, columns, flush_rows)
+        self._file = None
+        self._writer = None
+
+    def _write_rows(self, rows: List[Sequence[Any]]) -> None:
+        if self._file is None:
+            # Appending keeps earlier results in the same file; only a new
+            # or empty file gets the header.
+            is_new_file = not self.path.exists() or self.path.stat().st_size == 0
+            self._file = open(self.path, mode="a", newline="")
+            self._writer = csv.writer(self._file)
+            if is_new_file:
+                self._writer.writerow([name for name, _ in self.columns])
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def get_checkpoint_marker(self) -> int:
+        self.flush()
+        return self.path.stat().st_size if self.path.exists() else 0
+
+    def resume_from(self, marker: int) -> None:
+        self._close_file()
+        if self.path.exists():
+            with open(self.path, mode="r+b") as f:
+                f.truncate(marker)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
+class ArrowResultSink(ResultSink):
+    """Writes each batch as a Parquet row group or an Arrow IPC record batch."""
+
+    def __init__(self, path: Path, columns: ResultColumns, flush_rows: int, parquet: bool) -> None:
+        super().__init__(path, columns, flush_rows)
+        try:
+            import pyarrow
+        except ImportError as error:
+            raise RuntimeError(
+                f"Writing backtest results as {'Parquet' if parquet else 'Arrow'} requires pyarrow "
+                "(pip install pyarrow)."
+            ) from error
+
+        self._pa = pyarrow
+        self.parquet = parquet
+        arrow_types = {str: pyarrow.string(), float: pyarrow.float64(), int: pyarrow.int64()}
+        self.schema = pyarrow.schema([(name, arrow_types[kind]) for name, kind in columns])
+        self._writer = None
+        self._rows_written = 0
+        # finalized copy of the file as of the last checkpoint
+        self._checkpoint_path = path.with_name(path.name + ".checkpoint")
+
+    def _write_rows(self, rows: List[Sequence[Any]]) -> None:
+        pa = self._pa
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array([row[i] for row in rows], type=field.type) for i, field in enumerate(self.schema)],
+            schema=self.schema,
+        )
+        if self._writer is None:
+            self._open_writer()
+        if self.parquet:
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+        self._rows_written += len(rows)
+
+    def get_checkpoint_marker(self) -> int:
+        # An open writer leaves the file without its footer, so the file is
+        # finalized and copied aside; the next batch rewrites it from the copy.
+        self.flush()
+        self._close_writer()
+        if self._rows_written:
+            shutil.copyfile(self.path, self._checkpoint_path)
+        return self._rows_written
+
+    def resume_from(self, marker: int) -> None:
+        self._close_writer()
+        if marker and not self._checkpoint_path.exists():
+            logger.warning(f"No checkpoint copy of {self.path}; results before the resume point are lost")
+            marker = 0
+        if not marker and self.path.exists():
+            self.path.unlink()
+        self._rows_written = marker
+
+    def _open_writer(self) -> None:
+        # Neither format can be appended to, so a new file starts with the
+        # rows saved at the last checkpoint, if there was one.
+        saved = None
+        if self._rows_written and self._checkpoint_path.exists():
+            saved = self._read_table(self._checkpoint_path).slice(0, self._rows_written)
+        if self.parquet:
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(str(self.path), self.schema)
+        else:
+            import pyarrow.ipc as ipc
+            self._writer = ipc.new_file(str(self.path), self.schema)
+        if saved is not None:
+            self._writer.write_table(saved)
+
+    def _read_table(self, path: Path):
+        if self.parquet:
+            import pyarrow.parquet as pq
+            return pq.read_table(str(path))
+        import pyarrow.ipc as ipc
+        with ipc.open_file(str(path)) as reader:
+            return reader.read_all()
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _close_file(self) -> None:
+        if self._writer is None and self._checkpoint_path.exists():
+            # Nothing was written since the last checkpoint (or since a
+            # resume), so its copy is the complete file.
+            os.replace(self._checkpoint_path, self.path)
+            return
+        self._close_writer()
+        if self._checkpoint_path.exists():
+            self._checkpoint_path.unlink()
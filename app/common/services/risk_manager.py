@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import Optional
 
 from app.common.models.model_account import AccountRisk
@@ -14,12 +15,13 @@ logger = logging.getLogger(__name__)
 class RiskManager:
     """Manages account-level risk thresholds (take profit, stop loss, break-even)."""
 
-    def __init__(self) -> None:
+    def __init__(self, risk_path: Optional[Path] = None) -> None:
+        self.risk_path = risk_path
         self._risk: Optional[AccountRisk] = None
 
     def initialize(self) -> None:
         try:
-            self._risk = load_account_risk()
+            self._risk = load_account_risk(self.risk_path)
             logger.info(
                 "Account risk loaded: stop_loss=%s, take_profit=%s, break_even=%s, "
                 "profit_level=%s, take_profit_week=%s",
@@ -33,6 +35,14 @@ class RiskManager:
             logger.error("Failed to load account risk configuration: %s", error)
             self._risk = None
 
+    def get_checkpoint_state(self) -> Optional[AccountRisk]:
+        """Return the current thresholds, including in-session changes such as the break-even stop."""
+        return self._risk
+
+    def restore_checkpoint_state(self, risk: Optional[AccountRisk]) -> None:
+        """Restore thresholds returned by get_checkpoint_state when a backtest resumes."""
+        self._risk = risk
+
     @property
     def stop_loss(self) -> Optional[float]:
         return self._risk.stop_loss if self._risk else None
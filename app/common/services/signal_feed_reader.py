@@ -0,0 +1,35 @@
+"""Reads signal-provider JSON feeds once per file version, for every strategy and account stack that uses them."""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SignalFeedReader:
+    """Caches each signal feed's parsed payload until the file's modification time changes."""
+
+    def __init__(self) -> None:
+        # engine threads of an engine host read the same feeds concurrently
+        self._lock = threading.Lock()
+        self._feeds: Dict[Path, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+    def read(self, feed_path: Path) -> Tuple[Optional[float], Optional[Dict[str, Any]]]:
+        """Return the feed's mtime and payload: (None, None) if it doesn't exist, a None payload if it's empty."""
+        try:
+            modified_time = feed_path.stat().st_mtime
+        except FileNotFoundError:
+            return None, None
+
+        with self._lock:
+            cached = self._feeds.get(feed_path)
+            if cached is not None and cached[0] == modified_time:
+                return cached
+
+            raw_data = feed_path.read_text(encoding="utf-8")
+            payload = json.loads(raw_data) if raw_data.strip() else None
+            self._feeds[feed_path] = (modified_time, payload)
+            return modified_time, payload
@@ -0,0 +1,80 @@
+"""Storage backends for StateManager's flat key -> JSON-value state, plus the default whole-file JSON backend."""
+
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class StateBackend(ABC):
+    """Persists StateManager's flat state: one entry per trade id plus `_`-prefixed metadata keys."""
+
+    @abstractmethod
+    def load(self) -> Dict[str, Any]:
+        """Return the full persisted state."""
+        pass
+
+    @abstractmethod
+    def record_set(self, key: str, value: Any) -> None:
+        """Stage that `key` now holds `value`; durable only after the next flush()."""
+        pass
+
+    @abstractmethod
+    def record_delete(self, key: str) -> None:
+        """Stage the removal of `key`; durable only after the next flush()."""
+        pass
+
+    @abstractmethod
+    def replace_all(self, state: Dict[str, Any]) -> None:
+        """Stage `state` as the complete new contents, discarding every other key."""
+        pass
+
+    @abstractmethod
+    def flush(self, state: Dict[str, Any]) -> None:
+        """Make every staged change durable; `state` is the full current state, for snapshot-style backends."""
+        pass
+
+    def close(self) -> None:
+        """Release any open file or database handle."""
+        pass
+
+
+class JsonStateBackend(StateBackend):
+    """Rewrites the whole state file on every flush, via a temp file and an atomic rename."""
+
+    def __init__(self, state_path: Path) -> None:
+        self.state_path = state_path
+
+    def load(self) -> Dict[str, Any]:
+        if not self.state_path.exists():
+            return {}
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+
+    def record_set(self, key: str, value: Any) -> None:
+        pass
+
+    def record_delete(self, key: str) -> None:
+        pass
+
+    def replace_all(self, state: Dict[str, Any]) -> None:
+        pass
+
+    def flush(self, state: Dict[str, Any]) -> None:
+        write_json_atomic(self.state_path, state)
+
+
+def write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    """Write `data` to a sibling temp file, fsync it, then rename it over `path`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
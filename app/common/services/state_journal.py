@@ -0,0 +1,127 @@
+"""Append-only write-ahead journal over a JSON state snapshot, replayed on load and periodically compacted."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, IO, Optional
+
+from app.common.services.state_backend import StateBackend, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_OP_SET = "set"
+JOURNAL_OP_DELETE = "del"
+
+# journal entries accumulated before a flush folds them back into the snapshot
+JOURNAL_COMPACT_EVERY_ENTRIES = 2000
+
+
+class JournalStateBackend(StateBackend):
+    """Append-only write-ahead journal over a JSON state snapshot, replayed on load and periodically compacted."""
+
+    def __init__(self, snapshot_path: Path, journal_path: Path) -> None:
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self._journal_file: Optional[IO[str]] = None
+        self._entries_since_compaction = 0
+        self._unflushed_entries = 0
+
+    def load(self) -> Dict[str, Any]:
+        """Return the snapshot with every journal entry replayed on top of it, then compact."""
+        state = self._replay()
+        self.compact(state)
+        return state
+
+    def _replay(self) -> Dict[str, Any]:
+        state: Dict[str, Any] = {}
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if isinstance(snapshot, dict):
+                state = snapshot
+
+        self._entries_since_compaction = 0
+        if not self.journal_path.exists():
+            return state
+
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError as error:
+                    # Only the tail can be torn (a crash mid-append); everything
+                    # before it was a complete, ordered write and is kept.
+                    logger.warning(
+                        "Stopping state journal replay at torn line %s of %s: %s",
+                        line_number, self.journal_path, error,
+                    )
+                    break
+                self._apply(state, entry)
+                self._entries_since_compaction += 1
+        return state
+
+    def record_set(self, key: str, value: Any) -> None:
+        self._append({"op": JOURNAL_OP_SET, "key": key, "value": value})
+
+    def record_delete(self, key: str) -> None:
+        self._append({"op": JOURNAL_OP_DELETE, "key": key})
+
+    def replace_all(self, state: Dict[str, Any]) -> None:
+        # set/del entries can't express "drop every other key", so a full
+        # replacement goes straight to a fresh snapshot.
+        self.compact(state)
+
+    def flush(self, state: Dict[str, Any]) -> None:
+        if self._entries_since_compaction >= JOURNAL_COMPACT_EVERY_ENTRIES:
+            self.compact(state)
+        else:
+            self._fsync_journal()
+
+    def compact(self, state: Dict[str, Any]) -> None:
+        """Atomically replace the snapshot with `state` and truncate the journal."""
+        write_json_atomic(self.snapshot_path, state)
+
+        # A crash between the replace above and this truncate is harmless:
+        # replaying set/del entries on top of a snapshot that already contains
+        # them is idempotent.
+        self.close()
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+        self._entries_since_compaction = 0
+        logger.debug("State journal compacted into %s", self.snapshot_path)
+
+    def close(self) -> None:
+        if self._journal_file is None:
+            return
+        self._fsync_journal()
+        self._journal_file.close()
+        self._journal_file = None
+
+    def _fsync_journal(self) -> None:
+        if self._journal_file is None or not self._unflushed_entries:
+            return
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+        self._unflushed_entries = 0
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        if self._journal_file is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal_file = open(self.journal_path, "a", encoding="utf-8")
+        self._journal_file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._entries_since_compaction += 1
+        self._unflushed_entries += 1
+
+    @staticmethod
+    def _apply(state: Dict[str, Any], entry: Dict[str, Any]) -> None:
+        op = entry.get("op")
+        key = entry.get("key")
+        if op == JOURNAL_OP_SET:
+            state[key] = entry.get("value")
+        elif op == JOURNAL_OP_DELETE:
+            state.pop(key, None)
+        else:
+            logger.warning("Skipping unknown state journal entry: %s", entry)
@@ -1,9 +1,11 @@
 """This module defines classes related to StateManager."""
-import json
+import functools
 import logging
+import threading
+from contextlib import contextmanager
 from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Union, Any
 from app.common.services.platform_time import PlatformTime
 from app.common.config.constants import (
     DATETIME_FORMAT,
@@ -13,6 +15,8 @@ from app.common.config.constants import (
     TRADE_DIRECTION_SELL,
 )
 from app.common.models.model_trade import TradeRecord
+from app.common.services.trade_store import TradeStore
+from app.common.services.state_backend import StateBackend, JsonStateBackend
 from app.common.models.model_account import AccountSnapshot
 from app.base.base_account import Account
 from app.common.models.model_news import FaireconomyEvent
@@ -22,14 +26,34 @@ logger = logging.getLogger(__name__)
 TradeLike = Union[TradeRecord, Dict[str, Any]]
 
 
+def _synchronized(method):
+    """Run the method under the StateManager's lock; engine evaluation threads share one instance."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class StateManager:
     """Persists and queries trade state, account snapshots, and daily risk status."""
 
-    def __init__(self, state_path: Path, account: Account, persist_enabled: bool = True) -> None:
+    def __init__(
+        self,
+        state_path: Path,
+        account: Account,
+        persist_enabled: bool = True,
+        backend: Optional[StateBackend] = None,
+    ) -> None:
         self.state_path = state_path
         self.persist_enabled = persist_enabled
+        self.backend: StateBackend = backend if backend is not None else JsonStateBackend(state_path)
         self.state: Dict[str, Dict[str, Any]] = {}
-        self._cache: Dict[str, TradeRecord] = {}
+        self._trades = TradeStore()
+        self._dirty = False
+        self._batch_depth = 0
+        # reentrant: public methods call save()/flush() and each other
+        self._lock = threading.RLock()
         self.account = account
         self.state = self.load()
 
@@ -39,84 +63,119 @@ class StateManager:
     def load(self) -> Dict[str, Dict[str, Any]]:
         if not self.persist_enabled:
             return {}
-        if self.state_path.exists():
-            with open(self.state_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    self._cache = {}
-                    for tid, tdata in data.items():
-                        k = self._key(tid)
-                        if k.startswith("_") or not isinstance(tdata, dict):
-                            continue
-                        try:
-                            self._cache[k] = TradeRecord(**tdata)
-                        except Exception as error:
-                            logger.warning("Could not load persisted trade '%s' into cache: %s", tid, error)
-                    return {self._key(k): v for k, v in data.items()}
-        return {}
-
-    def _persist(self, state: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
-        if not self.persist_enabled:
-            return
-        if state is None:
-            state = self.state
-        with open(self.state_path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=4)
+        data = self.backend.load()
+        self._index_trades(data)
+        return {self._key(k): v for k, v in data.items()}
+
+    def _index_trades(self, data: Dict[str, Any]) -> None:
+        self._trades.clear()
+        for tid, tdata in data.items():
+            k = self._key(tid)
+            if k.startswith("_") or not isinstance(tdata, dict):
+                continue
+            try:
+                self._trades.add(k, TradeRecord.from_dict(tdata))
+            except Exception as error:
+                logger.warning("Could not load persisted trade '%s' into the trade store: %s", tid, error)
 
+    @_synchronized
     def save(self) -> None:
         if not self.persist_enabled:
             return
-        self._persist()
+        if self._batch_depth:
+            return
+        self.flush()
+
+    @_synchronized
+    def flush(self) -> None:
+        """Write pending changes to disk once; a no-op when nothing changed since the last flush."""
+        if not self.persist_enabled or not self._dirty:
+            return
+        self.backend.flush(self.state)
+        self._dirty = False
+
+    @_synchronized
+    def close(self) -> None:
+        """Flush pending changes and release the storage backend."""
+        self.flush()
+        if self.persist_enabled:
+            self.backend.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer every save() inside the block to a single flush at the end, skipped if nothing changed."""
+        # Only the depth counter is guarded: the block itself runs without the
+        # lock, so evaluation threads keep working (and deferring) inside it.
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+
+    def _set(self, key: str, value: Any, mark_dirty: bool = True) -> None:
+        if self.state.get(key) == value:
+            return
+        self.state[key] = value
+        if self.persist_enabled:
+            self.backend.record_set(key, value)
+        self._dirty = self._dirty or mark_dirty
 
+    def _delete(self, key: str) -> None:
+        if key not in self.state:
+            return
+        del self.state[key]
+        if self.persist_enabled:
+            self.backend.record_delete(key)
+        self._dirty = True
+
+    @_synchronized
     def add_trade(self, trade: TradeRecord) -> None:
         if not isinstance(trade, TradeRecord):
             raise TypeError(f"add_trade expected TradeRecord, got {type(trade).__name__}")
         k = self._key(trade.id)
-        self._cache[k] = trade
-        self.state[k] = asdict(trade)
+        self._trades.add(k, trade)
+        self._set(k, trade.to_dict())
         self.save()
 
+    @_synchronized
     def save_all_trades(self, trades: List[TradeLike]) -> None:
         meta = {k: v for k, v in self.state.items() if self._key(k).startswith("_")}
         new_trades: Dict[str, Dict[str, Any]] = {}
-        new_cache: Dict[str, TradeRecord] = {}
+        new_store = TradeStore()
         for item in trades:
             if isinstance(item, TradeRecord):
                 k = self._key(item.id)
-                new_trades[k] = asdict(item)
-                new_cache[k] = item
+                new_trades[k] = item.to_dict()
+                new_store.add(k, item)
             elif isinstance(item, dict) and "id" in item:
                 k = self._key(item["id"])
                 new_trades[k] = item
                 try:
-                    new_cache[k] = TradeRecord(**item)
+                    new_store.add(k, TradeRecord.from_dict(item))
                 except Exception as error:
-                    logger.warning("Could not cache trade '%s': %s", item.get("id"), error)
+                    logger.warning("Could not add trade '%s' to the trade store: %s", item.get("id"), error)
             else:
                 raise TypeError("save_all_trades expects TradeRecord or dicts with an 'id' key")
         self.state = {**meta, **new_trades}
-        self._cache = new_cache
+        self._trades = new_store
+        if self.persist_enabled:
+            self.backend.replace_all(self.state)
+        self._dirty = True
         self.save()
 
+    @_synchronized
     def get_trade_by_id(self, trade_id: str) -> Optional[TradeRecord]:
-        k = self._key(trade_id)
-        cached = self._cache.get(k)
-        if cached is not None:
-            return cached
-        trade = self.state.get(k)
-        if isinstance(trade, dict):
-            obj = TradeRecord(**trade)
-            self._cache[k] = obj
-            return obj
-        return None
+        return self._trades.get(self._key(trade_id))
 
+    @_synchronized
     def get_all_trades(self) -> List[TradeRecord]:
-        return [
-            self._cache.get(k) or self._cache.setdefault(k, TradeRecord(**v))
-            for k, v in self.state.items()
-            if not str(k).startswith("_") and isinstance(v, dict)
-        ]
+        return self._trades.get_all()
 
+    @_synchronized
     def count_trades_today(
         self,
         strategy: Optional[str] = None,
@@ -125,63 +184,35 @@ class StateManager:
     ) -> int:
         count = 0
         today = PlatformTime.now().date()
-        for key, trade in self.state.items():
-            if str(key).startswith("_"):
-                continue
-            if not isinstance(trade, dict):
-                continue
-            try:
-                opened_dt = PlatformTime.strptime(trade.get("timestamp"), DATETIME_FORMAT)
-            except Exception:
-                continue
-            if opened_dt.date() != today:
-                continue
-            if strategy is not None and trade.get("strategy") != strategy:
+        for trade in self._trades.find_opened_on(today):
+            if strategy is not None and trade.strategy != strategy:
                 continue
-            if symbol is not None and trade.get("symbol") != symbol:
+            if symbol is not None and trade.symbol != symbol:
                 continue
-            if trade_type is not None and trade.get("type") != trade_type:
+            if trade_type is not None and trade.type != trade_type:
                 continue
             count += 1
         return count
 
+    @_synchronized
     def clean_old_closed_trades(self, max_age_hours: int = 24) -> None:
-        cutoff = PlatformTime.now() - PlatformTime.timedelta(hours=max_age_hours)
-        new_state: Dict[str, Dict[str, Any]] = {}
-        for trade_id, trade in self.state.items():
-            if str(trade_id).startswith("_"):
-                new_state[trade_id] = trade
-                continue
-            if not isinstance(trade, dict):
-                new_state[trade_id] = trade
-                continue
-            status = trade.get("status")
-            exit_time_str = trade.get("exit_time")
-            if status != TRADE_STATUS_CLOSED:
-                new_state[trade_id] = trade
-                continue
-            try:
-                exit_time = PlatformTime.strptime(exit_time_str, DATETIME_FORMAT)
-                if exit_time > cutoff:
-                    new_state[trade_id] = trade
-            except Exception:
-                new_state[trade_id] = trade
-        self.state = new_state
-        removed = set(self._cache.keys()) - set(self.state.keys())
-        for k in removed:
-            self._cache.pop(k, None)
+        cutoff = (PlatformTime.now() - PlatformTime.timedelta(hours=max_age_hours)).timestamp()
+        expired_keys = []
+        for trade in self._trades.find(status=TRADE_STATUS_CLOSED):
+            exit_epoch = trade.get_exit_epoch(PlatformTime.get_timezone())
+            if exit_epoch is not None and exit_epoch <= cutoff:
+                expired_keys.append(self._key(trade.id))
+        for k in expired_keys:
+            self._trades.remove(k)
+            self._delete(k)
         self.save()
 
+    @_synchronized
     def clean_last_event(self) -> None:
-        cleaned_state = {}
-        for state_key, state_value in self.state.items():
-            if state_key != "_last_event":
-                cleaned_state[state_key] = state_value
-
-        self.state = cleaned_state
-        self._cache.pop("_last_event", None)
+        self._delete("_last_event")
         self.save()
 
+    @_synchronized
     def save_account_snapshot(
         self,
         equity: float,
@@ -220,9 +251,14 @@ class StateManager:
             weekly_profit_reached=bool(weekly_profit_reached),
         )
 
-        self.state["_daily_profit"] = asdict(snapshot)
+        # The timestamp is fresh every cycle; a snapshot that differs only in it
+        # is kept in memory and written with the next real change.
+        values = asdict(snapshot)
+        changed = snapshot_data is None or {**snapshot_data, "timestamp": snapshot.timestamp} != values
+        self._set("_daily_profit", values, mark_dirty=changed)
         self.save()
 
+    @_synchronized
     def save_begin_balances(self) -> None:
         snapshot_data = self.state.get("_daily_profit")
         if not snapshot_data:
@@ -244,9 +280,10 @@ class StateManager:
             target_reached=False,
             break_even_reached=False,
         )
-        self.state["_daily_profit"] = asdict(snapshot)
+        self._set("_daily_profit", asdict(snapshot))
         self.save()
 
+    @_synchronized
     def save_begin_balances_week(self) -> None:
         snapshot_data = self.state.get("_daily_profit")
         if not snapshot_data:
@@ -266,7 +303,7 @@ class StateManager:
             break_even_reached=False,
             weekly_profit_reached=False,
         )
-        self.state["_daily_profit"] = asdict(snapshot)
+        self._set("_daily_profit", asdict(snapshot))
         self.save()
 
     def get_begin_balance(self) -> float:
@@ -335,41 +372,43 @@ class StateManager:
             break_even_reached=break_even_reached,
         )
 
+    @_synchronized
     def get_open_trades(
         self,
         symbol: Optional[str] = None,
         strategy: Optional[str] = None,
         date: Optional[PlatformTime.date] = None,
     ) -> List[TradeRecord]:
-        trades = []
-        for key, trade in self.state.items():
-            if str(key).startswith("_") or not isinstance(trade, dict):
-                continue
-            if trade.get("status") != TRADE_STATUS_OPEN:
-                continue
-            if symbol is not None and trade.get("symbol") != symbol:
-                continue
-            if strategy is not None and trade.get("strategy") != strategy:
-                continue
-            if date:
-                try:
-                    opened = PlatformTime.strptime(trade.get("timestamp"), DATETIME_FORMAT)
-                    if opened.date() != date:
-                        continue
-                except Exception:
-                    continue
-            obj = self._cache.get(key)
-            if obj is None:
-                try:
-                    obj = TradeRecord(**trade)
-                    self._cache[key] = obj
-                except Exception:
-                    continue
-            trades.append(obj)
+        trades = self._trades.find(symbol=symbol, strategy=strategy, status=TRADE_STATUS_OPEN)
+        if date:
+            ordinal = date.toordinal()
+            trades = [t for t in trades if t.get_open_date_ordinal() == ordinal]
         return trades
 
+    @_synchronized
+    def get_checkpoint_state(self) -> Dict[str, Dict[str, Any]]:
+        """Return the full flat state (trades and metadata) for a backtest checkpoint."""
+        return self.state
+
+    @_synchronized
+    def restore_checkpoint_state(self, state: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the whole state with a checkpointed one and re-index its trades."""
+        self.state = state
+        self._index_trades(state)
+        if self.persist_enabled:
+            self.backend.replace_all(state)
+            self._dirty = True
+            self.save()
+
+    @_synchronized
+    def has_open_trades(self) -> bool:
+        """Return True if any trade is currently open."""
+        return self._trades.get_first(status=TRADE_STATUS_OPEN) is not None
+
+    @_synchronized
     def save_server_time_offset(self, offset_hours: float) -> None:
-        self.state["_server_time_offset"] = {"offset_hours": offset_hours}
+        # Not worth a write on its own; rides along with the next real change.
+        self._set("_server_time_offset", {"offset_hours": offset_hours}, mark_dirty=False)
 
     def get_server_time_offset(self) -> Optional[float]:
         offset_info = self.state.get("_server_time_offset")
@@ -377,18 +416,22 @@ class StateManager:
             return offset_info.get("offset_hours")
         return None
 
+    @_synchronized
     def save_server_last_tick(self, last_tick: int) -> None:
-        self.state["_server_last_tick"] = {"last_tick": last_tick}
+        self._set("_server_last_tick", {"last_tick": last_tick}, mark_dirty=False)
 
     def get_server_last_tick(self) -> Optional[int]:
         last_tick_info = self.state.get("_server_last_tick")
         if isinstance(last_tick_info, dict):
             return last_tick_info.get("last_tick")
 
+    @_synchronized
     def save_ctrader_refresh_token(self, refresh_token: str) -> None:
         """Save the current cTrader refresh token; persists immediately."""
-        self.state["_ctrader_refresh_token"] = {"refresh_token": refresh_token}
-        self.save()
+        self._set("_ctrader_refresh_token", {"refresh_token": refresh_token})
+        # Spotware has already invalidated the previous token, so this can't
+        # wait for the end of an engine batch.
+        self.flush()
 
     def get_ctrader_refresh_token(self) -> Optional[str]:
         """Return the last persisted cTrader refresh token, if any."""
@@ -397,76 +440,28 @@ class StateManager:
             return token_info.get("refresh_token")
         return None
 
+    @_synchronized
     def get_last_trade(self, symbol: str, strategy: Optional[str] = None) -> Optional[TradeRecord]:
-        matching = [
-            t for t in self.get_all_trades()
-            if t.symbol == symbol
-            and (strategy is None or t.strategy == strategy)
-        ]
-        if not matching:
-            return None
-
-        latest = matching[0]
-        for t in matching:
-            if t.id > latest.id:
-                latest = t
-        return latest
+        return self._trades.get_last(symbol=symbol, strategy=strategy)
 
+    @_synchronized
     def get_last_open_trade(self, symbol: str, strategy: Optional[str] = None) -> Optional[TradeRecord]:
-        matching_open = [
-            t for t in self.get_all_trades()
-            if t.symbol == symbol
-            and t.status.lower() == TRADE_STATUS_OPEN
-            and (strategy is None or t.strategy == strategy)
-        ]
-
-        if not matching_open:
-            return None
-
-        latest = matching_open[0]
-        for trade in matching_open:
-            if trade.id > latest.id:
-                latest = trade
-        return latest
+        return self._trades.get_last(symbol=symbol, strategy=strategy, status=TRADE_STATUS_OPEN)
 
+    @_synchronized
     def get_first_open_trade(self, symbol: str, strategy: Optional[str] = None) -> Optional[TradeRecord]:
-        earliest = None
-
-        for trade in self.get_all_trades():
-            if trade.symbol != symbol:
-                continue
-            if trade.status.lower() != TRADE_STATUS_OPEN:
-                continue
-            if strategy is not None and trade.strategy != strategy:
-                continue
-
-            if earliest is None or trade.id < earliest.id:
-                earliest = trade
-        return earliest
+        return self._trades.get_first(symbol=symbol, strategy=strategy, status=TRADE_STATUS_OPEN)
 
+    @_synchronized
     def get_last_closed_trade(self, symbol: str, strategy: Optional[str] = None) -> Optional[TradeRecord]:
-        closed_trades = [
-            t for t in self.get_all_trades()
-            if t.symbol == symbol
-            and t.status.lower() == TRADE_STATUS_CLOSED
-            and (strategy is None or t.strategy == strategy)
-        ]
-
-        if not closed_trades:
-            return None
-
-        latest = closed_trades[0]
-        for t in closed_trades:
-            if t.id > latest.id:
-                latest = t
-
-        return latest
+        return self._trades.get_last(symbol=symbol, strategy=strategy, status=TRADE_STATUS_CLOSED)
 
+    @_synchronized
     def save_last_event(
         self,
         event: FaireconomyEvent
     ) -> None:
-        self.state["_last_event"] = {
+        self._set("_last_event", {
             "event": {
                 "date": event.date,
                 "timestamp": event.timestamp,
@@ -478,7 +473,7 @@ class StateManager:
                 "previous": event.previous,
             },
             "updated_at": PlatformTime.now().strftime(DATETIME_FORMAT),
-        }
+        })
         self.save()
 
     def get_last_event(self) -> Optional[FaireconomyEvent]:
@@ -504,16 +499,10 @@ class StateManager:
         except Exception:
             return None
 
+    @_synchronized
     def get_floating_profit(self, symbol: Optional[str] = None) -> float:
         total_profit = 0.0
-        for trade in self.get_all_trades():
-            if trade.status != TRADE_STATUS_OPEN:
-                continue
-
-            if symbol is not None:
-                if trade.symbol != symbol:
-                    continue
-
+        for trade in self._trades.find(symbol=symbol, status=TRADE_STATUS_OPEN):
             if trade.profit is not None:
                 total_profit += trade.profit
 
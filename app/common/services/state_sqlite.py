@@ -0,0 +1,160 @@
+"""SQLite state backend: one row per trade with indexed lookup columns, plus a key-value table for metadata."""
+
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.common.config.constants import SQLITE_BUSY_TIMEOUT_SECONDS
+from app.common.services.state_backend import StateBackend
+
+logger = logging.getLogger(__name__)
+
+CREATE_TRADES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS trades (
+    id TEXT PRIMARY KEY,
+    symbol TEXT,
+    strategy TEXT,
+    status TEXT,
+    timestamp TEXT,
+    exit_time TEXT,
+    data TEXT NOT NULL
+)
+"""
+
+CREATE_METADATA_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+)
+"""
+
+CREATE_INDEXES_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_trades_symbol_strategy_status ON trades (symbol, strategy, status)",
+    "CREATE INDEX IF NOT EXISTS idx_trades_status ON trades (status)",
+    "CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades (timestamp)",
+)
+
+UPSERT_TRADE_SQL = """
+INSERT INTO trades (id, symbol, strategy, status, timestamp, exit_time, data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    symbol = excluded.symbol,
+    strategy = excluded.strategy,
+    status = excluded.status,
+    timestamp = excluded.timestamp,
+    exit_time = excluded.exit_time,
+    data = excluded.data
+"""
+
+UPSERT_METADATA_SQL = """
+INSERT INTO metadata (key, value) VALUES (?, ?)
+ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+
+
+class SqliteStateBackend(StateBackend):
+    """Stores each trade as its own row and each `_`-prefixed key in a metadata table; flush() commits."""
+
+    def __init__(self, db_path: Path, seed_path: Optional[Path] = None) -> None:
+        self.db_path = db_path
+        self.seed_path = seed_path
+        self._conn: Optional[sqlite3.Connection] = None
+        # One connection shared by the engine's evaluation threads; every use goes through this lock.
+        self._lock = threading.RLock()
+
+    def load(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            state: Dict[str, Any] = {}
+            for key, value in conn.execute("SELECT key, value FROM metadata"):
+                state[key] = json.loads(value)
+            for trade_id, data in conn.execute("SELECT id, data FROM trades"):
+                state[trade_id] = json.loads(data)
+
+            if not state and self.seed_path is not None and self.seed_path.exists():
+                state = self._load_seed()
+                if state:
+                    self.replace_all(state)
+                    conn.commit()
+                    logger.info("Seeded state database %s from %s (%s keys)", self.db_path, self.seed_path, len(state))
+            return state
+
+    def record_set(self, key: str, value: Any) -> None:
+        with self._lock:
+            conn = self._connect()
+            if key.startswith("_"):
+                conn.execute(UPSERT_METADATA_SQL, (key, json.dumps(value)))
+                return
+            conn.execute(UPSERT_TRADE_SQL, self._trade_row(key, value))
+
+    def record_delete(self, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            if key.startswith("_"):
+                conn.execute("DELETE FROM metadata WHERE key = ?", (key,))
+            else:
+                conn.execute("DELETE FROM trades WHERE id = ?", (key,))
+
+    def replace_all(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM trades")
+            conn.execute("DELETE FROM metadata")
+            for key, value in state.items():
+                self.record_set(key, value)
+
+    def flush(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+        # WAL lets readers (reporting, a second process peeking at state) run
+        # alongside the engine's writes; NORMAL is still crash-safe under WAL
+        # and skips an fsync per commit.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(CREATE_TRADES_TABLE_SQL)
+        conn.execute(CREATE_METADATA_TABLE_SQL)
+        for statement in CREATE_INDEXES_SQL:
+            conn.execute(statement)
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def _load_seed(self) -> Dict[str, Any]:
+        try:
+            with open(self.seed_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as error:
+            logger.warning("Could not seed state database from %s: %s", self.seed_path, error)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _trade_row(key: str, value: Any) -> tuple:
+        fields = value if isinstance(value, dict) else {}
+        return (
+            key,
+            fields.get("symbol"),
+            fields.get("strategy"),
+            (fields.get("status") or "").lower() or None,
+            fields.get("timestamp"),
+            fields.get("exit_time"),
+            json.dumps(value),
+        )
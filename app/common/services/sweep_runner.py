@@ -0,0 +1,164 @@
+"""Fans a backtest parameter sweep out over a process pool and ranks the collected summaries."""
+
+import csv
+import itertools
+import json
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from app.base.base_strategy import Strategy
+from app.common.config.constants import SWEEP_MODE_RANDOM
+from app.common.models.model_sweep import SweepConfig, SweepParameter, SweepRunResult
+
+logger = logging.getLogger(__name__)
+
+# run_backtest(run_id, overrides, run_dir) -> BacktestSummary.summary; must be a
+# module-level function so worker processes can unpickle it
+BacktestRunner = Callable[[int, Dict[SweepParameter, Any], Path], Dict[str, Any]]
+
+# how many draws random mode may spend looking for combinations it hasn't tried yet
+RANDOM_SEARCH_ATTEMPTS_PER_SAMPLE = 20
+
+
+def format_parameter(parameter: SweepParameter) -> str:
+    """Return a sweep parameter as 'strategy/symbol/field'."""
+    return "/".join(parameter)
+
+
+def expand_sweep(config: SweepConfig) -> List[Dict[SweepParameter, Any]]:
+    """Return the list of override sets to run: the full grid, or distinct random samples from it."""
+    parameters = list(config.parameters)
+    value_lists = [config.parameters[parameter] for parameter in parameters]
+
+    if config.mode != SWEEP_MODE_RANDOM:
+        return [dict(zip(parameters, values)) for values in itertools.product(*value_lists)]
+
+    rng = random.Random(config.seed)
+    grid_size = 1
+    for values in value_lists:
+        grid_size *= len(values)
+    target = min(config.samples, grid_size)
+
+    seen = set()
+    runs = []
+    for _ in range(target * RANDOM_SEARCH_ATTEMPTS_PER_SAMPLE):
+        if len(runs) == target:
+            break
+        indices = tuple(rng.randrange(len(values)) for values in value_lists)
+        if indices in seen:
+            continue
+        seen.add(indices)
+        runs.append({parameter: value_lists[i][index] for i, (parameter, index) in enumerate(zip(parameters, indices))})
+    return runs
+
+
+def apply_asset_overrides(strategies: List[Strategy], overrides: Dict[SweepParameter, Any]) -> int:
+    """Set each override on the matching strategies' AssetConfigs; returns how many values were set."""
+    applied = 0
+    for (strategy_name, symbol, field_name), value in overrides.items():
+        for strategy in strategies:
+            if strategy.config.name != strategy_name:
+                continue
+            for asset in strategy.config.assets:
+                if symbol != "*" and asset.symbol != symbol:
+                    continue
+                if not hasattr(asset, field_name):
+                    raise ValueError(
+                        f"AssetConfig has no field '{field_name}' (sweep parameter {strategy_name}/{symbol})"
+                    )
+                setattr(asset, field_name, value)
+                applied += 1
+    return applied
+
+
+def get_score(result: SweepRunResult, rank_by: str) -> float:
+    """Return the run's summary value for `rank_by`; failed or unscored runs get -inf."""
+    value = result.summary.get(rank_by)
+    return float(value) if result.error is None and isinstance(value, (int, float)) else float("-inf")
+
+
+def rank_results(results: List[SweepRunResult], rank_by: str) -> List[SweepRunResult]:
+    """Return the runs best-first by their summary value for `rank_by`."""
+    return sorted(results, key=lambda result: get_score(result, rank_by), reverse=True)
+
+
+class SweepRunner:
+    """Runs every override set of a sweep as an isolated backtest in its own worker process."""
+
+    def __init__(self, config: SweepConfig, run_backtest: BacktestRunner, results_dir: Path) -> None:
+        self.config = config
+        self.run_backtest = run_backtest
+        self.results_dir = results_dir
+
+    def run(self) -> List[SweepRunResult]:
+        """Run the sweep, write the ranked results table, and return the results best-first."""
+        runs = expand_sweep(self.config)
+        workers = self.config.workers or os.cpu_count() or 1
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Starting sweep: {len(runs)} run(s) on {workers} worker(s), results in {self.results_dir}")
+
+        results: List[SweepRunResult] = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self.run_backtest, run_id, overrides, self.results_dir / f"run_{run_id:04d}"):
+                    SweepRunResult(run_id=run_id, overrides=overrides)
+                for run_id, overrides in enumerate(runs, start=1)
+            }
+            for future in as_completed(futures):
+                result = futures[future]
+                try:
+                    result.summary = future.result()
+                except Exception as error:
+                    # One bad parameter combination shouldn't sink the whole sweep.
+                    logger.error(f"Sweep run {result.run_id} failed: {error}")
+                    result.error = str(error)
+                results.append(result)
+                logger.info(f"Sweep progress: {len(results)}/{len(runs)} run(s) done")
+
+        ranked = rank_results(results, self.config.rank_by)
+        self._write_results(ranked)
+        return ranked
+
+    def _write_results(self, ranked: List[SweepRunResult]) -> None:
+        parameters = list(self.config.parameters)
+        table_path = self.results_dir / "results.csv"
+        with open(table_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["rank", "run_id", *(format_parameter(p) for p in parameters),
+                 "total_profit", "final_balance", "trades", "max_drawdown", "sharpe_ratio", "profit_factor", "error"]
+            )
+            for rank, result in enumerate(ranked, start=1):
+                analytics = result.summary.get("analytics", {})
+                writer.writerow([
+                    rank,
+                    result.run_id,
+                    *(result.overrides.get(p) for p in parameters),
+                    result.summary.get("total_profit"),
+                    result.summary.get("final_balance"),
+                    analytics.get("trades"),
+                    analytics.get("max_drawdown"),
+                    analytics.get("sharpe_ratio"),
+                    analytics.get("profit_factor"),
+                    result.error or "",
+                ])
+
+        with open(self.results_dir / "results.json", "w", encoding="utf-8") as f:
+            json.dump(
+                [
+                    {
+                        "run_id": result.run_id,
+                        "overrides": {format_parameter(p): v for p, v in result.overrides.items()},
+                        "summary": result.summary,
+                        "error": result.error,
+                    }
+                    for result in ranked
+                ],
+                f,
+                indent=4,
+            )
+        logger.info(f"Sweep results written to {table_path}")
@@ -0,0 +1,166 @@
+"""In-memory TradeRecord store with secondary indexes by symbol, strategy, status and open date."""
+
+import logging
+from datetime import date
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from app.common.models.model_trade import TradeRecord
+
+logger = logging.getLogger(__name__)
+
+# (symbol, strategy, status) — any part may be None, meaning "any value"
+BucketKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+class _TradeBucket:
+    """Trades sharing one index key, plus incrementally maintained first/last-by-id pointers."""
+
+    __slots__ = ("trades", "first_id", "last_id")
+
+    def __init__(self) -> None:
+        self.trades: Dict[str, TradeRecord] = {}
+        self.first_id: Optional[str] = None
+        self.last_id: Optional[str] = None
+
+    def add(self, trade_key: str, trade: TradeRecord) -> None:
+        """Insert a trade and move the first/last pointers if it extends either end."""
+        self.trades[trade_key] = trade
+        if self.first_id is None or trade.id < self.trades[self.first_id].id:
+            self.first_id = trade_key
+        if self.last_id is None or trade.id > self.trades[self.last_id].id:
+            self.last_id = trade_key
+
+    def remove(self, trade_key: str) -> None:
+        """Drop a trade, rescanning this bucket only if it held the first or last pointer."""
+        if self.trades.pop(trade_key, None) is None:
+            return
+        if not self.trades:
+            self.first_id = None
+            self.last_id = None
+            return
+        if trade_key == self.first_id:
+            self.first_id = min(self.trades, key=lambda k: self.trades[k].id)
+        if trade_key == self.last_id:
+            self.last_id = max(self.trades, key=lambda k: self.trades[k].id)
+
+
+class TradeStore:
+    """In-memory TradeRecord store with secondary indexes by symbol, strategy, status and open date."""
+
+    def __init__(self) -> None:
+        self._trades: Dict[str, TradeRecord] = {}
+        self._buckets: Dict[BucketKey, _TradeBucket] = {}
+        self._by_open_date: Dict[int, Dict[str, TradeRecord]] = {}
+        # Index keys a trade was filed under, remembered separately because
+        # callers mutate TradeRecords in place (e.g. status -> closed) before
+        # calling add() again — the object itself no longer says where it was.
+        self._bucket_keys_by_id: Dict[str, Tuple[BucketKey, ...]] = {}
+        self._open_date_by_id: Dict[str, Optional[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._trades)
+
+    def __contains__(self, trade_key: str) -> bool:
+        return trade_key in self._trades
+
+    def clear(self) -> None:
+        """Drop every trade and index."""
+        self._trades.clear()
+        self._buckets.clear()
+        self._by_open_date.clear()
+        self._bucket_keys_by_id.clear()
+        self._open_date_by_id.clear()
+
+    def add(self, trade_key: str, trade: TradeRecord) -> None:
+        """Insert a trade, or re-file it under its current symbol/strategy/status if already present."""
+        if trade_key in self._trades:
+            self._unindex(trade_key)
+        self._trades[trade_key] = trade
+
+        status = (trade.status or "").lower()
+        bucket_keys = tuple(product((trade.symbol, None), (trade.strategy, None), (status, None)))
+        for bucket_key in bucket_keys:
+            self._buckets.setdefault(bucket_key, _TradeBucket()).add(trade_key, trade)
+        self._bucket_keys_by_id[trade_key] = bucket_keys
+
+        open_date = trade.get_open_date_ordinal()
+        if open_date is None:
+            logger.warning("Could not index open date for trade '%s' (%s)", trade.id, trade.timestamp)
+        self._open_date_by_id[trade_key] = open_date
+        if open_date is not None:
+            self._by_open_date.setdefault(open_date, {})[trade_key] = trade
+
+    def remove(self, trade_key: str) -> Optional[TradeRecord]:
+        """Remove a trade from the store and every index; returns it if it was present."""
+        if trade_key not in self._trades:
+            return None
+        self._unindex(trade_key)
+        return self._trades.pop(trade_key)
+
+    def get(self, trade_key: str) -> Optional[TradeRecord]:
+        """Return the trade stored under `trade_key`, if any."""
+        return self._trades.get(trade_key)
+
+    def get_all(self) -> List[TradeRecord]:
+        """Return every stored trade in insertion order."""
+        return list(self._trades.values())
+
+    def find(
+        self,
+        symbol: Optional[str] = None,
+        strategy: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[TradeRecord]:
+        """Return trades matching every given filter, served from a single index bucket."""
+        bucket = self._buckets.get(self._bucket_key(symbol, strategy, status))
+        return list(bucket.trades.values()) if bucket else []
+
+    def get_first(
+        self,
+        symbol: Optional[str] = None,
+        strategy: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Optional[TradeRecord]:
+        """Return the matching trade with the lowest id."""
+        bucket = self._buckets.get(self._bucket_key(symbol, strategy, status))
+        if not bucket or bucket.first_id is None:
+            return None
+        return bucket.trades[bucket.first_id]
+
+    def get_last(
+        self,
+        symbol: Optional[str] = None,
+        strategy: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> Optional[TradeRecord]:
+        """Return the matching trade with the highest id."""
+        bucket = self._buckets.get(self._bucket_key(symbol, strategy, status))
+        if not bucket or bucket.last_id is None:
+            return None
+        return bucket.trades[bucket.last_id]
+
+    def find_opened_on(self, open_date: date) -> List[TradeRecord]:
+        """Return trades whose open timestamp falls on `open_date`."""
+        return list(self._by_open_date.get(open_date.toordinal(), {}).values())
+
+    @staticmethod
+    def _bucket_key(symbol: Optional[str], strategy: Optional[str], status: Optional[str]) -> BucketKey:
+        return symbol, strategy, status.lower() if status else None
+
+    def _unindex(self, trade_key: str) -> None:
+        for bucket_key in self._bucket_keys_by_id.pop(trade_key, ()):
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                continue
+            bucket.remove(trade_key)
+            if not bucket.trades:
+                del self._buckets[bucket_key]
+
+        open_date = self._open_date_by_id.pop(trade_key, None)
+        if open_date is not None:
+            trades_on_date = self._by_open_date.get(open_date)
+            if trades_on_date is not None:
+                trades_on_date.pop(trade_key, None)
+                if not trades_on_date:
+                    del self._by_open_date[open_date]
@@ -0,0 +1,257 @@
+"""Walk-forward optimization: sweeps rolling in-sample windows and tests each winner on the window after it."""
+
+import csv
+import json
+import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.common.models.model_sweep import (
+    BacktestWindow,
+    SweepParameter,
+    SweepRunResult,
+    WalkForwardConfig,
+    WalkForwardWindow,
+)
+from app.common.services.backtest_analytics import get_drawdown, get_risk_ratios
+from app.common.services.sweep_runner import expand_sweep, format_parameter, get_score, rank_results
+
+logger = logging.getLogger(__name__)
+
+# run_backtest(run_id, overrides, run_dir, window) -> BacktestSummary.summary; must be
+# a module-level function so worker processes can unpickle it
+WindowRunner = Callable[[int, Dict[SweepParameter, Any], Path, BacktestWindow], Dict[str, Any]]
+
+WINDOW_DATE_FORMAT = "%d-%m-%Y"
+# where run_single_backtest's BacktestSummary leaves each run's equity curve
+EQUITY_CURVE_FILE = "summary_equity.npz"
+
+
+def split_windows(date_from: str, date_to: str, config: WalkForwardConfig) -> List[WalkForwardWindow]:
+    """Return the rolling in-sample/out-of-sample windows that fit between `date_from` and `date_to`."""
+    start = datetime.strptime(date_from, WINDOW_DATE_FORMAT)
+    end = datetime.strptime(date_to, WINDOW_DATE_FORMAT)
+    in_sample = timedelta(days=config.in_sample_days)
+    out_of_sample = timedelta(days=config.out_of_sample_days)
+    step = timedelta(days=config.step_days or config.out_of_sample_days)
+
+    windows = []
+    # A window's end date is the next one's start date, as with
+    # BACKTEST_DATE_TO, which stops at that date's midnight.
+    while start + in_sample < end:
+        split = start + in_sample
+        # the last out-of-sample window is cut short at the end of history
+        oos_end = min(split + out_of_sample, end)
+        windows.append(WalkForwardWindow(
+            number=len(windows) + 1,
+            in_sample=BacktestWindow(start.strftime(WINDOW_DATE_FORMAT), split.strftime(WINDOW_DATE_FORMAT)),
+            out_of_sample=BacktestWindow(split.strftime(WINDOW_DATE_FORMAT), oos_end.strftime(WINDOW_DATE_FORMAT)),
+        ))
+        start += step
+    return windows
+
+
+class WalkForwardRunner:
+    """Runs every window's in-sample sweep and out-of-sample test on one shared process pool."""
+
+    def __init__(self, config: WalkForwardConfig, run_backtest: WindowRunner, results_dir: Path) -> None:
+        self.config = config
+        self.run_backtest = run_backtest
+        self.results_dir = results_dir
+
+    def run(self, date_from: str, date_to: str) -> List[WalkForwardWindow]:
+        """Walk forward over `date_from`→`date_to`, write the out-of-sample report, and return the windows."""
+        windows = split_windows(date_from, date_to, self.config)
+        if not windows:
+            raise ValueError(
+                f"{date_from}→{date_to} is too short for a {self.config.in_sample_days}-day in-sample window"
+            )
+        runs = expand_sweep(self.config.sweep)
+        workers = self.config.sweep.workers or os.cpu_count() or 1
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+        logger.info(
+            f"Starting walk-forward: {len(windows)} window(s) x {len(runs)} in-sample run(s) "
+            f"on {workers} worker(s), results in {self.results_dir}"
+        )
+
+        in_sample_results: Dict[int, List[SweepRunResult]] = {window.number: [] for window in windows}
+        # future -> (window, in-sample run result, or None for the out-of-sample run)
+        pending: Dict[Future, Tuple[WalkForwardWindow, Optional[SweepRunResult]]] = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Every window's in-sample runs are queued at once; a window's
+            # out-of-sample run joins the queue as soon as its sweep is done,
+            # so the pool never waits on the slowest window.
+            for window in windows:
+                for run_id, overrides in enumerate(runs, start=1):
+                    future = pool.submit(
+                        self.run_backtest, run_id, overrides, self._get_run_dir(window, run_id), window.in_sample
+                    )
+                    pending[future] = (window, SweepRunResult(run_id=run_id, overrides=overrides))
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window, result = pending.pop(future)
+                    if result is None:
+                        self._collect_out_of_sample(window, future)
+                        continue
+
+                    self._collect(result, future, window)
+                    in_sample_results[window.number].append(result)
+                    if len(in_sample_results[window.number]) < len(runs):
+                        continue
+                    if self._select_best(window, in_sample_results[window.number]):
+                        oos_future = pool.submit(
+                            self.run_backtest,
+                            0,
+                            window.best_overrides,
+                            self._get_run_dir(window, 0),
+                            window.out_of_sample,
+                        )
+                        pending[oos_future] = (window, None)
+
+        self._write_report(windows)
+        return windows
+
+    def _get_run_dir(self, window: WalkForwardWindow, run_id: int) -> Path:
+        name = "out_of_sample" if run_id == 0 else f"in_sample_{run_id:04d}"
+        return self.results_dir / f"window_{window.number:03d}" / name
+
+    @staticmethod
+    def _collect(result: SweepRunResult, future: Future, window: WalkForwardWindow) -> None:
+        try:
+            result.summary = future.result()
+        except Exception as error:
+            # One bad parameter combination shouldn't sink the whole window.
+            logger.error(f"Walk-forward window {window.number} in-sample run {result.run_id} failed: {error}")
+            result.error = str(error)
+
+    def _select_best(self, window: WalkForwardWindow, results: List[SweepRunResult]) -> bool:
+        best = rank_results(results, self.config.sweep.rank_by)[0]
+        if best.error is not None:
+            window.error = f"every in-sample run failed ({best.error})"
+            logger.error(f"Walk-forward window {window.number}: {window.error}")
+            return False
+
+        window.best_overrides = best.overrides
+        window.in_sample_score = get_score(best, self.config.sweep.rank_by)
+        logger.info(
+            f"Walk-forward window {window.number}: in-sample {window.in_sample.date_from}→{window.in_sample.date_to} "
+            f"best {self.config.sweep.rank_by}={window.in_sample_score} with "
+            f"{ {format_parameter(p): v for p, v in best.overrides.items()} }"
+        )
+        return True
+
+    def _collect_out_of_sample(self, window: WalkForwardWindow, future: Future) -> None:
+        try:
+            window.out_of_sample_summary = future.result()
+        except Exception as error:
+            logger.error(f"Walk-forward window {window.number} out-of-sample run failed: {error}")
+            window.error = str(error)
+            return
+        logger.info(
+            f"Walk-forward window {window.number}: out-of-sample {window.out_of_sample.date_from}→"
+            f"{window.out_of_sample.date_to} total_profit={window.out_of_sample_summary.get('total_profit')}"
+        )
+
+    def _stitch_equity(self, windows: List[WalkForwardWindow]) -> Tuple[np.ndarray, np.ndarray]:
+        """Chain the out-of-sample equity curves, each window starting from the balance the previous one ended on."""
+        timestamp_parts: List[np.ndarray] = []
+        equity_parts: List[np.ndarray] = []
+        balance: Optional[float] = None
+        for window in windows:
+            curve_path = self._get_run_dir(window, 0) / EQUITY_CURVE_FILE
+            if window.error is not None or not curve_path.exists():
+                continue
+            with np.load(curve_path) as curve:
+                timestamps = curve["timestamps"]
+                equity = curve["equity"]
+            if timestamp_parts and len(timestamps):
+                # consecutive windows share their boundary midnight
+                keep = timestamps > timestamp_parts[-1][-1]
+                timestamps, equity = timestamps[keep], equity[keep]
+            if not len(equity):
+                continue
+
+            deposit = float(window.out_of_sample_summary.get("initial_deposit", equity[0]))
+            if balance is None:
+                balance = deposit
+            equity_parts.append(equity - deposit + balance)
+            timestamp_parts.append(timestamps)
+            balance = float(equity_parts[-1][-1])
+
+        if not equity_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        return np.concatenate(timestamp_parts), np.concatenate(equity_parts)
+
+    def _write_report(self, windows: List[WalkForwardWindow]) -> None:
+        timestamps, equity = self._stitch_equity(windows)
+        np.savez_compressed(self.results_dir / "walk_forward_equity.npz", timestamps=timestamps, equity=equity)
+
+        stitched: Dict[str, Any] = {
+            "windows": len(windows),
+            "failed_windows": sum(1 for window in windows if window.error is not None),
+            "out_of_sample_profit": round(
+                sum(float(window.out_of_sample_summary.get("total_profit") or 0.0) for window in windows), 2
+            ),
+        }
+        stitched.update(get_drawdown(equity))
+        stitched.update(get_risk_ratios(timestamps.tolist(), equity))
+
+        parameters = list(self.config.sweep.parameters)
+        table_path = self.results_dir / "walk_forward.csv"
+        with open(table_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                "window", "in_sample_from", "in_sample_to", "out_of_sample_from", "out_of_sample_to",
+                *(format_parameter(p) for p in parameters),
+                f"in_sample_{self.config.sweep.rank_by}", "out_of_sample_profit",
+                "out_of_sample_max_drawdown", "out_of_sample_sharpe_ratio", "error",
+            ])
+            for window in windows:
+                analytics = window.out_of_sample_summary.get("analytics", {})
+                writer.writerow([
+                    window.number,
+                    window.in_sample.date_from,
+                    window.in_sample.date_to,
+                    window.out_of_sample.date_from,
+                    window.out_of_sample.date_to,
+                    *((window.best_overrides or {}).get(p) for p in parameters),
+                    window.in_sample_score,
+                    window.out_of_sample_summary.get("total_profit"),
+                    analytics.get("max_drawdown"),
+                    analytics.get("sharpe_ratio"),
+                    window.error or "",
+                ])
+
+        with open(self.results_dir / "walk_forward.json", "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "stitched": stitched,
+                    "windows": [
+                        {
+                            "window": window.number,
+                            "in_sample": [window.in_sample.date_from, window.in_sample.date_to],
+                            "out_of_sample": [window.out_of_sample.date_from, window.out_of_sample.date_to],
+                            "best_overrides": {
+                                format_parameter(p): v for p, v in (window.best_overrides or {}).items()
+                            },
+                            "in_sample_score": window.in_sample_score,
+                            "out_of_sample_summary": window.out_of_sample_summary,
+                            "error": window.error,
+                        }
+                        for window in windows
+                    ],
+                },
+                f,
+                indent=4,
+            )
+        logger.info(
+            f"Walk-forward report written to {table_path}: out-of-sample profit {stitched['out_of_sample_profit']}, "
+            f"max drawdown {stitched['max_drawdown']}"
+        )
@@ -13,7 +13,7 @@ from app.common.config.constants import (
     TIME_REFERENCE_SYMBOL,
 )
 from app.common.services.platform_time import PlatformTime
-from app.connectors.ctrader.ctrader_session import CTraderSession, PRICE_SCALE
+from app.connectors.ctrader.ctrader_session import CTraderSession, PendingRequest, PRICE_SCALE
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +21,6 @@ logger = logging.getLogger(__name__)
 TRADE_SIDE_BUY = 1
 TRADE_SIDE_SELL = 2
 
-# ProtoOAPositionStatus enum values.
-POSITION_STATUS_OPEN = 1
-
 
 class CTraderAccount(Account):
     """cTrader implementation of the Account interface."""
@@ -39,9 +36,14 @@ class CTraderAccount(Account):
         return self._money(trader.balance, trader.moneyDigits)
 
     def get_equity(self) -> float:
-        trader = self.session.get_trader()
+        trader, pnl_entries = self.session.gather(
+            self.session.get_trader_async(),
+            self.session.get_unrealized_pnl_async(),
+        )
+        return self._equity(trader, pnl_entries)
+
+    def _equity(self, trader, pnl_entries) -> float:
         balance = self._money(trader.balance, trader.moneyDigits)
-        pnl_entries = self.session.get_unrealized_pnl()
         unrealized = sum(self._money(p.netUnrealizedPnL, trader.moneyDigits) for p in pnl_entries)
         return balance + unrealized
 
@@ -65,15 +67,27 @@ class CTraderAccount(Account):
         return 0.0
 
     def get_free_margin(self, symbol: str) -> float:
-        equity = self.get_equity()
-        reconcile = self.session.reconcile()
-        trader = self.session.get_trader()
+        return self._free_margin(*self.session.gather(*self._free_margin_requests()))
+
+    def _free_margin_requests(self) -> List[PendingRequest]:
+        return [
+            self.session.get_trader_async(),
+            self.session.get_unrealized_pnl_async(),
+            self.session.reconcile_async(),
+        ]
+
+    def _free_margin(self, trader, pnl_entries, reconcile) -> float:
         used_margin = sum(self._money(pos.usedMargin, trader.moneyDigits) for pos in reconcile.position)
-        return equity - used_margin
+        return self._equity(trader, pnl_entries) - used_margin
 
     def get_margin_required(self, order: OrderRequest) -> float:
+        return self._margin_required(order, self.session.gather(self._margin_required_request(order))[0])
+
+    def _margin_required_request(self, order: OrderRequest) -> PendingRequest:
         api_volume = self.session.lots_to_api_volume(order.symbol, order.lot_size)
-        response = self.session.get_expected_margin(order.symbol, api_volume)
+        return self.session.get_expected_margin_async(order.symbol, api_volume)
+
+    def _margin_required(self, order: OrderRequest, response) -> float:
         if not response.margin:
             return 0.0
         margin_entry = response.margin[0]
@@ -82,8 +96,13 @@ class CTraderAccount(Account):
 
     def has_sufficient_margin(self, order: OrderRequest) -> bool:
         try:
-            margin_required = self.get_margin_required(order)
-            free_margin = self.get_free_margin(order.symbol)
+            # expected margin and the three account reads go out together: one round-trip
+            margin_response, *account_reads = self.session.gather(
+                self._margin_required_request(order),
+                *self._free_margin_requests(),
+            )
+            margin_required = self._margin_required(order, margin_response)
+            free_margin = self._free_margin(*account_reads)
             return margin_required <= free_margin
         except Exception as e:
             logger.warning(f"Margin check failed for {order.symbol} (lot size {order.lot_size}): {e}", exc_info=True)
@@ -93,12 +112,7 @@ class CTraderAccount(Account):
         return self.session.ctid_trader_account_id or 0
 
     def get_open_tickets(self) -> List[str]:
-        reconcile = self.session.reconcile()
-        return [
-            str(pos.positionId)
-            for pos in reconcile.position
-            if pos.positionStatus == POSITION_STATUS_OPEN
-        ]
+        return [str(pos.positionId) for pos in self.session.get_open_positions()]
 
     def get_closed_tickets(self, lookback_hours: int = 24) -> List[TradeRecord]:
         now = PlatformTime.now()
@@ -108,11 +122,11 @@ class CTraderAccount(Account):
         start_ms = int((true_utc_now - PlatformTime.timedelta(hours=lookback_hours)).timestamp() * 1000)
         end_ms = int((true_utc_now + PlatformTime.timedelta(hours=lookback_hours)).timestamp() * 1000)
 
-        deals = self.session.deal_list(start_ms, end_ms)
+        deals = self.session.get_closing_deals(start_ms, end_ms)
 
         closed_tickets = []
         for deal in deals:
-            if not deal.HasField("closePositionDetail") or deal.volume <= 0:
+            if deal.volume <= 0:
                 continue
 
             light_symbol = self.session._symbols_by_id.get(deal.symbolId)
@@ -0,0 +1,101 @@
+"""In-memory book of the cTrader account's open positions and recent closing deals, fed by ProtoOAExecutionEvents."""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# ProtoOAPositionStatus enum values.
+POSITION_STATUS_OPEN = 1
+
+# ProtoOADealStatus values of deals that actually executed.
+DEAL_STATUS_FILLED = 2
+DEAL_STATUS_PARTIALLY_FILLED = 3
+EXECUTED_DEAL_STATUSES = (DEAL_STATUS_FILLED, DEAL_STATUS_PARTIALLY_FILLED)
+
+
+class CTraderPositionBook:
+    """Open positions and closing deals as last reported by the server; seeded by reconcile, then kept by events."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._open_positions: Dict[int, Any] = {}  # positionId -> ProtoOAPosition
+        self._closing_deals: Dict[int, Any] = {}  # dealId -> ProtoOADeal with closePositionDetail
+        self._seeded = False
+        # events that arrived while a seed was in flight, replayed on top of it
+        self._pending_events: Optional[List[Any]] = None
+
+    def is_seeded(self) -> bool:
+        with self._lock:
+            return self._seeded
+
+    def begin_seed(self) -> None:
+        """Start recording execution events; call before sending the reconcile and deal list requests."""
+        with self._lock:
+            self._pending_events = []
+
+    def finish_seed(self, positions: Iterable[Any], deals: Iterable[Any]) -> None:
+        """Replace the book with a reconcile's positions and a deal list, then replay events received meanwhile."""
+        with self._lock:
+            self._open_positions = {
+                position.positionId: position
+                for position in positions
+                if position.positionStatus == POSITION_STATUS_OPEN
+            }
+            self._closing_deals = {deal.dealId: deal for deal in deals if deal.HasField("closePositionDetail")}
+            # The responses may predate these events, so they are applied
+            # again; applying an event twice leaves the same book.
+            for event in self._pending_events or []:
+                self._apply(event)
+            self._pending_events = None
+            self._seeded = True
+        logger.info(
+            f"cTrader position book seeded: {len(self._open_positions)} open position(s), "
+            f"{len(self._closing_deals)} closing deal(s)."
+        )
+
+    def abort_seed(self) -> None:
+        """Stop recording after a failed seed; the book keeps what it had."""
+        with self._lock:
+            self._pending_events = None
+
+    def invalidate(self) -> None:
+        """Mark the book stale, e.g. on disconnect, when events may have been missed."""
+        with self._lock:
+            self._seeded = False
+
+    def apply_execution_event(self, event: Any) -> None:
+        """Update the book from one ProtoOAExecutionEvent."""
+        with self._lock:
+            if self._pending_events is not None:
+                self._pending_events.append(event)
+            self._apply(event)
+
+    def get_open_positions(self) -> List[Any]:
+        with self._lock:
+            return list(self._open_positions.values())
+
+    def get_closing_deals(self, from_timestamp_ms: int, to_timestamp_ms: int) -> List[Any]:
+        """Return closing deals executed in the window and forget any older than its start."""
+        with self._lock:
+            self._closing_deals = {
+                deal_id: deal
+                for deal_id, deal in self._closing_deals.items()
+                if deal.executionTimestamp >= from_timestamp_ms
+            }
+            return [deal for deal in self._closing_deals.values() if deal.executionTimestamp <= to_timestamp_ms]
+
+    def _apply(self, event: Any) -> None:
+        if event.HasField("position"):
+            position = event.position
+            if position.positionStatus == POSITION_STATUS_OPEN:
+                self._open_positions[position.positionId] = position
+            else:
+                self._open_positions.pop(position.positionId, None)
+        if (
+            event.HasField("deal")
+            and event.deal.HasField("closePositionDetail")
+            and event.deal.dealStatus in EXECUTED_DEAL_STATUSES
+        ):
+            self._closing_deals[event.deal.dealId] = event.deal
@@ -8,9 +8,24 @@ is the bridge between the two worlds:
 - The Twisted reactor runs once per process, on a dedicated daemon thread.
 - All requests that have a real Req/Res pair (auth, symbols, trader info,
   reconcile, deal list, trendbars, spot subscriptions, SL/TP amendment) go
-  through `_request()`, which uses `blockingCallFromThread` to hand the send
-  to the reactor thread and block the calling (engine) thread until the
-  matching response arrives or times out.
+  through `_request_async()`, which hands the send to the reactor thread with
+  its own `clientMsgId` and returns at once with a `PendingRequest`. Any
+  number of them can be in flight on the one connection; `gather()` blocks
+  the calling (engine) thread until all of them have answered or timed out,
+  so a composite read like free margin (trader + reconcile + unrealized PnL)
+  costs one round-trip instead of one per request. `_request()` is the
+  single-request shorthand.
+- Open positions and recent closing deals live in a `CTraderPositionBook`,
+  seeded by one reconcile + deal list at connect (and on every reconnect),
+  then kept current from `ProtoOAExecutionEvent`s; the reconcile/deal-list
+  pair only runs again every `POSITION_BOOK_RECONCILE_SECONDS` as a check.
+- Symbol metadata is loaded in bulk: the symbol and asset lists at connect,
+  then full details for every strategy symbol in one `ProtoOASymbolByIdReq`
+  (`preload_symbols()`), refreshed in the background on
+  `ProtoOASymbolChangedEvent`, so no order path waits on a metadata read.
+- Trader, reconcile and unrealized-PnL reads form an account snapshot that
+  is reused for `ACCOUNT_SNAPSHOT_TTL_SECONDS` (so once per engine cycle),
+  and dropped early by every `ProtoOAExecutionEvent`.
 - Order execution (`ProtoOANewOrderReq` / `ProtoOAClosePositionReq`) has no
   matching Res message in this API — confirmation arrives asynchronously as a
   `ProtoOAExecutionEvent`. Those are correlated via `clientOrderId` (for new
@@ -57,12 +72,14 @@ import queue
 import threading
 import time
 import uuid
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from app.common.config.constants import ENVIRONMENT_PRODUCTION
+from app.common.config.constants import ENVIRONMENT_PRODUCTION, TIME_REFERENCE_SYMBOL
 from app.common.models.model_connector import ConnectorConfig
 from app.common.models.model_symbol import SpotPrice
 from app.common.services.state_manager import StateManager
+from app.connectors.ctrader.ctrader_position_book import CTraderPositionBook
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +89,8 @@ DEFAULT_TIMEOUT_SECONDS = 10
 CONNECT_TIMEOUT_SECONDS = 20
 # How long to wait for an order's ExecutionEvent confirmation.
 EXECUTION_TIMEOUT_SECONDS = 15
+# How long a spot subscription waits for its symbols' first ticks, all together.
+FIRST_TICK_TIMEOUT_SECONDS = 5
 
 # cTrader Open API represents prices (spot bid/ask, trendbar low + deltas) as
 # fixed-point integers scaled by 10^5, independent of the symbol's own display
@@ -92,6 +111,38 @@ ACCESS_TOKEN_REFRESH_INTERVAL_SECONDS = 20 * 24 * 60 * 60  # 20 days
 # access token (confirmed via Spotware community forum, not in the proto enum).
 AUTH_TOKEN_EXPIRED_ERROR_CODE = "OA_AUTH_TOKEN_EXPIRED"
 
+# Extra wait on top of a request's own timeout, which the client enforces on
+# the reactor; this one only guards against a response that never settles.
+RESPONSE_GRACE_SECONDS = 2
+
+# How long trader / reconcile / unrealized-PnL responses are reused. Well
+# under the engine's 30s cycle, so every cycle reads the account once and
+# every asset in it shares that read; an ExecutionEvent drops them sooner.
+ACCOUNT_SNAPSHOT_TTL_SECONDS = 10
+
+# The position book follows ExecutionEvents; this full re-seed only catches
+# anything an event could not tell it.
+POSITION_BOOK_RECONCILE_SECONDS = 15 * 60
+# Symbols whose details are needed outside any strategy's assets:
+# get_server_offset_hours reads the time reference's trading schedule and
+# get_tick_value converts JPY-quoted profits through USDJPY.
+SUPPORT_SYMBOLS = (TIME_REFERENCE_SYMBOL, "USDJPY")
+
+# Closing deals loaded into the position book when it is seeded; matches
+# CTraderAccount.get_closed_tickets' default lookback.
+POSITION_BOOK_DEAL_LOOKBACK_HOURS = 24
+
+
+class PendingRequest:
+    """A request already sent on the session's connection; `CTraderSession.gather()` waits for its result."""
+
+    def __init__(self, message: Any, future: Future, timeout: int, extract: Callable[[Any], Any]) -> None:
+        self.message = message
+        self.future = future
+        self.timeout = timeout
+        # turns the Res message into what the caller wants, e.g. response.trader
+        self.extract = extract
+
 
 class CTraderSession:
     """Process-wide singleton wrapping one cTrader Open API connection."""
@@ -133,10 +184,19 @@ class CTraderSession:
         # live spot cache, keyed by symbolId -> SpotPrice
         self._spot_cache: Dict[int, SpotPrice] = {}
         self._subscribed_symbol_ids: set = set()
+        # symbolId -> set once its first spot tick is in the cache
+        self._first_tick_events: Dict[int, threading.Event] = {}
 
         # assetId -> name (e.g. "USD"), used to resolve a symbol's profit currency
         self._assets_by_id: Dict[int, str] = {}
 
+        # account snapshot: Req class name -> (monotonic send time, PendingRequest)
+        self._account_reads: Dict[str, Tuple[float, "PendingRequest"]] = {}
+
+        self._position_book = CTraderPositionBook()
+        self._position_book_seeded_at = 0.0
+        self._position_book_lock = threading.Lock()
+
         # order execution correlation
         self._order_waiters: Dict[str, "queue.Queue"] = {}
         self._close_waiters: Dict[int, "queue.Queue"] = {}
@@ -175,6 +235,7 @@ class CTraderSession:
             self._verify_account_access()
             self._authenticate_account()
             self._load_symbols()
+            self._seed_position_book()
 
             with self._state_lock:
                 self._account_authenticated = True
@@ -278,6 +339,9 @@ class CTraderSession:
         with self._state_lock:
             self._app_authenticated = False
             self._account_authenticated = False
+            self._account_reads.clear()
+        # Events sent while disconnected are lost; the next read re-seeds.
+        self._position_book.invalidate()
         self._connected_event.clear()
 
     # ------------------------------------------------------------------
@@ -358,20 +422,66 @@ class CTraderSession:
     # ------------------------------------------------------------------
 
     def _load_symbols(self) -> None:
-        from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOASymbolsListReq
+        from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOAAssetListReq, ProtoOASymbolsListReq
 
-        request = ProtoOASymbolsListReq(ctidTraderAccountId=self.ctid_trader_account_id)
-        response = self._request(request)
+        symbols_response, assets_response = self.gather(
+            self._request_async(ProtoOASymbolsListReq(ctidTraderAccountId=self.ctid_trader_account_id)),
+            self._request_async(ProtoOAAssetListReq(ctidTraderAccountId=self.ctid_trader_account_id)),
+        )
 
         with self._state_lock:
             self._symbols_by_name.clear()
             self._symbols_by_id.clear()
-            for light_symbol in response.symbol:
+            for light_symbol in symbols_response.symbol:
                 self._symbols_by_name[light_symbol.symbolName.upper()] = light_symbol
                 self._symbols_by_id[light_symbol.symbolId] = light_symbol
+            for asset in assets_response.asset:
+                self._assets_by_id[asset.assetId] = asset.name
             self._symbols_loaded = True
+            # on a reconnect, every symbol already in use is refreshed too
+            in_use = [
+                self._symbols_by_id[symbol_id].symbolName
+                for symbol_id in self._symbol_details_by_id
+                if symbol_id in self._symbols_by_id
+            ]
+
+        logger.info(f"Loaded {len(self._symbols_by_name)} cTrader symbols and {len(self._assets_by_id)} assets.")
+        try:
+            self.preload_symbols([*SUPPORT_SYMBOLS, *in_use], refresh=True)
+        except Exception as error:
+            # get_symbol_details still loads each uncached symbol on first use
+            logger.warning(f"Failed to preload cTrader symbol details: {error}")
+
+    def preload_symbols(self, symbols: Iterable[str], refresh: bool = False) -> None:
+        """Load full details for all `symbols` in one ProtoOASymbolByIdReq, skipping cached ones unless `refresh`."""
+        from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOASymbolByIdReq
+
+        symbol_ids = []
+        for symbol in symbols:
+            light = self._symbols_by_name.get(symbol.upper())
+            if light is None:
+                # not every broker lists every support symbol
+                logger.debug(f"Not preloading unknown cTrader symbol: {symbol}")
+                continue
+            symbol_ids.append(light.symbolId)
+
+        with self._state_lock:
+            symbol_ids = [
+                symbol_id
+                for symbol_id in dict.fromkeys(symbol_ids)
+                if refresh or symbol_id not in self._symbol_details_by_id
+            ]
+        if not symbol_ids:
+            return
 
-        logger.info(f"Loaded {len(self._symbols_by_name)} cTrader symbols.")
+        request = ProtoOASymbolByIdReq(ctidTraderAccountId=self.ctid_trader_account_id, symbolId=symbol_ids)
+        self._store_symbol_details(self._request(request).symbol)
+        logger.info(f"Loaded details for {len(symbol_ids)} cTrader symbol(s).")
+
+    def _store_symbol_details(self, details: Iterable[Any]) -> None:
+        with self._state_lock:
+            for symbol in details:
+                self._symbol_details_by_id[symbol.symbolId] = symbol
 
     def resolve_symbol_id(self, symbol: str) -> int:
         light = self._symbols_by_name.get(symbol.upper())
@@ -399,8 +509,7 @@ class CTraderSession:
             raise ValueError(f"cTrader returned no symbol details for {symbol}")
 
         details = response.symbol[0]
-        with self._state_lock:
-            self._symbol_details_by_id[symbol_id] = details
+        self._store_symbol_details([details])
         return details
 
     def get_light_symbol(self, symbol: str) -> Any:
@@ -447,30 +556,51 @@ class CTraderSession:
 
     def ensure_subscribed(self, symbol: str) -> int:
         """Ensure a live spot subscription is active for `symbol`; returns its symbolId."""
-        symbol_id = self.resolve_symbol_id(symbol)
+        return self.subscribe_spots([symbol])[0]
+
+    def subscribe_spots(self, symbols: List[str]) -> List[int]:
+        """Subscribe all not yet subscribed symbols in one request, wait for their first ticks, return the symbolIds."""
+        symbol_ids = [self.resolve_symbol_id(symbol) for symbol in symbols]
 
         with self._state_lock:
-            if symbol_id in self._subscribed_symbol_ids:
-                return symbol_id
+            new_ids = [
+                symbol_id for symbol_id in dict.fromkeys(symbol_ids) if symbol_id not in self._subscribed_symbol_ids
+            ]
+        if not new_ids:
+            return symbol_ids
 
         from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOASubscribeSpotsReq
 
         request = ProtoOASubscribeSpotsReq(
             ctidTraderAccountId=self.ctid_trader_account_id,
-            symbolId=[symbol_id],
+            symbolId=new_ids,
         )
         self._request(request)
 
         with self._state_lock:
-            self._subscribed_symbol_ids.add(symbol_id)
-
-        # Spot ticks arrive asynchronously after subscribing; give the first one
-        # a moment to land so callers get real prices instead of a cache miss.
-        deadline = time.time() + 5
-        while symbol_id not in self._spot_cache and time.time() < deadline:
-            time.sleep(0.1)
-
-        return symbol_id
+            self._subscribed_symbol_ids.update(new_ids)
+
+        # Spot ticks arrive asynchronously after subscribing; give the first
+        # ones a moment to land so callers get real prices instead of a cache
+        # miss. The symbols share one deadline, so this waits for the slowest
+        # of them rather than for each in turn.
+        deadline = time.monotonic() + FIRST_TICK_TIMEOUT_SECONDS
+        missing = [
+            symbol_id
+            for symbol_id in new_ids
+            if not self._get_first_tick_event(symbol_id).wait(max(0.0, deadline - time.monotonic()))
+        ]
+        if missing:
+            names = [
+                self._symbols_by_id[symbol_id].symbolName for symbol_id in missing if symbol_id in self._symbols_by_id
+            ]
+            logger.warning(f"No first spot tick within {FIRST_TICK_TIMEOUT_SECONDS}s for cTrader symbols: {names}")
+
+        return symbol_ids
+
+    def _get_first_tick_event(self, symbol_id: int) -> threading.Event:
+        with self._state_lock:
+            return self._first_tick_events.setdefault(symbol_id, threading.Event())
 
     def get_spot(self, symbol: str) -> SpotPrice:
         symbol_id = self.ensure_subscribed(symbol)
@@ -485,38 +615,110 @@ class CTraderSession:
     # ------------------------------------------------------------------
 
     def get_trader(self) -> Any:
+        return self.gather(self.get_trader_async())[0]
+
+    def get_trader_async(self) -> PendingRequest:
+        """Send a ProtoOATraderReq without waiting; gather() returns the ProtoOATrader."""
         from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOATraderReq
 
         request = ProtoOATraderReq(ctidTraderAccountId=self.ctid_trader_account_id)
-        response = self._request(request)
-        return response.trader
+        return self._account_read(request, extract=lambda response: response.trader)
 
     def get_unrealized_pnl(self) -> List[Any]:
+        return self.gather(self.get_unrealized_pnl_async())[0]
+
+    def get_unrealized_pnl_async(self) -> PendingRequest:
+        """Send a ProtoOAGetPositionUnrealizedPnLReq without waiting; gather() returns the per-position entries."""
         from ctrader_open_api.messages.OpenApiMessages_pb2 import (
             ProtoOAGetPositionUnrealizedPnLReq,
         )
 
         request = ProtoOAGetPositionUnrealizedPnLReq(ctidTraderAccountId=self.ctid_trader_account_id)
-        response = self._request(request)
-        return list(response.positionUnrealizedPnL)
+        return self._account_read(request, extract=lambda response: list(response.positionUnrealizedPnL))
 
     def reconcile(self) -> Any:
+        return self.gather(self.reconcile_async())[0]
+
+    def reconcile_async(self) -> PendingRequest:
+        """Send a ProtoOAReconcileReq without waiting; gather() returns the ProtoOAReconcileRes."""
         from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOAReconcileReq
 
         request = ProtoOAReconcileReq(ctidTraderAccountId=self.ctid_trader_account_id)
-        return self._request(request)
+        return self._account_read(request)
 
-    def deal_list(self, from_timestamp_ms: int, to_timestamp_ms: int, max_rows: int = 500) -> List[Any]:
-        from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOADealListReq
+    def _account_read(
+        self, message, extract: Callable[[Any], Any] = lambda response: response
+    ) -> PendingRequest:
+        """Return the account snapshot's pending read for this request type, sending it only when stale."""
+        key = message.__class__.__name__
+        with self._state_lock:
+            cached = self._account_reads.get(key)
+            if cached is not None:
+                sent_at, request = cached
+                # Reusing the pending request (not just its result) also lets
+                # concurrent evaluation threads share one in-flight read.
+                if time.monotonic() - sent_at < ACCOUNT_SNAPSHOT_TTL_SECONDS and not self._has_failed(request):
+                    return PendingRequest(request.message, request.future, request.timeout, extract)
+            request = self._request_async(message, extract=extract)
+            self._account_reads[key] = (time.monotonic(), request)
+            return request
+
+    def _has_failed(self, request: PendingRequest) -> bool:
+        if not request.future.done():
+            return False
+        if request.future.exception() is not None:
+            return True
+        return request.future.result().__class__.__name__ == "ProtoOAErrorRes"
 
-        request = ProtoOADealListReq(
-            ctidTraderAccountId=self.ctid_trader_account_id,
-            fromTimestamp=from_timestamp_ms,
-            toTimestamp=to_timestamp_ms,
-            maxRows=max_rows,
-        )
-        response = self._request(request)
-        return list(response.deal)
+    def invalidate_account_snapshot(self) -> None:
+        """Drop the cached trader/reconcile/PnL reads so the next ones go to the server."""
+        with self._state_lock:
+            self._account_reads.clear()
+
+    def get_open_positions(self) -> List[Any]:
+        """Return the account's open ProtoOAPositions from the position book."""
+        self._ensure_position_book()
+        return self._position_book.get_open_positions()
+
+    def get_closing_deals(self, from_timestamp_ms: int, to_timestamp_ms: int) -> List[Any]:
+        """Return the closing ProtoOADeals executed in the window, from the position book."""
+        self._ensure_position_book()
+        return self._position_book.get_closing_deals(from_timestamp_ms, to_timestamp_ms)
+
+    def _ensure_position_book(self) -> None:
+        if (
+            self._position_book.is_seeded()
+            and time.monotonic() - self._position_book_seeded_at < POSITION_BOOK_RECONCILE_SECONDS
+        ):
+            return
+        self._seed_position_book()
+
+    def _seed_position_book(self) -> None:
+        from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOADealListReq, ProtoOAReconcileReq
+
+        with self._position_book_lock:
+            now_ms = int(time.time() * 1000)
+            self._position_book.begin_seed()
+            try:
+                # Bypasses the account snapshot: the seed must be newer than
+                # every event recorded from here on.
+                reconcile, deals = self.gather(
+                    self._request_async(ProtoOAReconcileReq(ctidTraderAccountId=self.ctid_trader_account_id)),
+                    self._request_async(
+                        ProtoOADealListReq(
+                            ctidTraderAccountId=self.ctid_trader_account_id,
+                            fromTimestamp=now_ms - POSITION_BOOK_DEAL_LOOKBACK_HOURS * 3600 * 1000,
+                            toTimestamp=now_ms,
+                            maxRows=500,
+                        ),
+                        extract=lambda response: list(response.deal),
+                    ),
+                )
+            except Exception:
+                self._position_book.abort_seed()
+                raise
+            self._position_book.finish_seed(reconcile.position, deals)
+            self._position_book_seeded_at = time.monotonic()
 
     def get_trendbars(self, symbol: str, period_enum: int, from_timestamp_ms: int, to_timestamp_ms: int) -> List[Any]:
         from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOAGetTrendbarsReq
@@ -533,6 +735,10 @@ class CTraderSession:
         return list(response.trendbar)
 
     def get_expected_margin(self, symbol: str, api_volume: int) -> Any:
+        return self.gather(self.get_expected_margin_async(symbol, api_volume))[0]
+
+    def get_expected_margin_async(self, symbol: str, api_volume: int) -> PendingRequest:
+        """Send a ProtoOAExpectedMarginReq without waiting; gather() returns the ProtoOAExpectedMarginRes."""
         from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOAExpectedMarginReq
 
         symbol_id = self.resolve_symbol_id(symbol)
@@ -541,7 +747,7 @@ class CTraderSession:
             symbolId=symbol_id,
             volume=[api_volume],
         )
-        return self._request(request)
+        return self._request_async(request)
 
     def amend_position_sl_tp(self, position_id: int, stop_loss: float, take_profit: float) -> Any:
         """Amend an open position's stop-loss / take-profit.
@@ -660,28 +866,85 @@ class CTraderSession:
     # Low-level send helpers
     # ------------------------------------------------------------------
 
-    def _request(self, message, timeout: int = DEFAULT_TIMEOUT_SECONDS, _retried: bool = False) -> Any:
+    def _request(self, message, timeout: int = DEFAULT_TIMEOUT_SECONDS) -> Any:
         """Send a request that has a matching Res message and block for the response."""
+        return self.gather(self._request_async(message, timeout=timeout))[0]
+
+    def _request_async(
+        self,
+        message,
+        timeout: int = DEFAULT_TIMEOUT_SECONDS,
+        extract: Callable[[Any], Any] = lambda response: response,
+    ) -> PendingRequest:
+        """Hand a Req/Res request to the reactor and return without waiting for the response."""
         from ctrader_open_api import Protobuf
         from twisted.internet import reactor
-        from twisted.internet.threads import blockingCallFromThread
 
-        if self._client is None:
+        client = self._client
+        if client is None:
             raise RuntimeError("cTrader client is not connected.")
 
-        raw_response = blockingCallFromThread(
-            reactor, self._client.send, message, None, timeout
-        )
-        response = Protobuf.extract(raw_response)
+        future: Future = Future()
+        # The client keys its response Deferreds by clientMsgId; left unset it
+        # falls back to id(message), which two in-flight requests can share.
+        client_msg_id = uuid.uuid4().hex
+
+        def _on_response(raw_response) -> None:
+            try:
+                future.set_result(Protobuf.extract(raw_response))
+            except Exception as error:
+                future.set_exception(error)
+
+        def _on_failure(failure) -> None:
+            future.set_exception(failure.value)
+
+        def _send() -> None:
+            try:
+                deferred = client.send(message, client_msg_id, timeout)
+            except Exception as error:
+                future.set_exception(error)
+                return
+            deferred.addCallbacks(_on_response, _on_failure)
+
+        reactor.callFromThread(_send)
+        return PendingRequest(message, future, timeout, extract)
 
-        if not _retried and self._is_auth_expired_error(response):
+    def gather(self, *pending: PendingRequest) -> List[Any]:
+        """Wait for requests sent with the *_async methods and return their results in the same order.
+
+        They were all in flight at once, so this costs one round-trip for the
+        whole batch. An expired access token is refreshed once and the
+        affected requests are re-sent; any other error response raises.
+        """
+        responses = [self._wait_for(request) for request in pending]
+
+        if any(self._is_auth_expired_error(response) for response in responses):
             logger.warning("cTrader access token expired mid-session; refreshing and retrying request once.")
             self._refresh_access_token()
             self._authenticate_account()
-            return self._request(message, timeout=timeout, _retried=True)
+            retries = [
+                self._request_async(request.message, timeout=request.timeout)
+                if self._is_auth_expired_error(response)
+                else None
+                for request, response in zip(pending, responses)
+            ]
+            responses = [
+                self._wait_for(retry) if retry is not None else response
+                for retry, response in zip(retries, responses)
+            ]
+
+        results = []
+        for request, response in zip(pending, responses):
+            self._raise_if_error(response)
+            results.append(request.extract(response))
+        return results
 
-        self._raise_if_error(response)
-        return response
+    @staticmethod
+    def _wait_for(request: PendingRequest) -> Any:
+        try:
+            return request.future.result(timeout=request.timeout + RESPONSE_GRACE_SECONDS)
+        except FutureTimeoutError:
+            raise TimeoutError(f"Timed out waiting for the response to {request.message.__class__.__name__}")
 
     @staticmethod
     def _is_auth_expired_error(response: Any) -> bool:
@@ -738,6 +1001,11 @@ class CTraderSession:
                 self._handle_spot_event(payload)
             elif type_name == "ProtoOAExecutionEvent":
                 self._handle_execution_event(payload)
+            elif type_name == "ProtoOASymbolChangedEvent":
+                self._handle_symbol_changed_event(payload)
+            elif type_name == "ProtoOATraderUpdatedEvent":
+                # balance moved outside trading (deposit, withdrawal, adjustment)
+                self.invalidate_account_snapshot()
             elif type_name in ("ProtoOAAccountDisconnectEvent", "ProtoOAClientDisconnectEvent"):
                 logger.warning(f"cTrader disconnect event received: {type_name}")
                 with self._state_lock:
@@ -753,12 +1021,42 @@ class CTraderSession:
             if event.ask:
                 spot.ask = event.ask / PRICE_SCALE
             spot.timestamp = event.timestamp
+            self._first_tick_events.setdefault(event.symbolId, threading.Event()).set()
+
+    def _handle_symbol_changed_event(self, event: Any) -> None:
+        from ctrader_open_api.messages.OpenApiMessages_pb2 import ProtoOASymbolByIdReq
+
+        with self._state_lock:
+            symbol_ids = [symbol_id for symbol_id in event.symbolId if symbol_id in self._symbol_details_by_id]
+        if not symbol_ids:
+            return
+
+        logger.info(f"cTrader symbol details changed for ids {symbol_ids}; refreshing.")
+        # This runs on the reactor thread, which must never block: the old
+        # details stay in use until the new ones arrive.
+        request = self._request_async(
+            ProtoOASymbolByIdReq(ctidTraderAccountId=self.ctid_trader_account_id, symbolId=symbol_ids)
+        )
+        request.future.add_done_callback(self._on_symbol_details_refreshed)
+
+    def _on_symbol_details_refreshed(self, future: Future) -> None:
+        try:
+            response = future.result()
+            self._raise_if_error(response)
+        except Exception as error:
+            logger.warning(f"Failed to refresh changed cTrader symbol details: {error}")
+            return
+        self._store_symbol_details(response.symbol)
 
     def set_execution_event_callback(self, callback) -> None:
         """Register a callback invoked for every incoming ProtoOAExecutionEvent."""
         self._execution_event_callback = callback
 
     def _handle_execution_event(self, event: Any) -> None:
+        # Any fill, close or amend changes balance, margin or positions.
+        self.invalidate_account_snapshot()
+        self._position_book.apply_execution_event(event)
+
         if self._execution_event_callback:
             self._execution_event_callback(event)
 
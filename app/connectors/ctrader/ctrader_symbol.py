@@ -1,7 +1,7 @@
 """cTrader implementation of the Symbol interface."""
 
 import logging
-from typing import Any
+from typing import Any, List
 
 from app.base.base_symbol import Symbol
 from app.common.models.model_symbol import Range
@@ -64,6 +64,29 @@ class CTraderSymbol(Symbol):
             logger.warning(f"Failed to prepare/subscribe cTrader symbol {symbol}: {error}")
             return False
 
+    def prepare_symbols(self, symbols: List[str]) -> None:
+        try:
+            self.session.preload_symbols(symbols)
+        except Exception as error:
+            # get_symbol_details still loads each symbol on first use
+            logger.warning(f"Failed to preload cTrader symbol details: {error}")
+
+        spot_symbols = [symbol for symbol in symbols if self.is_valid_symbol(symbol)]
+        # get_tick_value prices JPY-quoted symbols through USDJPY
+        if self.is_valid_symbol("USDJPY") and any(self._is_jpy_quoted(symbol) for symbol in spot_symbols):
+            spot_symbols.append("USDJPY")
+        try:
+            self.session.subscribe_spots(spot_symbols)
+        except Exception as error:
+            # prepare_symbol still subscribes each symbol on its own
+            logger.warning(f"Failed to bulk-subscribe cTrader spot prices: {error}")
+
+    def _is_jpy_quoted(self, symbol: str) -> bool:
+        try:
+            return self.get_currency_profit(symbol) == "JPY"
+        except Exception:
+            return False
+
     def get_symbol_info(self, symbol: str) -> Any:
         return self.session.get_symbol_details(symbol)
 
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.base.base_account import Account
 from app.common.models.model_trade import OrderRequest, TradeRecord
@@ -26,6 +26,13 @@ class Mt5testerAccount(Account):
     def set_equity(self, new_equity: float) -> None:
         self.equity = new_equity
     
+    def get_checkpoint_state(self) -> Dict[str, float]:
+        return {"balance": self.balance, "equity": self.equity}
+
+    def restore_checkpoint_state(self, state: Dict[str, float]) -> None:
+        self.balance = state["balance"]
+        self.equity = state["equity"]
+
     def get_commission_per_lot(self) -> float:
         return self.commission_per_lot
 
@@ -59,5 +66,5 @@ class Mt5testerAccount(Account):
     def get_server_offset_hours(self) -> Optional[int]:
         return 0
     
-    def get_server_tick_timestanp(self) -> Optional[int]:
+    def get_server_tick_timestamp(self) -> Optional[int]:
         return None
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""On-disk .npy cache of parsed backtest CSV bars, rebuilt only when a source CSV changes."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.connectors.mt5tester.mt5tester_bars import SymbolBars
+
+logger = logging.getLogger(__name__)
+
+# bump when the on-disk layout changes so stale caches get rebuilt, not misread
+BAR_CACHE_VERSION = 1
+BAR_COLUMNS = ("times", "open", "high", "low", "close", "volume")
+
+
+class BarCache:
+    """Maps each symbol/timeframe's CSVs to one memory-mapped .npy file per bar column."""
+
+    def __init__(self, cache_root: Path) -> None:
+        self.cache_root = cache_root
+
+    def warm(self, data_root: Path, timeframe: str) -> int:
+        """Bring every symbol's cache under `data_root` up to date; returns how many symbols have bars."""
+        warmed = 0
+        for symbol_path in data_root.iterdir():
+            if symbol_path.is_dir() and self.load(symbol_path.name.upper(), symbol_path, timeframe) is not None:
+                warmed += 1
+        return warmed
+
+    def load(self, symbol: str, symbol_path: Path, timeframe: str) -> Optional[SymbolBars]:
+        """Return the symbol's bars from cache, rebuilding from CSV first if any source file changed."""
+        csv_files = sorted(symbol_path.glob(f"*_{timeframe}.csv"))
+        if not csv_files:
+            return None
+
+        sources = self._describe_sources(csv_files)
+        prefix = self.cache_root / f"{symbol}_{timeframe}"
+        manifest_path = prefix.with_suffix(".json")
+        if self._read_manifest(manifest_path) != self._manifest(sources):
+            logger.info(f"Rebuilding bar cache for {symbol} {timeframe} from {len(csv_files)} CSV file(s)")
+            bars = self._parse_csv_files(csv_files)
+            try:
+                self._write(bars, prefix, manifest_path, sources)
+            except OSError as error:
+                # On Windows another backtest worker holding the old columns
+                # mapped blocks the replace; this run still has fresh bars.
+                logger.warning(f"Could not write bar cache for {symbol} {timeframe}, using in-memory bars: {error}")
+                return bars
+
+        # mmap_mode="r" lets the OS page bars in on demand and share them
+        # between parallel backtest workers reading the same cache.
+        columns = {name: np.load(self._column_path(prefix, name), mmap_mode="r") for name in BAR_COLUMNS}
+        return SymbolBars(**columns)
+
+    @staticmethod
+    def _parse_csv_files(csv_files: List[Path]) -> SymbolBars:
+        all_dfs = []
+        for csv_file in csv_files:
+            df = pd.read_csv(csv_file, parse_dates=["time"])
+            df.drop_duplicates(subset="time", inplace=True)
+            all_dfs.append(df)
+
+        combined_df = pd.concat(all_dfs)
+        combined_df.set_index("time", inplace=True)
+        combined_df.sort_index(inplace=True)
+        return SymbolBars.from_frame(combined_df)
+
+    def _write(self, bars: SymbolBars, prefix: Path, manifest_path: Path, sources: List[Dict[str, Any]]) -> None:
+        self.cache_root.mkdir(parents=True, exist_ok=True)
+        for name in BAR_COLUMNS:
+            column_path = self._column_path(prefix, name)
+            temp_path = column_path.with_name(column_path.name + ".tmp")
+            with open(temp_path, "wb") as f:
+                np.save(f, getattr(bars, name))
+            os.replace(temp_path, column_path)
+
+        # Written last: a crash mid-build leaves the old (or no) manifest, so
+        # the next start sees a mismatch and rebuilds instead of trusting
+        # half-written columns.
+        temp_manifest = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(temp_manifest, "w", encoding="utf-8") as f:
+            json.dump(self._manifest(sources), f, indent=4)
+        os.replace(temp_manifest, manifest_path)
+
+    @staticmethod
+    def _describe_sources(csv_files: List[Path]) -> List[Dict[str, Any]]:
+        sources = []
+        for csv_file in csv_files:
+            stat = csv_file.stat()
+            sources.append({"name": csv_file.name, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+        return sources
+
+    @staticmethod
+    def _manifest(sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {"version": BAR_CACHE_VERSION, "sources": sources}
+
+    @staticmethod
+    def _read_manifest(manifest_path: Path) -> Optional[Dict[str, Any]]:
+        if not manifest_path.exists():
+            return None
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as error:
+            logger.warning(f"Ignoring unreadable bar cache manifest {manifest_path}: {error}")
+            return None
+
+    @staticmethod
+    def _column_path(prefix: Path, name: str) -> Path:
+        return prefix.with_name(f"{prefix.name}.{name}.npy")
@@ -0,0 +1,132 @@
+"""Contiguous NumPy arrays of one symbol's historical bars, with a forward-moving lookup cursor."""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# bar times are stored as naive-UTC epoch seconds, matching the naive
+# timestamps the CSV exports carry
+_EPOCH = datetime(1970, 1, 1)
+_ONE_SECOND = timedelta(seconds=1)
+SECONDS_PER_DAY = 86400
+
+
+def to_epoch(timestamp: datetime) -> int:
+    """Return a naive (or tz-stripped) datetime as epoch seconds on the bar clock."""
+    return (timestamp.replace(tzinfo=None) - _EPOCH) // _ONE_SECOND
+
+
+def from_epoch(epoch: int) -> datetime:
+    """Return bar-clock epoch seconds as a naive datetime."""
+    return _EPOCH + timedelta(seconds=int(epoch))
+
+
+class SymbolBars:
+    """One symbol's bars as int64 epoch times plus float64 OHLCV columns, sorted by time."""
+
+    __slots__ = ("times", "open", "high", "low", "close", "volume", "_cursor", "_day_spans")
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ) -> None:
+        self.times = times
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self._cursor = 0
+        # day number (epoch // SECONDS_PER_DAY) -> [start, stop) bar indices; built on first range query
+        self._day_spans: Optional[Dict[int, Tuple[int, int]]] = None
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "SymbolBars":
+        """Build from a DataFrame indexed by bar time with open/high/low/close/volume columns."""
+        return cls(
+            times=np.ascontiguousarray(df.index.values.astype("datetime64[s]").astype(np.int64)),
+            open=np.ascontiguousarray(df["open"].to_numpy(dtype=np.float64)),
+            high=np.ascontiguousarray(df["high"].to_numpy(dtype=np.float64)),
+            low=np.ascontiguousarray(df["low"].to_numpy(dtype=np.float64)),
+            close=np.ascontiguousarray(df["close"].to_numpy(dtype=np.float64)),
+            volume=np.ascontiguousarray(df["volume"].to_numpy(dtype=np.float64)),
+        )
+
+    def index_at_or_before(self, epoch: int) -> int:
+        """Return the index of the last bar at or before `epoch`, or -1 if there is none."""
+        times = self.times
+        count = len(times)
+        if not count or epoch < times[0]:
+            return -1
+
+        # The simulation clock only moves forward, so the answer is almost
+        # always the cursor itself or the bar right after it.
+        cursor = self._cursor
+        if times[cursor] <= epoch:
+            following = cursor + 1
+            if following == count or times[following] > epoch:
+                return cursor
+            if following + 1 == count or times[following + 1] > epoch:
+                self._cursor = following
+                return following
+            index = cursor + int(np.searchsorted(times[cursor:], epoch, side="right")) - 1
+        else:
+            index = int(np.searchsorted(times, epoch, side="right")) - 1
+
+        self._cursor = index
+        return index
+
+    def window(self, start_epoch: int, end_epoch: int) -> "SymbolBars":
+        """Return the bars between the two times as array views, without copying."""
+        start, stop = self.slice_between(start_epoch, end_epoch)
+        return SymbolBars(
+            times=self.times[start:stop],
+            open=self.open[start:stop],
+            high=self.high[start:stop],
+            low=self.low[start:stop],
+            close=self.close[start:stop],
+            volume=self.volume[start:stop],
+        )
+
+    def slice_between(self, start_epoch: int, end_epoch: int) -> Tuple[int, int]:
+        """Return the [start, stop) index span of bars with start_epoch <= time <= end_epoch."""
+        start = int(np.searchsorted(self.times, start_epoch, side="left"))
+        stop = int(np.searchsorted(self.times, end_epoch, side="right"))
+        return start, max(start, stop)
+
+    def high_low_between(self, start_epoch: int, end_epoch: int) -> Optional[Tuple[float, float]]:
+        """Return (highest high, lowest low) of bars with start_epoch <= time <= end_epoch, or None if none."""
+        start_day = start_epoch // SECONDS_PER_DAY
+        if start_day == end_epoch // SECONDS_PER_DAY:
+            # Intraday ranges (the common case) only search the one day's bars.
+            day_start, day_stop = self._get_day_spans().get(start_day, (0, 0))
+            day_times = self.times[day_start:day_stop]
+            start = day_start + int(np.searchsorted(day_times, start_epoch, side="left"))
+            stop = day_start + int(np.searchsorted(day_times, end_epoch, side="right"))
+        else:
+            start, stop = self.slice_between(start_epoch, end_epoch)
+        if start >= stop:
+            return None
+        return float(self.high[start:stop].max()), float(self.low[start:stop].min())
+
+    def _get_day_spans(self) -> Dict[int, Tuple[int, int]]:
+        if self._day_spans is None:
+            days = self.times // SECONDS_PER_DAY
+            boundaries = np.flatnonzero(np.diff(days)) + 1
+            starts = np.concatenate(([0], boundaries)) if len(days) else boundaries
+            stops = np.concatenate((boundaries, [len(days)])) if len(days) else boundaries
+            self._day_spans = dict(zip(days[starts].tolist(), zip(starts.tolist(), stops.tolist())))
+        return self._day_spans
@@ -0,0 +1,135 @@
+"""Backtest SL/TP fill simulation against each bar's high/low instead of only its close."""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.common.config.constants import (
+    TRADE_DIRECTION_BUY,
+    DATETIME_FORMAT,
+    SAME_BAR_FILL_TARGET_FIRST,
+    SAME_BAR_FILL_NEAREST_OPEN,
+)
+from app.common.models.model_trade import SlTpFill, TradeRecord
+from app.common.services.platform_time import PlatformTime
+from app.connectors.mt5tester.mt5tester_bars import to_epoch, from_epoch
+
+logger = logging.getLogger(__name__)
+
+
+class Mt5testerFillSimulator:
+    """Finds the first bar whose range reaches an open trade's SL or TP, sweeping all bars since the last check."""
+
+    def __init__(self, symbol, same_bar_policy: str) -> None:
+        self.symbol = symbol
+        self.same_bar_policy = same_bar_policy
+        # trade id -> index of the last bar already swept, so each bar is looked at once per trade
+        self._checked_through: Dict[str, int] = {}
+        # trade id -> (the (SL, TP) it was found for, fill)
+        self._fills: Dict[str, Tuple[Tuple[float, float], SlTpFill]] = {}
+
+    def get_fill(self, trade: TradeRecord) -> Optional[SlTpFill]:
+        """Return where the trade's SL or TP was first reached up to the current bar, or None if it wasn't."""
+        levels = self._get_levels(trade)
+        stop_loss, take_profit = levels
+        cached = self._fills.get(trade.id)
+        if cached is not None:
+            if cached[0] == levels:
+                return cached[1]
+            # The levels moved since: the sweep position was never advanced
+            # past the old hit, so the bars from there are swept again.
+            del self._fills[trade.id]
+
+        if stop_loss <= 0 and take_profit <= 0:
+            return None
+
+        bars = self.symbol.get_bars(trade.symbol)
+        if bars is None:
+            return None
+
+        current = bars.index_at_or_before(to_epoch(PlatformTime.now()))
+        checked = self._checked_through.get(trade.id)
+        if checked is None:
+            # The entry filled at its bar's close, so that bar's range is
+            # already behind it; the sweep starts at the bar after.
+            checked = bars.index_at_or_before(to_epoch(PlatformTime.parse_platform_timestamp(trade.timestamp)))
+        start = checked + 1
+        stop = current + 1
+        if start >= stop:
+            return None
+
+        is_buy = trade.type.lower() == TRADE_DIRECTION_BUY
+        low = bars.low[start:stop]
+        high = bars.high[start:stop]
+        no_hits = np.zeros(stop - start, dtype=bool)
+        if is_buy:
+            stop_hits = low <= stop_loss if stop_loss > 0 else no_hits
+            target_hits = high >= take_profit if take_profit > 0 else no_hits
+        else:
+            stop_hits = high >= stop_loss if stop_loss > 0 else no_hits
+            target_hits = low <= take_profit if take_profit > 0 else no_hits
+
+        hits = stop_hits | target_hits
+        if not hits.any():
+            self._checked_through[trade.id] = current
+            return None
+
+        offset = int(np.argmax(hits))
+        index = start + offset
+        stop_loss_hit, price = self._resolve(
+            is_buy, bool(stop_hits[offset]), bool(target_hits[offset]), float(bars.open[index]), stop_loss, take_profit
+        )
+        fill = SlTpFill(
+            price=price,
+            time=from_epoch(bars.times[index]).strftime(DATETIME_FORMAT),
+            stop_loss_hit=stop_loss_hit,
+        )
+        self._fills[trade.id] = (levels, fill)
+        return fill
+
+    def pop_fill(self, trade: TradeRecord) -> Optional[SlTpFill]:
+        """Return and forget the trade's pending fill for its current SL/TP, dropping its sweep position."""
+        self._checked_through.pop(trade.id, None)
+        cached = self._fills.pop(trade.id, None)
+        if cached is None or cached[0] != self._get_levels(trade):
+            return None
+        return cached[1]
+
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        """Return the sweep positions and pending fills for a backtest checkpoint."""
+        return {"checked_through": self._checked_through, "fills": self._fills}
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        """Restore state returned by get_checkpoint_state when a backtest resumes."""
+        self._checked_through = state["checked_through"]
+        self._fills = state["fills"]
+
+    @staticmethod
+    def _get_levels(trade: TradeRecord) -> Tuple[float, float]:
+        return trade.stop_loss or 0, trade.take_profit or 0
+
+    def _resolve(
+        self,
+        is_buy: bool,
+        stop_hit: bool,
+        target_hit: bool,
+        bar_open: float,
+        stop_loss: float,
+        take_profit: float,
+    ) -> Tuple[bool, float]:
+        # A bar that opens beyond a level gapped through it: the open is the
+        # first price traded there, for the stop and the target alike.
+        if stop_hit and (bar_open <= stop_loss if is_buy else bar_open >= stop_loss):
+            return True, bar_open
+        if target_hit and (bar_open >= take_profit if is_buy else bar_open <= take_profit):
+            return False, bar_open
+
+        if stop_hit and target_hit:
+            # Bars don't record whether the high or the low came first.
+            if self.same_bar_policy == SAME_BAR_FILL_TARGET_FIRST:
+                stop_hit = False
+            elif self.same_bar_policy == SAME_BAR_FILL_NEAREST_OPEN:
+                stop_hit = abs(bar_open - stop_loss) <= abs(take_profit - bar_open)
+
+        return (True, stop_loss) if stop_hit else (False, take_profit)
@@ -1,14 +1,15 @@
 import logging
-import pandas as pd
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 import MetaTrader5 as mt5
 
 from app.base.base_symbol import Symbol
 from app.common.models.model_symbol import Range, SymbolInfo, PriceRecord
-from app.common.config.paths import DATA_PATH
+from app.common.config.paths import DATA_PATH, BAR_CACHE_PATH
 from app.common.services.platform_time import PlatformTime
+from app.connectors.mt5tester.mt5tester_bars import SymbolBars, to_epoch, from_epoch
+from app.connectors.mt5tester.mt5tester_bar_cache import BarCache
 
 logger = logging.getLogger(__name__)
 
@@ -17,106 +18,111 @@ class Mt5testerSymbol(Symbol):
     def __init__(self, backtester_config=None, account=None):
         self.account = account
         self.backtester_config = backtester_config
-        self.data_by_symbol = {}
+        self.timeframe = backtester_config.backtest_timeframe.upper()
+        self.data_by_symbol: Dict[str, Optional[SymbolBars]] = {}
         self.symbol_info_cache = {}
-        self.load_historical_data()
-        self.preload_symbol_info()
-
-    def load_historical_data(self):
-        timeframe = self.backtester_config.backtest_timeframe.upper()
-        data_root_path = DATA_PATH
-
-        for symbol_path in data_root_path.iterdir():
-            if symbol_path.is_dir():
-                symbol = symbol_path.name.upper()
-                file_pattern = f"*_{timeframe}.csv"
-                all_dfs = []
-
-                for csv_file in symbol_path.glob(file_pattern):
-                    df = pd.read_csv(csv_file, parse_dates=["time"])
-                    df.drop_duplicates(subset="time", inplace=True)
-                    all_dfs.append(df)
-
-                if all_dfs:
-                    combined_df = pd.concat(all_dfs)
-                    combined_df.set_index("time", inplace=True)
-                    combined_df.sort_index(inplace=True)
-                    self.data_by_symbol[symbol] = combined_df
-
-    def preload_symbol_info(self):
+        self.bar_cache = BarCache(BAR_CACHE_PATH)
+        self.load_window = self._get_load_window()
+        # Only the directory listing up front; bars and symbol info are loaded
+        # the first time a strategy asks for a symbol, so a run pays only for
+        # the symbols its enabled strategies actually use.
+        self.symbol_paths: Dict[str, Path] = {
+            path.name.upper(): path for path in DATA_PATH.iterdir() if path.is_dir()
+        }
+
         if not mt5.initialize():
             raise RuntimeError(f"Failed to initialize MT5: {mt5.last_error()}")
 
-        for symbol in self.data_by_symbol.keys():
-            symbol = symbol.replace(".CASH", ".cash")
-            info = mt5.symbol_info(symbol)
-            if not info:
-                logger.warning(f"Symbol info not found for {symbol}")
-                continue
-            self.symbol_info_cache[symbol.upper()] = info
-
-        logger.info(f"Preloaded symbol info for {len(self.symbol_info_cache)} symbols.")
+    def _get_load_window(self) -> Tuple[int, int]:
+        date_from = datetime.strptime(self.backtester_config.backtest_date_from, "%d-%m-%Y")
+        date_to = datetime.strptime(self.backtester_config.backtest_date_to, "%d-%m-%Y")
+        warmup = timedelta(days=self.backtester_config.backtest_warmup_days)
+        return to_epoch(date_from - warmup), to_epoch(date_to + timedelta(days=1))
+
+    def _load_bars(self, symbol: str) -> Optional[SymbolBars]:
+        symbol_path = self.symbol_paths.get(symbol)
+        if symbol_path is None:
+            return None
+        bars = self.bar_cache.load(symbol, symbol_path, self.timeframe)
+        if bars is None:
+            return None
+        bars = bars.window(*self.load_window)
+        logger.info(f"Loaded {len(bars)} {self.timeframe} bars for {symbol}")
+        return bars
 
     def _get_mt5_info(self, symbol: str):
-        info = self.symbol_info_cache.get(symbol.upper())
+        info = self._get_cached_symbol_info(symbol)
         if not info:
-            raise RuntimeError(f"Missing symbol info for {symbol}. Make sure it's preloaded.")
+            raise RuntimeError(f"Missing symbol info for {symbol}.")
         return info
 
-    def get_symbol_info(self, symbol: str, timestamp: datetime) -> SymbolInfo:
+    def _get_cached_symbol_info(self, symbol: str):
         symbol = symbol.upper()
-        timestamp = timestamp.replace(tzinfo=None)
-        df = self.data_by_symbol.get(symbol)
+        if symbol not in self.symbol_info_cache:
+            info = mt5.symbol_info(symbol.replace(".CASH", ".cash"))
+            if not info:
+                logger.warning(f"Symbol info not found for {symbol}")
+            self.symbol_info_cache[symbol] = info
+        return self.symbol_info_cache[symbol]
 
-        if df is None:
+    def get_bars(self, symbol: str) -> Optional[SymbolBars]:
+        """Return the symbol's loaded bar arrays, or None if there is no data for it."""
+        symbol = symbol.upper()
+        if symbol not in self.data_by_symbol:
+            # A missing symbol is remembered as None so it isn't looked up again.
+            self.data_by_symbol[symbol] = self._load_bars(symbol)
+        return self.data_by_symbol[symbol]
+
+    def _get_bars(self, symbol: str) -> SymbolBars:
+        bars = self.get_bars(symbol)
+        if bars is None:
             raise ValueError(f"No historical data loaded for symbol: {symbol}")
+        return bars
 
-        if timestamp not in df.index:
-            timestamp = df.index.asof(timestamp)
+    def get_symbol_info(self, symbol: str, timestamp: datetime) -> SymbolInfo:
+        symbol = symbol.upper()
+        bars = self._get_bars(symbol)
 
-        if timestamp is None or timestamp not in df.index:
+        index = bars.index_at_or_before(to_epoch(timestamp))
+        if index < 0:
             raise ValueError(f"No data for {symbol} at or before {timestamp}")
 
-        row = df.loc[timestamp]
-
+        close = float(bars.close[index])
         return SymbolInfo(
             symbol=symbol,
-            time=timestamp,
-            ask_price=row["close"],
-            bid_price=row["close"],
-            open=row["open"],
-            high=row["high"],
-            low=row["low"],
-            close=row["close"],
-            lot_size=row["volume"]
+            time=from_epoch(bars.times[index]),
+            ask_price=close,
+            bid_price=close,
+            open=float(bars.open[index]),
+            high=float(bars.high[index]),
+            low=float(bars.low[index]),
+            close=close,
+            lot_size=float(bars.volume[index]),
         )
 
     def get_symbol_data_range(self, symbol: str, start_time: datetime, end_time: datetime) -> List[PriceRecord]:
         symbol = symbol.upper()
-        df = self.data_by_symbol.get(symbol)
-
-        if df is None:
-            raise ValueError(f"No data for symbol: {symbol}")
-
-        start_time = start_time.replace(tzinfo=None)
-        end_time = end_time.replace(tzinfo=None)
-
-        try:
-            sliced = df.loc[start_time:end_time]
-        except KeyError:
-            return []
+        bars = self._get_bars(symbol)
 
+        start, stop = bars.slice_between(to_epoch(start_time), to_epoch(end_time))
         return [
             PriceRecord(
                 symbol=symbol,
-                time=row.Index,
-                open=row.open,
-                high=row.high,
-                low=row.low,
-                close=row.close,
-                volume=row.volume,
+                time=from_epoch(time),
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+            )
+            for time, open_, high, low, close, volume in zip(
+                bars.times[start:stop].tolist(),
+                bars.open[start:stop].tolist(),
+                bars.high[start:stop].tolist(),
+                bars.low[start:stop].tolist(),
+                bars.close[start:stop].tolist(),
+                bars.volume[start:stop].tolist(),
             )
-            for row in sliced.itertuples()
         ]
 
     def get_high_low_range(self, symbol: str, start_minute: int, end_minute: int) -> Range:
@@ -125,17 +131,18 @@ class Mt5testerSymbol(Symbol):
         end_time = now.replace(hour=0, minute=0) + timedelta(minutes=end_minute)
 
         try:
-            records = self.get_symbol_data_range(symbol, start_time, end_time)
+            high_low = self._get_bars(symbol.upper()).high_low_between(to_epoch(start_time), to_epoch(end_time))
         except ValueError:
-            return Range(symbol=symbol, high=0.0, low=0.0, date=start_time.date(), range_set=False)
+            high_low = None
 
-        highs = [r.high for r in records]
-        lows = [r.low for r in records]
+        if high_low is None:
+            return Range(symbol=symbol, high=0.0, low=0.0, date=start_time.date(), range_set=False)
 
+        high, low = high_low
         return Range(
             symbol=symbol,
-            high=max(highs),
-            low=min(lows),
+            high=high,
+            low=low,
             date=start_time.date(),
             range_set=True
         )
@@ -148,10 +155,10 @@ class Mt5testerSymbol(Symbol):
         timestamp = timestamp or PlatformTime.now()
         return self.get_symbol_info(symbol, timestamp).ask_price
 
-    # 🔒 All calls below use cache only – no runtime mt5 calls
+    # 🔒 All calls below use cache only – MT5 is asked once per symbol, on first use
 
     def is_valid_symbol(self, symbol: str) -> bool:
-        return symbol.upper() in self.symbol_info_cache
+        return self._get_cached_symbol_info(symbol) is not None
 
     def prepare_symbol(self, symbol: str) -> bool:
         return self.is_valid_symbol(symbol)
@@ -185,15 +192,15 @@ class Mt5testerSymbol(Symbol):
 
     def get_open_price(self, symbol: str) -> float:
         symbol = symbol.upper()
-        df = self.data_by_symbol.get(symbol)
-        if df is None or df.empty:
+        bars = self._get_bars(symbol)
+        if not len(bars):
             raise ValueError(f"No data for {symbol}")
 
         now = PlatformTime.now()
         day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        today_data = df.loc[day_start : day_start + timedelta(days=1)]
-        if today_data.empty:
+        start, stop = bars.slice_between(to_epoch(day_start), to_epoch(day_start + timedelta(days=1)))
+        if start == stop:
             raise ValueError(f"No bars available today for {symbol} (after {day_start})")
 
-        return float(today_data.iloc[0]["open"])
\ No newline at end of file
+        return float(bars.open[start])
\ No newline at end of file
@@ -1,14 +1,16 @@
-import csv
 import logging
 
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from app.base.base_trade import Trade
+from app.base.base_tester_trade import TesterTrade
 from app.common.services.calculator import Calculator
 from app.common.config.paths import RESULT_PATH
+from app.common.models.model_backtest import TradeExcursion
 from app.common.models.model_trade import (
+    SlTpFill,
     OrderRequest,
     OrderResult,
     TradeRecord,
@@ -17,6 +19,9 @@ from app.common.models.model_trade import (
 )
 from app.common.services.platform_time import PlatformTime
 from app.common.services.backtest_summary import BacktestSummary
+from app.factories.factory_result_sink import get_result_sink
+from app.connectors.mt5tester.mt5tester_fills import Mt5testerFillSimulator
+from app.connectors.mt5tester.mt5tester_bars import to_epoch
 from app.common.config.constants import (
     TRADE_DIRECTION_BUY, 
     TRADE_STATUS_CLOSED,
@@ -25,19 +30,39 @@ from app.common.config.constants import (
 
 logger = logging.getLogger(__name__)
 
-class Mt5testerTrade(Trade):
+RESULT_COLUMNS = (
+    ("Time", str), ("Strategy", str), ("Type", str), ("Volume", float), ("Symbol", str),
+    ("Entry Price", float), ("SL", float), ("TP", float), ("Close Time", str), ("Exit Price", float),
+    ("Commission", float), ("Swap", float), ("Slippage", float), ("Profit", float), ("Net Profit", float),
+    ("Comment", str),
+)
+
+class Mt5testerTrade(Trade, TesterTrade):
     def __init__(self, symbol, calculator: Calculator,
-                 summary_writer: BacktestSummary):
+                 summary_writer: BacktestSummary,
+                 result_file_path: Optional[Path] = None):
         self.symbol = symbol
         self.calculator = calculator
         self.summary_writer = summary_writer
 
-        self.result_file_path = (
+        backtester_config = symbol.backtester_config
+        self.result_format = backtester_config.backtest_result_format
+        self.result_flush_rows = backtester_config.backtest_result_flush_rows
+        self.result_file_path = (result_file_path or (
             Path(RESULT_PATH) /
             f"results_{datetime.now().strftime('%Y%m%d%H%M')}.csv"
-        )
+        )).with_suffix(f".{self.result_format}")
         self.result_file_path.parent.mkdir(parents=True, exist_ok=True)
-        self._wrote_header = False
+        self.result_sink = get_result_sink(
+            self.result_format, self.result_file_path, RESULT_COLUMNS, self.result_flush_rows
+        )
+
+        self.fill_simulator: Optional[Mt5testerFillSimulator] = (
+            Mt5testerFillSimulator(symbol, backtester_config.backtest_same_bar_fill)
+            if backtester_config.backtest_intrabar_fills
+            else None
+        )
+        self.simulates_sl_tp_fills = self.fill_simulator is not None
 
         if self.calculator is None:
             print("[ERROR] Calculator is None in Mt5testerTrade constructor!")
@@ -85,6 +110,11 @@ class Mt5testerTrade(Trade):
         return order_result
 
     def close_position(self, trade: TradeRecord) -> TradeResult:
+        fill = self.fill_simulator.pop_fill(trade) if self.fill_simulator else None
+        if fill is not None:
+            trade.exit_price = fill.price
+            trade.comment = "Stopped out" if fill.stop_loss_hit else "Take profit hit"
+
         if trade.exit_price is None:
             direction = trade.type.lower()
             price = (
@@ -110,7 +140,8 @@ class Mt5testerTrade(Trade):
 
         result = self._calculate_realized_profit(trade)
         
-        trade.exit_time = PlatformTime.now().strftime(DATETIME_FORMAT)
+        exit_time = PlatformTime.parse_platform_timestamp(fill.time) if fill else PlatformTime.now()
+        trade.exit_time = exit_time.strftime(DATETIME_FORMAT)
         trade.status = TRADE_STATUS_CLOSED
         trade.profit = result.profit
         trade.commission = result.commission
@@ -124,12 +155,14 @@ class Mt5testerTrade(Trade):
             try:
                 self.summary_writer.update_total_profit(
                     trade.profit,
-                    PlatformTime.now()
+                    exit_time
                 )
             except Exception as e:
                 print(f"[WARNING] Failed to update backtest summary: {e}")
 
         self._log_close(trade)
+        if self.summary_writer:
+            self.summary_writer.record_closed_trade(trade, self._get_excursion(trade))
 
         return TradeResult(
             symbol=trade.symbol,
@@ -143,6 +176,34 @@ class Mt5testerTrade(Trade):
             comment=trade.comment
         )
 
+    def get_sl_tp_fill(self, trade: TradeRecord) -> Optional[SlTpFill]:
+        return self.fill_simulator.get_fill(trade) if self.fill_simulator else None
+
+    def _get_excursion(self, trade: TradeRecord) -> Optional[TradeExcursion]:
+        bars = self.symbol.get_bars(trade.symbol)
+        if bars is None or trade.entry_price is None:
+            return None
+
+        # Bars after the entry bar through the exit bar: the entry filled at
+        # its bar's close, so that bar's range was never held.
+        entry_index = bars.index_at_or_before(to_epoch(PlatformTime.parse_platform_timestamp(trade.timestamp)))
+        exit_index = bars.index_at_or_before(to_epoch(PlatformTime.parse_platform_timestamp(trade.exit_time)))
+        start, stop = entry_index + 1, exit_index + 1
+        if start >= stop:
+            return TradeExcursion()
+
+        entry = trade.entry_price
+        direction = 1.0 if trade.type.lower() == TRADE_DIRECTION_BUY else -1.0
+        favorable = bars.high[start:stop] if direction > 0 else bars.low[start:stop]
+        adverse = bars.low[start:stop] if direction > 0 else bars.high[start:stop]
+        price_value = self.calculator.calculate_price_value(trade.symbol, trade.lot_size)
+        return TradeExcursion(
+            mae=max(0.0, float((direction * (entry - adverse)).max())),
+            mfe=max(0.0, float((direction * (favorable - entry)).max())),
+            times=bars.times[start:stop],
+            floating=(bars.close[start:stop] - entry) * direction * price_value,
+        )
+
     def _log_order(self, order: OrderRequest, trade_id: str):
         pass
 
@@ -150,37 +211,47 @@ class Mt5testerTrade(Trade):
         if trade.exit_price is None:
             return
 
-        is_new_file = not self.result_file_path.exists() and not self._wrote_header
-
-        with open(self.result_file_path, mode="a", newline="") as f:
-            writer = csv.writer(f)
-
-            if is_new_file:
-                writer.writerow([
-                    "Time", "Strategy", "Type", "Volume", "Symbol",
-                    "Entry Price", "SL", "TP", "Close Time", "Exit Price",
-                    "Commission", "Swap", "Slippage", "Profit", "Net Profit", "Comment"
-                ])
-                self._wrote_header = True
-
-            writer.writerow([
-                PlatformTime.to_mt_time_format(trade.timestamp),
-                trade.strategy.capitalize(),
-                trade.type.capitalize(),
-                trade.lot_size,
-                trade.symbol,
-                trade.entry_price,
-                trade.stop_loss,
-                trade.take_profit,
-                PlatformTime.to_mt_time_format(trade.exit_time),
-                trade.exit_price,
-                trade.commission,
-                0.0,
-                round(trade.slippage_entry + trade.slippage_exit, 2),
-                trade.profit,
-                round(trade.profit - trade.commission - trade.slippage_entry - trade.slippage_exit, 2),
-                trade.comment
-            ])
+        self.result_sink.write((
+            PlatformTime.to_mt_time_format(trade.timestamp),
+            trade.strategy.capitalize(),
+            trade.type.capitalize(),
+            trade.lot_size,
+            trade.symbol,
+            trade.entry_price,
+            trade.stop_loss,
+            trade.take_profit,
+            PlatformTime.to_mt_time_format(trade.exit_time),
+            trade.exit_price,
+            trade.commission,
+            0.0,
+            round(trade.slippage_entry + trade.slippage_exit, 2),
+            trade.profit,
+            round(trade.profit - trade.commission - trade.slippage_entry - trade.slippage_exit, 2),
+            trade.comment
+        ))
+
+    def get_checkpoint_state(self) -> Dict[str, Any]:
+        return {
+            "result_file_path": self.result_file_path,
+            "result_marker": self.result_sink.get_checkpoint_marker(),
+            "fills": self.fill_simulator.get_checkpoint_state() if self.fill_simulator else None,
+        }
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        # The interrupted run's results file is continued, not a new one
+        # named after the resume time.
+        if state["result_file_path"] != self.result_file_path:
+            self.result_sink.close()
+            self.result_file_path = state["result_file_path"]
+            self.result_sink = get_result_sink(
+                self.result_format, self.result_file_path, RESULT_COLUMNS, self.result_flush_rows
+            )
+        self.result_sink.resume_from(state["result_marker"])
+        if self.fill_simulator and state["fills"] is not None:
+            self.fill_simulator.restore_checkpoint_state(state["fills"])
+
+    def close(self) -> None:
+        self.result_sink.close()
 
     def _calculate_realized_profit(self, trade: TradeRecord) -> ProfitResult:
         return self.calculator.calculate_profit(trade, True)
@@ -0,0 +1,19 @@
+"""Builds the backtest result sink for the configured output format."""
+
+import logging
+from pathlib import Path
+
+from app.common.services.result_sink import ResultSink, ResultColumns, CsvResultSink, ArrowResultSink
+from app.common.config.constants import RESULT_FORMAT_PARQUET, RESULT_FORMAT_ARROW
+
+logger = logging.getLogger(__name__)
+
+
+def get_result_sink(result_format: str, path: Path, columns: ResultColumns, flush_rows: int) -> ResultSink:
+    """Return the sink selected by BACKTEST_RESULT_FORMAT, writing to `path`."""
+    logger.info(f"Writing backtest results to: {path} ({result_format}, flushed every {flush_rows} row(s))")
+    if result_format == RESULT_FORMAT_PARQUET:
+        return ArrowResultSink(path, columns, flush_rows, parquet=True)
+    if result_format == RESULT_FORMAT_ARROW:
+        return ArrowResultSink(path, columns, flush_rows, parquet=False)
+    return CsvResultSink(path, columns, flush_rows)
@@ -1,14 +1,16 @@
 """Builds the RiskManager instance."""
 
 import logging
+from pathlib import Path
+from typing import Optional
 
 from app.common.services.risk_manager import RiskManager
 
 logger = logging.getLogger(__name__)
 
 
-def get_risk_manager() -> RiskManager:
+def get_risk_manager(risk_path: Optional[Path] = None) -> RiskManager:
     logger.info("Initializing RiskManager")
-    manager = RiskManager()
+    manager = RiskManager(risk_path)
     manager.initialize()
     return manager
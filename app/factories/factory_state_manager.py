@@ -1,19 +1,43 @@
 """Builds the StateManager instance."""
 
 import logging
+from pathlib import Path
+from typing import Optional
+
 from app.base.base_account import Account
 from app.common.services.state_manager import StateManager
-from app.common.config.paths import STATE_PATH
+from app.common.services.state_backend import StateBackend, JsonStateBackend
+from app.common.services.state_journal import JournalStateBackend
+from app.common.services.state_sqlite import SqliteStateBackend
+from app.common.models.model_state import StateConfig
+from app.common.config.constants import STATE_BACKEND_JOURNAL, STATE_BACKEND_SQLITE
+from app.common.config.paths import STATE_PATH, STATE_JOURNAL_PATH, STATE_DATABASE_PATH
 
 logger = logging.getLogger(__name__)
 
 
-def get_state_manager(account: Account) -> StateManager:
-    logger.info(f"Initializing StateManager at: {STATE_PATH}")
+def get_state_backend(state_config: StateConfig, state_dir: Optional[Path] = None) -> StateBackend:
+    """Return the STATE_BACKEND storage backend, under `state_dir` if given."""
+    state_path = state_dir / STATE_PATH.name if state_dir else STATE_PATH
+    journal_path = state_dir / STATE_JOURNAL_PATH.name if state_dir else STATE_JOURNAL_PATH
+    database_path = state_dir / STATE_DATABASE_PATH.name if state_dir else STATE_DATABASE_PATH
+    if state_config.backend == STATE_BACKEND_JOURNAL:
+        return JournalStateBackend(state_path, journal_path)
+    if state_config.backend == STATE_BACKEND_SQLITE:
+        # An existing state.json seeds a fresh database, so switching backends
+        # doesn't lose open trades or the daily balance snapshot.
+        return SqliteStateBackend(database_path, seed_path=state_path)
+    return JsonStateBackend(state_path)
+
+
+def get_state_manager(account: Account, state_config: StateConfig, state_dir: Optional[Path] = None) -> StateManager:
+    state_path = state_dir / STATE_PATH.name if state_dir else STATE_PATH
+    logger.info(f"Initializing StateManager at: {state_path} (backend: {state_config.backend})")
 
     state_manager = StateManager(
-        state_path=STATE_PATH,
+        state_path=state_path,
         account=account,
         persist_enabled=True,
+        backend=get_state_backend(state_config, state_dir),
     )
     return state_manager
@@ -17,6 +17,7 @@ from app.common.services.news_manager import NewsManager
 from app.common.services.risk_manager import RiskManager
 from app.common.services.vix_manager import VixManager
 from app.common.services.pushover_manager import PushoverManager
+from app.common.services.signal_feed_reader import SignalFeedReader
 from app.common.config.paths import STRATEGY_PATH
 from app.common.models.model_strategy import (
     StrategyConfig,
@@ -83,8 +84,10 @@ def resolve_strategy_config_path(item: Path, profile: str) -> Optional[Path]:
     return default_config_file if default_config_file.exists() else None
 
 
-def discover_strategies() -> Iterator[Tuple[Path, Path, Path]]:
-    profile = load_strategy_config_profile()
+def discover_strategies(profile: Optional[str] = None) -> Iterator[Tuple[Path, Path, Path]]:
+    """Yield each strategy folder with its strategy.py and the config file for `profile` (STRATEGY_CONFIG if None)."""
+    if profile is None:
+        profile = load_strategy_config_profile()
 
     for item in STRATEGY_PATH.iterdir():
         if item.is_dir() and not item.name.startswith("__"):
@@ -118,10 +121,12 @@ def get_strategies(
     risk_manager: RiskManager,
     vix_manager: VixManager,
     notify_manager: PushoverManager,
+    signal_feed_reader: Optional[SignalFeedReader] = None,
+    profile: Optional[str] = None,
 ) -> List[Strategy]:
     strategies = []
 
-    for item, _, config_file in discover_strategies():
+    for item, _, config_file in discover_strategies(profile):
         try:
             config = get_strategy_config(config_file)
 
@@ -148,6 +153,7 @@ def get_strategies(
                 risk_manager=risk_manager,
                 vix_manager=vix_manager,
                 notify_manager=notify_manager,
+                signal_feed_reader=signal_feed_reader,
             )
 
             holidays = load_holiday_calendar(config.holiday_calendar)
@@ -14,8 +14,9 @@ class Engine(BaseEngine):
     def run(self) -> None:
         self.initialize()
         PlatformTime.sleep(1)
+        # Hosted engines share the terminal, so only the dashboard file is written.
         self.dashboard_manager.print_status_report(
-            self.strategies, self.state_manager, self.connector_config.environment, log_to_terminal=True
+            self.strategies, self.state_manager, self.connector_config.environment, log_to_terminal=not self.hosted
         )
         last_balances_update = 0
         last_news_refresh_update = 0
@@ -27,62 +28,96 @@ class Engine(BaseEngine):
             logger.info("Initial balances set.")
 
         try:
-            while True:
+            while not self.stop_event.is_set():
                 if not self.connector.connection_check():
                     logger.warning("Connection lost. Attempting to reconnect...")
                     if self.connector.connect():
                         logger.info("Reconnected successfully.")
                     else:
                         logger.error("Reconnection failed. Retrying in 30 seconds...")
-                        PlatformTime.sleep(30)
+                        self._wait(30)
                         continue
 
                 current_timestamp = PlatformTime.timestamp()
 
                 try:
-                    last_tick_timestamp = self.state_manager.get_server_last_tick()
-                    current_tick_timestamp = self.account.get_server_tick_timestamp()
-
-                    server_time_offset = None
-                    if last_tick_timestamp is not None and last_tick_timestamp != current_tick_timestamp:
-                        server_time_offset = self.account.get_server_offset_hours()
-
-                    if server_time_offset is not None:
-                        PlatformTime.set_offset(server_time_offset)
-                        self.state_manager.save_server_time_offset(server_time_offset)
-
-                    if server_time_offset is None and self.state_manager.get_server_time_offset() is not None:
-                        persisted_offset = self.state_manager.get_server_time_offset()
-                        PlatformTime.set_offset(persisted_offset)
-
-                    open_ticket_ids = self.account.get_open_tickets()
-                    self.sync_manager.sync_status_with_broker(open_ticket_ids)
-                    closed_tickets = self.account.get_closed_tickets()
-                    self.sync_manager.sync_tickets_with_broker(closed_tickets)
-                    self.state_manager.save_server_last_tick(current_tick_timestamp)
-                    last_vix_refresh_update = self._periodic_vix_refresh(current_timestamp, last_vix_refresh_update)
-                    last_news_refresh_update = self._periodic_news_calendar_refresh(
-                        current_timestamp, last_news_refresh_update
-                    )
-                    last_balances_update = self._update_and_check_profit_targets(
-                        current_timestamp, last_balances_update
-                    )
-                    last_deal_archive_update = self._periodic_deal_archive(
-                        current_timestamp, last_deal_archive_update
-                    )
-                    self.dashboard_manager.print_status_report(
-                        self.strategies, self.state_manager, self.connector_config.environment, log_to_terminal=True
-                    )
-
-                    self._run_strategies()
+                    with self.state_manager.batch():
+                        last_tick_timestamp = self.state_manager.get_server_last_tick()
+                        current_tick_timestamp = self.account.get_server_tick_timestamp()
+
+                        server_time_offset = None
+                        if last_tick_timestamp is not None and last_tick_timestamp != current_tick_timestamp:
+                            server_time_offset = self.account.get_server_offset_hours()
+
+                        if server_time_offset is not None:
+                            # PlatformTime is process-wide: in a host, the host
+                            # pins one offset and no engine thread may move it.
+                            if self.hosted:
+                                self._check_host_offset(server_time_offset)
+                            else:
+                                PlatformTime.set_offset(server_time_offset)
+                            self.state_manager.save_server_time_offset(server_time_offset)
+
+                        if (
+                            not self.hosted
+                            and server_time_offset is None
+                            and self.state_manager.get_server_time_offset() is not None
+                        ):
+                            persisted_offset = self.state_manager.get_server_time_offset()
+                            PlatformTime.set_offset(persisted_offset)
+
+                        open_ticket_ids = self.account.get_open_tickets()
+                        self.sync_manager.sync_status_with_broker(open_ticket_ids)
+                        closed_tickets = self.account.get_closed_tickets()
+                        self.sync_manager.sync_tickets_with_broker(closed_tickets)
+                        self.state_manager.save_server_last_tick(current_tick_timestamp)
+                        if not self.hosted:
+                            last_vix_refresh_update = self._periodic_vix_refresh(
+                                current_timestamp, last_vix_refresh_update
+                            )
+                            last_news_refresh_update = self._periodic_news_calendar_refresh(
+                                current_timestamp, last_news_refresh_update
+                            )
+                        last_balances_update = self._update_and_check_profit_targets(
+                            current_timestamp, last_balances_update
+                        )
+                        last_deal_archive_update = self._periodic_deal_archive(
+                            current_timestamp, last_deal_archive_update
+                        )
+                        self.dashboard_manager.print_status_report(
+                            self.strategies,
+                            self.state_manager,
+                            self.connector_config.environment,
+                            log_to_terminal=not self.hosted,
+                        )
+
+                        self._run_strategies()
                     self._write_heartbeat(current_timestamp)
                 except Exception as error:
                     # A broker call can time out on a connection that looked alive but was
                     # already dead — skip this iteration, next connection_check() catches it.
                     logger.warning(f"Error during iteration, will retry next cycle: {error}", exc_info=True)
-                    PlatformTime.sleep(5)
+                    self._wait(5)
                     continue
 
-                PlatformTime.sleep(30)
+                self._wait(30)
         except KeyboardInterrupt:
-            self.shutdown()
+            pass
+        self.shutdown()
+
+    def _check_host_offset(self, server_time_offset: int) -> None:
+        """Warn once per change when this account's broker offset differs from the host's clock."""
+        host_offset = PlatformTime.get_offset()
+        if server_time_offset != host_offset and server_time_offset != self.state_manager.get_server_time_offset():
+            logger.warning(
+                f"Broker server offset {server_time_offset}h differs from the host's {host_offset}h; "
+                f"this account keeps running on the host's clock."
+            )
+
+    def _wait(self, seconds: float) -> None:
+        # Ctrl+C can't interrupt Event.wait on Windows, so only a hosted
+        # engine, which the host stops through stop_event, waits on it.
+        if self.hosted:
+            self.stop_event.wait(seconds)
+        else:
+            PlatformTime.sleep(seconds)
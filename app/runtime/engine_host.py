@@ -0,0 +1,101 @@
+"""Runs several live account stacks concurrently in one process, sharing their market-data services."""
+
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from app.base.base_engine import BaseEngine
+from app.common.config.paths import LOG_PATH
+from app.common.services.logger import setup_logger
+from app.common.services.news_manager import NewsManager
+from app.common.services.platform_time import PlatformTime
+from app.common.services.pushover_manager import PushoverManager
+from app.common.services.vix_manager import VixManager
+
+logger = logging.getLogger(__name__)
+
+NEWS_REFRESH_SECONDS = 86400
+VIX_REFRESH_SECONDS = 30
+
+
+class EngineHost:
+    """Runs each account's Engine on its own thread and refreshes the news and VIX data they share once for all."""
+
+    def __init__(
+        self,
+        engines: Dict[str, BaseEngine],
+        news_manager: NewsManager,
+        vix_manager: VixManager,
+        notify_manager: Optional[PushoverManager] = None,
+        log_name: str = "host",
+        log_level: str = "INFO",
+    ) -> None:
+        self.engines = engines
+        self.news_manager = news_manager
+        self.vix_manager = vix_manager
+        self.notify_manager = notify_manager
+        self.log_name = log_name
+        self.log_level = log_level
+        self.stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def run(self) -> None:
+        """Start every engine thread, then keep the shared services fresh until all engines stop or Ctrl+C."""
+        self._refresh_news()
+        self.vix_manager.refresh()
+
+        for name, engine in self.engines.items():
+            thread = threading.Thread(target=self._run_engine, args=(name, engine), name=f"engine-{name}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Engine host running {len(self._threads)} account stack(s): {', '.join(self.engines)}")
+
+        last_news_refresh = last_vix_refresh = PlatformTime.timestamp()
+        today = PlatformTime.now().day
+        try:
+            while any(thread.is_alive() for thread in self._threads):
+                if self.stop_event.wait(VIX_REFRESH_SECONDS):
+                    break
+                now = PlatformTime.timestamp()
+                if now - last_vix_refresh >= VIX_REFRESH_SECONDS:
+                    self.vix_manager.refresh()
+                    last_vix_refresh = now
+                if now - last_news_refresh >= NEWS_REFRESH_SECONDS:
+                    self._refresh_news()
+                    last_news_refresh = now
+                # Hosted engines leave the dated log file to the host, so
+                # one thread rolls it instead of each engine at its own time.
+                if PlatformTime.now().day != today:
+                    setup_logger(LOG_PATH, self.log_name, self.log_level)
+                    today = PlatformTime.now().day
+        except KeyboardInterrupt:
+            logger.info("Interrupted by user — stopping all engines.")
+        self.stop()
+
+    def stop(self) -> None:
+        """Stop every engine after its current cycle and wait for each to shut down."""
+        self.stop_event.set()
+        for engine in self.engines.values():
+            engine.stop()
+        for thread in self._threads:
+            thread.join()
+        logger.info("Engine host stopped.")
+
+    def _run_engine(self, name: str, engine: BaseEngine) -> None:
+        try:
+            engine.run()
+        except Exception as error:
+            # One account's crash must not take the other stacks down with it.
+            logger.exception(f"Engine '{name}' crashed: {error}")
+            if self.notify_manager:
+                self.notify_manager.send_notification(
+                    f"{name}: engine crashed and stopped ({error}). The other accounts keep trading.",
+                    "Trader App Down",
+                    1,
+                )
+
+    def _refresh_news(self) -> None:
+        try:
+            self.news_manager.refresh()
+        except Exception as error:
+            logger.warning(f"Failed to refresh calendar: {error}")
@@ -1,36 +1,72 @@
 import logging
 import json
+from typing import Any, Dict
 
 from app.base.base_engine import BaseEngine
+from app.base.base_tester_trade import TesterTrade
 from app.common.services.platform_time import PlatformTime
-from app.common.config.paths import STATE_PATH, SUMMARY_PATH
-from app.common.config.constants import MODE_BACKTEST, TRADE_STATUS_CLOSED
+from app.common.services.backtest_checkpoint import BacktestCheckpoint
+from app.common.services.backtest_schedule import get_active_timestamps
+from app.common.services.backtest_signals import get_candidate_mask
+from app.common.config.paths import STATE_PATH, STATE_JOURNAL_PATH
+from app.common.config.constants import MODE_BACKTEST, TRADE_STATUS_CLOSED, SUMMARY_SAVE_INTERVAL_SECONDS
 
 logger = logging.getLogger(__name__)
 
 class EngineTester(BaseEngine):
-    def __init__(self, connector, account, strategies, state_manager, simulation_timestamps, summary_writer, connector_config, backtester_config, dashboard_manager, risk_manager, news_manager = None, notify_manager =  None):
-        super().__init__(connector, account, strategies, state_manager, connector_config, backtester_config, dashboard_manager, news_manager, risk_manager, summary_writer, notify_manager)
-        self.connector = connector
-        self.account=account
+    def __init__(
+        self,
+        connector,
+        account,
+        strategies,
+        state_manager,
+        simulation_timestamps,
+        summary_writer,
+        connector_config,
+        backtester_config,
+        dashboard_manager,
+        risk_manager,
+        news_manager=None,
+        notify_manager=None,
+    ):
+        super().__init__(
+            connector=connector,
+            account=account,
+            strategies=strategies,
+            state_manager=state_manager,
+            connector_config=connector_config,
+            dashboard_manager=dashboard_manager,
+            news_manager=news_manager,
+            vix_manager=None,
+            notify_manager=notify_manager,
+            risk_manager=risk_manager,
+        )
         self.simulation_timestamps = simulation_timestamps
         self.summary_writer = summary_writer
-        self.connector_config = connector_config
         self.backtester_config = backtester_config
-        self.news_manager = news_manager
-        self.risk_manager = risk_manager
-        self.notify_manager = notify_manager
 
         start_engine_timestamp = PlatformTime.timestamp()
         if self._update_and_check_profit_targets(start_engine_timestamp, 0) > 0:
             logger.info("Initial balances set.")
 
-    def run(self):
-        if STATE_PATH.exists():
-            STATE_PATH.write_text(json.dumps({}))
+    def run(self, resume: bool = False):
+        """Run the backtest over every simulation timestamp; with `resume`, continue from the last checkpoint."""
+        checkpoint = BacktestCheckpoint(self.summary_writer.checkpoint_path, self._get_run_key())
+        saved = checkpoint.load() if resume else None
 
-        if SUMMARY_PATH.exists():
-            SUMMARY_PATH.write_text(json.dumps({}))
+        # An in-memory state manager (sweep workers, BACKTEST_PERSIST=false)
+        # must leave the shared state files alone. A resumed run overwrites
+        # them from the checkpoint instead.
+        if saved is None:
+            if self.state_manager.persist_enabled:
+                if STATE_PATH.exists():
+                    STATE_PATH.write_text(json.dumps({}))
+
+                if STATE_JOURNAL_PATH.exists():
+                    STATE_JOURNAL_PATH.write_text("")
+
+            if self.summary_writer.file_path.exists():
+                self.summary_writer.file_path.write_text(json.dumps({}))
 
         if self.simulation_timestamps:
             PlatformTime.set_backtest_timestamp(self.simulation_timestamps[0])
@@ -39,18 +75,43 @@ class EngineTester(BaseEngine):
 
         last_balances_update = 0
         self.summary_writer.mark_wall_start()
-
-        for i, current_timestamp in enumerate(self.simulation_timestamps, start=1):
-            PlatformTime.set_backtest_timestamp(current_timestamp)
-
-            last_balances_update = self._update_and_check_profit_targets(current_timestamp, last_balances_update)
-
-            self._run_strategies()
+        last_summary_save = PlatformTime.local_now_utc_timestamp()
+        last_checkpoint = last_summary_save
+
+        timestamps = self.simulation_timestamps
+        if self.backtester_config.backtest_skip_inactive:
+            timestamps = get_active_timestamps(timestamps, self.strategies)
+
+        candidates = None
+        if self.backtester_config.backtest_signal_prefilter:
+            candidates = get_candidate_mask(timestamps, self.strategies)
+
+        start = 0
+        if saved is not None:
+            start = self._restore_checkpoint(saved)
+            last_balances_update = saved["last_balances_update"]
+            logger.info(f"Resuming backtest at timestamp {start} of {len(timestamps)}")
+
+        for i, current_timestamp in enumerate(timestamps[start:], start=start + 1):
+            # Between entry candidates with nothing open, a bar can neither
+            # open nor close a trade, so the full order path is skipped there.
+            # The periodic saves below still run on skipped bars.
+            if candidates is None or candidates[i - 1] or self.state_manager.has_open_trades():
+                PlatformTime.set_backtest_timestamp(current_timestamp)
+
+                with self.state_manager.batch():
+                    last_balances_update = self._update_and_check_profit_targets(
+                        current_timestamp, last_balances_update
+                    )
+                    self._run_strategies()
 
             if i % 720 == 0:
-                self.summary_writer.save()
+                last_summary_save = self._periodic_summary_save(last_summary_save)
+                last_checkpoint = self._periodic_checkpoint(checkpoint, i, last_balances_update, last_checkpoint)
                 if self.backtester_config.backtest_terminal_output:
-                    self.dashboard_manager.print_status_report(self.strategies, self.state_manager, MODE_BACKTEST, self.backtester_config, self.summary_writer)
+                    self.dashboard_manager.print_status_report(
+                        self.strategies, self.state_manager, MODE_BACKTEST, log_to_terminal=True
+                    )
 
         start_time = PlatformTime.from_timestamp(self.simulation_timestamps[0])
         end_time = PlatformTime.from_timestamp(self.simulation_timestamps[-1])
@@ -62,11 +123,73 @@ class EngineTester(BaseEngine):
         closed_tickets = self.state_manager.get_all_trades()
         closed_tickets = [t for t in closed_tickets if t.status == TRADE_STATUS_CLOSED and t.profit is not None]
         self.summary_writer.set_strategy_metrics(closed_tickets)
+        self.summary_writer.set_analytics(self.simulation_timestamps)
 
         self.summary_writer.mark_wall_end()
         self.summary_writer.save()
 
         self.shutdown()
+        checkpoint.clear()
         PlatformTime.clear_backtest_timestamp()
 
-
+    def _periodic_summary_save(self, last_summary_save: int) -> int:
+        """Rewrite the progress summary file if SUMMARY_SAVE_INTERVAL_SECONDS of wall time have passed."""
+        now = PlatformTime.local_now_utc_timestamp()
+        if now - last_summary_save < SUMMARY_SAVE_INTERVAL_SECONDS:
+            return last_summary_save
+        self.summary_writer.save()
+        return now
+
+    def _periodic_checkpoint(
+        self, checkpoint: BacktestCheckpoint, index: int, last_balances_update: int, last_checkpoint: int
+    ) -> int:
+        """Write a checkpoint after timestamp `index` if backtest_checkpoint_seconds of wall time have passed."""
+        interval = self.backtester_config.backtest_checkpoint_seconds
+        now = PlatformTime.local_now_utc_timestamp()
+        if interval <= 0 or now - last_checkpoint < interval:
+            return last_checkpoint
+
+        checkpoint.save({
+            "index": index,
+            "last_balances_update": last_balances_update,
+            "today": self.today,
+            "last_logged_event_ts": self.last_logged_event_ts,
+            "state": self.state_manager.get_checkpoint_state(),
+            "summary": self.summary_writer.get_checkpoint_state(),
+            "account": self.account.get_checkpoint_state(),
+            "risk": self.risk_manager.get_checkpoint_state() if self.risk_manager else None,
+            "strategies": [strategy.get_checkpoint_state() for strategy in self.strategies],
+            "trades": [
+                trader.get_checkpoint_state() if isinstance(trader, TesterTrade) else None
+                for trader in self._get_traders()
+            ],
+        })
+        return now
+
+    def _restore_checkpoint(self, saved: Dict[str, Any]) -> int:
+        """Put every component back to the checkpointed state and return the timestamp index to continue from."""
+        self.today = saved["today"]
+        self.last_logged_event_ts = saved["last_logged_event_ts"]
+        self.state_manager.restore_checkpoint_state(saved["state"])
+        self.summary_writer.restore_checkpoint_state(saved["summary"])
+        self.account.restore_checkpoint_state(saved["account"])
+        if self.risk_manager and saved["risk"] is not None:
+            self.risk_manager.restore_checkpoint_state(saved["risk"])
+        for strategy, state in zip(self.strategies, saved["strategies"]):
+            if state is not None:
+                strategy.restore_checkpoint_state(state)
+        for trader, state in zip(self._get_traders(), saved["trades"]):
+            if state is not None and isinstance(trader, TesterTrade):
+                trader.restore_checkpoint_state(state)
+        return saved["index"]
+
+    def _get_run_key(self) -> Dict[str, Any]:
+        timestamps = self.simulation_timestamps
+        return {
+            "first_timestamp": int(timestamps[0]) if len(timestamps) else None,
+            "last_timestamp": int(timestamps[-1]) if len(timestamps) else None,
+            "timestamps": len(timestamps),
+            "strategies": [strategy.strategy_name for strategy in self.strategies],
+            "skip_inactive": self.backtester_config.backtest_skip_inactive,
+            "result_format": self.backtester_config.backtest_result_format,
+        }
@@ -16,6 +16,8 @@ from app.common.config.loaders.loader_connector_config import load_connector_con
 from app.common.config.loaders.loader_notify_config import load_notify_config
 from app.common.config.loaders.loader_log_config import load_log_level
 from app.common.config.loaders.loader_database_config import load_database_config
+from app.common.config.loaders.loader_state_config import load_state_config
+from app.common.config.loaders.loader_engine_config import load_engine_config
 from app.factories.factory_platform import (
     get_connector,
     get_account,
@@ -46,6 +48,8 @@ if __name__ == "__main__":
 
     notify_config = load_notify_config()
     database_config = load_database_config()
+    state_config = load_state_config()
+    engine_config = load_engine_config()
     log_level = load_log_level()
 
     platform_name = (connector_config.type or "").lower()
@@ -61,7 +65,7 @@ if __name__ == "__main__":
 
     account = get_account(platform_name)
     symbol = get_symbol(platform_name)
-    state_manager = get_state_manager(account)
+    state_manager = get_state_manager(account, state_config)
     dashboard = get_dashboard_manager()
     news_manager = get_news_manager(window_minutes=30)
     risk_manager = get_risk_manager()
@@ -116,6 +120,7 @@ if __name__ == "__main__":
         notify_manager=notify_manager,
         sync_manager=sync_manager,
         deal_archive_manager=deal_archive_manager,
+        evaluation_workers=engine_config.evaluation_workers,
     )
 
     try:
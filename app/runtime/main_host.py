@@ -0,0 +1,187 @@
+"""Engine host entry point — wires up one live account stack per configured account and runs them in one process."""
+
+import logging
+import sys
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.common.config.constants import ENVIRONMENT_PRODUCTION
+from app.common.config.paths import LOG_PATH, LOCK_FILE_PATH, DATA_DIR, ACCOUNT_STATE_PATH, DASHBOARD_PATH
+from app.common.models.model_engine import EngineConfig, HostAccountConfig
+from app.common.models.model_state import StateConfig
+from app.common.services.logger import setup_logger
+from app.common.services.lock import is_already_running, release_lock
+from app.common.services.news_manager import NewsManager
+from app.common.services.platform_time import PlatformTime
+from app.common.services.pushover_manager import PushoverManager
+from app.common.services.signal_feed_reader import SignalFeedReader
+from app.common.services.vix_manager import VixManager
+from app.common.config.loaders.loader_engine_host_config import load_engine_host_config
+from app.common.config.loaders.loader_notify_config import load_notify_config
+from app.common.config.loaders.loader_log_config import load_log_level
+from app.common.config.loaders.loader_database_config import load_database_config
+from app.common.config.loaders.loader_state_config import load_state_config
+from app.common.config.loaders.loader_engine_config import load_engine_config
+from app.factories.factory_platform import (
+    get_connector,
+    get_account,
+    get_trade,
+    get_symbol,
+)
+from app.factories.factory_calculator import get_calculator
+from app.factories.factory_strategy import get_strategies
+from app.factories.factory_state_manager import get_state_manager
+from app.factories.factory_dashboard_manager import get_dashboard_manager
+from app.factories.factory_news_manager import get_news_manager
+from app.factories.factory_risk_manager import get_risk_manager
+from app.factories.factory_vix_manager import get_vix_manager
+from app.factories.factory_notify_manager import get_notify_manager
+from app.factories.factory_sync_manager import get_sync_manager
+from app.factories.factory_deal_archive_manager import get_deal_archive_manager
+from app.runtime.engine import Engine
+from app.runtime.engine_host import EngineHost
+
+logger = logging.getLogger(__name__)
+
+HOST_LOG_NAME = "host"
+
+
+def build_engine(
+    account_config: HostAccountConfig,
+    state_config: StateConfig,
+    engine_config: EngineConfig,
+    database_filename: str,
+    news_manager: NewsManager,
+    vix_manager: VixManager,
+    notify_manager: PushoverManager,
+    signal_feed_reader: SignalFeedReader,
+) -> Engine:
+    """Build one account's connector, state, risk and strategies around the host's shared services."""
+    connector_config = account_config.connector_config
+    platform_name = (connector_config.type or "").lower()
+    state_dir = ACCOUNT_STATE_PATH / account_config.name
+
+    account = get_account(platform_name)
+    symbol = get_symbol(platform_name)
+    state_manager = get_state_manager(account, state_config, state_dir)
+    risk_manager = get_risk_manager(account_config.account_risk_path)
+    calculator = get_calculator(symbol, account)
+    trade = get_trade(platform_name, symbol, calculator)
+    sync_manager = get_sync_manager(state_manager, notify_manager)
+    deal_archive_manager = get_deal_archive_manager(
+        db_path=DATA_DIR / database_filename,
+        platform=platform_name,
+        account_id=str(connector_config.account_id or connector_config.login or "unknown"),
+    )
+
+    connector = get_connector(platform_name, connector_config, state_manager)
+    if not connector.connect():
+        raise RuntimeError(f"Account '{account_config.name}': failed to connect to {platform_name}.")
+    logger.info(f"Account '{account_config.name}' connected: {platform_name}, server {connector_config.server}")
+
+    strategies = get_strategies(
+        connector=connector,
+        account=account,
+        symbol=symbol,
+        trader=trade,
+        calculator=calculator,
+        state_manager=state_manager,
+        news_manager=news_manager,
+        risk_manager=risk_manager,
+        vix_manager=vix_manager,
+        notify_manager=notify_manager,
+        signal_feed_reader=signal_feed_reader,
+        profile=account_config.strategy_profile,
+    )
+
+    dashboard_path = DASHBOARD_PATH.with_name(f"{account_config.name}_status_dashboard.html")
+    return Engine(
+        connector=connector,
+        account=account,
+        strategies=strategies,
+        state_manager=state_manager,
+        connector_config=connector_config,
+        dashboard_manager=get_dashboard_manager(str(dashboard_path)),
+        news_manager=news_manager,
+        vix_manager=vix_manager,
+        risk_manager=risk_manager,
+        notify_manager=notify_manager,
+        sync_manager=sync_manager,
+        deal_archive_manager=deal_archive_manager,
+        heartbeat_path=state_dir / "heartbeat.json",
+        hosted=True,
+        evaluation_workers=engine_config.evaluation_workers,
+    )
+
+
+if __name__ == "__main__":
+
+    host_config = load_engine_host_config()
+    environments = {account.connector_config.environment for account in host_config.accounts}
+    environment = ENVIRONMENT_PRODUCTION if ENVIRONMENT_PRODUCTION in environments else environments.pop()
+
+    if is_already_running(LOCK_FILE_PATH, environment):
+        sys.exit(1)
+
+    notify_config = load_notify_config()
+    database_config = load_database_config()
+    state_config = load_state_config()
+    engine_config = load_engine_config()
+    log_level = load_log_level()
+
+    setup_logger(LOG_PATH, HOST_LOG_NAME, log_level)
+    logger.info(f"Engine host: {', '.join(account.name for account in host_config.accounts)}")
+
+    # The loader checked that every account is configured with one platform
+    # clock; hosted engines never move it, whatever offset their broker reports.
+    first_connector_config = host_config.accounts[0].connector_config
+    PlatformTime.set_timezone(first_connector_config.timezone or "UTC")
+    PlatformTime.set_offset(first_connector_config.offset or 0)
+
+    # One of each for the whole process, however many accounts are hosted.
+    news_manager = get_news_manager(window_minutes=30)
+    vix_manager = get_vix_manager()
+    notify_manager = get_notify_manager(notify_config)
+    signal_feed_reader = SignalFeedReader()
+
+    engines = {}
+    for account_config in host_config.accounts:
+        try:
+            engines[account_config.name] = build_engine(
+                account_config,
+                state_config,
+                engine_config,
+                database_config.filename,
+                news_manager,
+                vix_manager,
+                notify_manager,
+                signal_feed_reader,
+            )
+        except Exception as e:
+            # A broker that is down at startup shouldn't keep the other accounts from trading.
+            logger.exception(f"Failed to start account '{account_config.name}': {e}")
+            notify_manager.send_notification(
+                f"{account_config.name}: failed to start ({e}). The other accounts keep trading.",
+                "Trader App Down",
+                1,
+            )
+
+    if not engines:
+        logger.error("No account stack could be started.")
+        release_lock(LOCK_FILE_PATH)
+        sys.exit(1)
+
+    host = EngineHost(engines, news_manager, vix_manager, notify_manager, HOST_LOG_NAME, log_level)
+    try:
+        host.run()
+    except Exception as e:
+        logger.exception(f"Fatal error: {e}")
+        notify_manager.send_notification(
+            f"Engine host crashed and stopped ({e}). No trading is happening until it's restarted.",
+            "Trader App Down",
+            1,
+        )
+    finally:
+        release_lock(LOCK_FILE_PATH)
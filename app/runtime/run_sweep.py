@@ -0,0 +1,155 @@
+"""Backtest parameter sweep entry point — runs one isolated EngineTester per parameter combination."""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.common.config.paths import STATE_PATH, LOG_PATH, DATA_PATH, BAR_CACHE_PATH, SWEEP_PATH
+from app.common.config.loaders.loader_connector_config import load_connector_config
+from app.common.config.loaders.loader_backtest_config import load_backtest_config
+from app.common.config.loaders.loader_sweep_config import load_sweep_config
+from app.common.config.loaders.loader_timestamp import load_tester_setup
+from app.common.models.model_backtest import BacktestConfig
+from app.common.models.model_connector import ConnectorConfig
+from app.common.models.model_sweep import SweepParameter, BacktestWindow
+from app.common.services.logger import setup_logger
+from app.common.services.platform_time import PlatformTime
+from app.common.services.state_manager import StateManager
+from app.common.services.backtest_summary import BacktestSummary
+from app.common.services.sweep_runner import SweepRunner, apply_asset_overrides, format_parameter
+from app.connectors.mt5tester.mt5tester_account import Mt5testerAccount
+from app.connectors.mt5tester.mt5tester_bar_cache import BarCache
+from app.connectors.mt5tester.mt5tester_connector import Mt5testerConnector
+from app.connectors.mt5tester.mt5tester_symbol import Mt5testerSymbol
+from app.connectors.mt5tester.mt5tester_trade import Mt5testerTrade
+from app.factories.factory_calculator import get_calculator
+from app.factories.factory_dashboard_manager import get_dashboard_manager
+from app.factories.factory_news_manager import get_news_manager
+from app.factories.factory_risk_manager import get_risk_manager
+from app.factories.factory_strategy import get_strategies
+from app.runtime.enginetester import EngineTester
+
+logger = logging.getLogger(__name__)
+
+
+def build_engine_tester(
+    connector_config: ConnectorConfig,
+    backtester_config: BacktestConfig,
+    summary_writer: BacktestSummary,
+    result_file_path: Optional[Path] = None,
+    overrides: Optional[Dict[SweepParameter, Any]] = None,
+) -> EngineTester:
+    """Wire the Mt5tester stack for the configured backtest dates, with `overrides` applied to its strategies."""
+    PlatformTime.set_timezone(connector_config.timezone or "UTC")
+
+    account = Mt5testerAccount(backtester_config)
+    symbol = Mt5testerSymbol(backtester_config, account)
+    state_manager = StateManager(STATE_PATH, account, persist_enabled=bool(backtester_config.backtest_persist))
+    calculator = get_calculator(symbol, account)
+    trade = Mt5testerTrade(symbol, calculator, summary_writer, result_file_path=result_file_path)
+    risk_manager = get_risk_manager()
+    # Never refreshed here: the calendar stays empty, so no news window blocks a backtest trade.
+    news_manager = get_news_manager()
+
+    connector = Mt5testerConnector(connector_config)
+    if not connector.connect():
+        raise RuntimeError("Platform connection failed.")
+
+    strategies = get_strategies(
+        connector=connector,
+        account=account,
+        symbol=symbol,
+        trader=trade,
+        calculator=calculator,
+        state_manager=state_manager,
+        news_manager=news_manager,
+        risk_manager=risk_manager,
+        vix_manager=None,
+        notify_manager=None,
+    )
+    if overrides:
+        applied = apply_asset_overrides(strategies, overrides)
+        logger.info(
+            f"Applied {applied} override(s) "
+            f"{ {format_parameter(p): v for p, v in overrides.items()} }"
+        )
+
+    _, timestamps = load_tester_setup(backtester_config.backtest_date_from, backtester_config.backtest_date_to)
+    return EngineTester(
+        connector=connector,
+        account=account,
+        strategies=strategies,
+        state_manager=state_manager,
+        simulation_timestamps=timestamps.values,
+        summary_writer=summary_writer,
+        connector_config=connector_config,
+        backtester_config=backtester_config,
+        dashboard_manager=get_dashboard_manager(),
+        risk_manager=risk_manager,
+        news_manager=news_manager,
+    )
+
+
+def run_single_backtest(
+    run_id: int,
+    overrides: Dict[SweepParameter, Any],
+    run_dir: Path,
+    window: Optional[BacktestWindow] = None,
+) -> Dict[str, Any]:
+    """Build an isolated backtest stack, apply the overrides, run it over `window` if given, and return its summary."""
+    connector_config = load_connector_config()
+    backtester_config = load_backtest_config()
+    if window is not None:
+        # The symbol loads bars for (and the summary reports) the configured
+        # dates, so the window replaces them before anything is built.
+        backtester_config.backtest_date_from = window.date_from
+        backtester_config.backtest_date_to = window.date_to
+    # Each worker keeps its state in memory and writes only under its own
+    # run_dir, so concurrent runs never touch each other's files.
+    backtester_config.backtest_persist = False
+    backtester_config.backtest_terminal_output = False
+    run_dir.mkdir(parents=True, exist_ok=True)
+
+    summary_writer = BacktestSummary(backtester_config, file_path=run_dir / "summary.json")
+    tester = build_engine_tester(
+        connector_config,
+        backtester_config,
+        summary_writer,
+        result_file_path=run_dir / "results.csv",
+        overrides=overrides,
+    )
+    logger.info(
+        f"Sweep run {run_id}: {backtester_config.backtest_date_from} → {backtester_config.backtest_date_to}"
+    )
+    tester.run()
+    return dict(summary_writer.summary)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python app/runtime/run_sweep.py <sweep.yaml>")
+        sys.exit(2)
+
+    connector_config = load_connector_config()
+    backtester_config = load_backtest_config()
+    sweep_config = load_sweep_config(Path(sys.argv[1]))
+    setup_logger(LOG_PATH, connector_config.environment)
+
+    # Build or refresh the bar cache once here; the workers then only
+    # memory-map it instead of racing each other to parse the same CSVs.
+    timeframe = backtester_config.backtest_timeframe.upper()
+    warmed = BarCache(BAR_CACHE_PATH).warm(DATA_PATH, timeframe)
+    logger.info(f"Bar cache ready for {warmed} symbol(s) ({timeframe})")
+
+    results_dir = SWEEP_PATH / PlatformTime.local_now().strftime("%Y%m%d_%H%M%S")
+    ranked = SweepRunner(sweep_config, run_single_backtest, results_dir).run()
+
+    for result in ranked[:10]:
+        overrides = ", ".join(f"{format_parameter(p)}={v}" for p, v in result.overrides.items())
+        outcome = result.error or f"total_profit={result.summary.get('total_profit')}"
+        print(f"#{result.run_id}: {outcome} | {overrides}")
@@ -0,0 +1,50 @@
+"""Walk-forward optimization entry point — re-optimizes a sweep per rolling window and tests each winner after it."""
+
+import logging
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.common.config.paths import LOG_PATH, DATA_PATH, BAR_CACHE_PATH, WALK_FORWARD_PATH
+from app.common.config.loaders.loader_connector_config import load_connector_config
+from app.common.config.loaders.loader_backtest_config import load_backtest_config
+from app.common.config.loaders.loader_sweep_config import load_walk_forward_config
+from app.common.services.logger import setup_logger
+from app.common.services.platform_time import PlatformTime
+from app.common.services.walk_forward_runner import WalkForwardRunner
+from app.connectors.mt5tester.mt5tester_bar_cache import BarCache
+from app.runtime.run_sweep import run_single_backtest
+
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python app/runtime/run_walk_forward.py <walk_forward.yaml>")
+        sys.exit(2)
+
+    connector_config = load_connector_config()
+    backtester_config = load_backtest_config()
+    walk_forward_config = load_walk_forward_config(Path(sys.argv[1]))
+    setup_logger(LOG_PATH, connector_config.environment)
+
+    # One bar cache for every window: built here once, then memory-mapped
+    # by each worker, which only slices out its window's bars.
+    timeframe = backtester_config.backtest_timeframe.upper()
+    warmed = BarCache(BAR_CACHE_PATH).warm(DATA_PATH, timeframe)
+    logger.info(f"Bar cache ready for {warmed} symbol(s) ({timeframe})")
+
+    results_dir = WALK_FORWARD_PATH / PlatformTime.local_now().strftime("%Y%m%d_%H%M%S")
+    windows = WalkForwardRunner(walk_forward_config, run_single_backtest, results_dir).run(
+        backtester_config.backtest_date_from, backtester_config.backtest_date_to
+    )
+
+    for window in windows:
+        outcome = window.error or f"out-of-sample total_profit={window.out_of_sample_summary.get('total_profit')}"
+        print(
+            f"Window {window.number}: {window.out_of_sample.date_from}→{window.out_of_sample.date_to} {outcome}"
+        )
+    print(f"Report: {results_dir / 'walk_forward.csv'}")
@@ -1,86 +1,36 @@
+"""Profiled backtest entry point — runs one EngineTester under cProfile; --resume continues from a checkpoint."""
+
 import cProfile
 import pstats
 import logging
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
 
 from app.common.config.paths import STATE_PATH, LOG_PATH
-from app.common.config.constants import MODE_BACKTEST
-from app.common.services.state_manager import StateManager
 from app.common.services.logger import setup_logger
 from app.common.config.loaders.loader_connector_config import load_connector_config
 from app.common.config.loaders.loader_backtest_config import load_backtest_config
-from app.factories.factory_platform import (
-    get_connector,
-    get_account,
-    get_trade,
-    get_symbol,
-)
-from app.factories.factory_strategy import strategy_registry
-from app.runtime.engine import Engine
-from app.runtime.enginetester import EngineTester
-from app.common.config.loaders.loader_timestamp import load_tester_setup
-from app.common.services.backtest_summary import BacktestSummary
-from app.common.services.platform_time import PlatformTime
+from app.factories.factory_backtest_summary import get_backtest_summary
+from app.runtime.run_sweep import build_engine_tester
 
 logger = logging.getLogger(__name__)
 
+
 def profiled_main():
     connector_config = load_connector_config()
     backtester_config = load_backtest_config()
 
-    setup_logger(LOG_PATH, connector_config.mode)
+    setup_logger(LOG_PATH, connector_config.environment)
     logger.info(f"Using state file: {STATE_PATH}")
 
-    PlatformTime.set_timezone(connector_config.timezone or "UTC")
-    PlatformTime.set_mode(connector_config.mode)
-
-    platform_name = (connector_config.type or "").lower()
-    is_backtest = connector_config.mode == MODE_BACKTEST
-    persist_enabled = bool(backtester_config.backtest_persist) if is_backtest else True
-
-    account = get_account(platform_name, backtester_config)
-    state_manager = StateManager(STATE_PATH, account, persist_enabled)
-    summary_writer = BacktestSummary(backtester_config)
-
-    connector = get_connector(platform_name, connector_config)
-    if not connector.connect():
-        logger.error("Failed to connect to trading platform.")
-        raise RuntimeError("Platform connection failed.")
-
-    symbol = get_symbol(platform_name, backtester_config, account)
-    calculator = get_calculator(platform_name, symbol, account, backtester_config)
-    trade = get_trade(platform_name, symbol, calculator, summary_writer)
-
-    strategies = strategy_registry(
-        connector=connector,
-        account=account,
-        symbol=symbol,
-        trader=trade,
-        calculator=calculator,
-        state_manager=state_manager,
-    )
+    summary_writer = get_backtest_summary(backtester_config)
+    app = build_engine_tester(connector_config, backtester_config, summary_writer)
 
-    if is_backtest:
-        test_period, timestamps = load_tester_setup()
-        app = EngineTester(
-            strategies=strategies,
-            state_manager=state_manager,
-            simulation_timestamps=timestamps.values,
-            summary_writer=summary_writer,
-            connector_config=connector_config,
-            backtester_config=backtester_config,
-        )
-    else:
-        app = Engine(
-            strategies=strategies,
-            state_manager=state_manager,
-            connector_config=connector_config,
-            backtester_config=backtester_config,
-        )
+    # --resume continues an interrupted backtest from its last checkpoint
+    app.run(resume="--resume" in sys.argv)
 
-    app.run()
 
 if __name__ == "__main__":
     try:
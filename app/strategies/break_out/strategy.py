@@ -1,9 +1,12 @@
 """Breakout strategy: enters trades when price breaks out of a defined opening range."""
 
 import logging
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
 
 from app.base.base_strategy import Strategy
+from app.common.services.backtest_signals import get_breakout_candidates
 from app.common.models.model_strategy import StrategyConfig, AssetConfig
 from app.common.models.model_trade import TradeRecord
 from app.common.models.model_symbol import Range
@@ -91,6 +94,16 @@ class BreakOutStrategy(Strategy):
                     f"[{self.strategy_name}] Failed to get open price for {symbol}: {e}"
                 )
 
+    def get_checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        return {
+            "range_by_symbol": self.range_by_symbol,
+            "open_price_by_symbol": self.open_price_by_symbol,
+        }
+
+    def restore_checkpoint_state(self, state: Dict[str, Any]) -> None:
+        self.range_by_symbol = state["range_by_symbol"]
+        self.open_price_by_symbol = state["open_price_by_symbol"]
+
     def is_entry_signal(self, asset: AssetConfig) -> Optional[str]:
         if self.state_manager.get_target_reached():
             return None
@@ -122,6 +135,12 @@ class BreakOutStrategy(Strategy):
             return TRADE_DIRECTION_SELL
         return None
 
+    def get_entry_candidates(self, bar_epochs: np.ndarray, get_bars: Callable) -> Optional[np.ndarray]:
+        mask = np.zeros(len(bar_epochs), dtype=bool)
+        for asset in self.assets:
+            mask |= get_breakout_candidates(bar_epochs, get_bars(asset.symbol), asset)
+        return mask
+
     def is_exit_signal(self, trade: TradeRecord, asset_config: AssetConfig) -> bool:
         if self.state_manager.get_target_reached():
             return True
@@ -2,9 +2,12 @@
 
 import logging
 
-from typing import Optional
+from typing import Callable, Optional
+
+import numpy as np
 
 from app.base.base_strategy import Strategy
+from app.common.services.backtest_signals import get_after_open_candidates
 
 from app.common.services.platform_time import PlatformTime
 from app.common.models.model_strategy import StrategyConfig, AssetConfig
@@ -42,6 +45,12 @@ class GoLongStrategy(Strategy):
             return TRADE_DIRECTION_BUY
         return None
 
+    def get_entry_candidates(self, bar_epochs: np.ndarray, get_bars: Callable) -> Optional[np.ndarray]:
+        mask = np.zeros(len(bar_epochs), dtype=bool)
+        for asset in self.assets:
+            mask |= get_after_open_candidates(bar_epochs, asset)
+        return mask
+
     def is_exit_signal(self, trade: TradeRecord, asset_config: AssetConfig) -> bool:
         if self.state_manager.get_target_reached():
             return True
@@ -1,6 +1,5 @@
 """SMA crossover strategy driven by live quote/price data."""
 
-import json
 import logging
 import numpy
 from pathlib import Path
@@ -150,21 +149,17 @@ class QuotesCrossStrategy(Strategy):
 
     def _load_signals(self) -> None:
         try:
-            signal_feed_path = Path(self.config.signal_feed)
-            if not signal_feed_path.exists():
+            file_modified_time, signal_payload = self.signal_feed_reader.read(Path(self.config.signal_feed))
+            if file_modified_time is None:
                 self.signals = {}
                 return
 
-            file_modified_time = signal_feed_path.stat().st_mtime
             if self.last_load and file_modified_time == self.last_load:
                 return
 
-            with open(signal_feed_path, "r", encoding="utf-8") as f:
-                raw_data = f.read()
-                if not raw_data.strip():
-                    self.signals = {}
-                    return
-                signal_payload = json.loads(raw_data)
+            if signal_payload is None:
+                self.signals = {}
+                return
 
             file_timestamp_str = signal_payload.get("timestamp")
             if not file_timestamp_str: